@@ -3,16 +3,32 @@
 Sistema completo de extração, processamento e exportação de materiais de inglês
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Extractor B1 Team"
 __description__ = "Sistema de extração e processamento de materiais Cambridge para plataforma de inglês"
 
-from .scripts.extractor import DocumentExtractor
-from .scripts.processor import DataProcessor
-from .scripts.validator import DataValidator
-from .scripts.exporter import DataExporter
-from .utils.config import Config
-from .utils.logger import setup_logger
+# Módulos carregados sob demanda: importar o pacote não carrega Docling nem as etapas
+_lazy_exports = {
+    "DocumentExtractor": ".scripts.extractor",
+    "DataProcessor": ".scripts.processor",
+    "DataValidator": ".scripts.validator",
+    "DataExporter": ".scripts.exporter",
+    "Config": ".utils.config",
+    "setup_logger": ".utils.logger",
+}
+
+def __getattr__(name):
+    if name in _lazy_exports:
+        module = importlib.import_module(_lazy_exports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_exports))
 
 __all__ = [
     "DocumentExtractor",
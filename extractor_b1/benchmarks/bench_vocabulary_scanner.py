@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+⏱️ MICRO-BENCHMARK DO SCANNER DE VOCABULÁRIO
+Compara DataProcessor.extract_vocabulary com a implementação anterior (três novas
+buscas no parágrafo e uma classificação de categoria para cada palavra, padrões não
+compilados) em uma lista de vocabulário B1 com 3.000 entradas, verificando que a
+saída é idêntica.
+
+Referência (1 CPU, 12 entradas por parágrafo): ~114 ms -> ~78 ms, cerca de 1,5x. O
+scanner calcula os campos do parágrafo uma vez e classifica todas as definições em
+uma passada (KeywordMatcher.first_in_spans); boa parte do tempo restante é a
+montagem dos registros, igual nas duas implementações.
+
+Uso (a partir da pasta extractor_b1):
+    python benchmarks/bench_vocabulary_scanner.py
+    python benchmarks/bench_vocabulary_scanner.py --file materials/B1/vocabulary_list.txt --runs 10
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from loguru import logger
+
+from scripts.document_model import CompactContent
+from scripts.processor import DataProcessor
+from utils.config import Config
+
+POS = ["noun", "verb", "adjective", "adverb", "preposition"]
+TOPICS = ["family", "food", "work", "weather", "train", "home", "travel", "money", "health", "sport"]
+
+def synthetic_vocabulary_list(entries: int, per_paragraph: int, seed: int = 42) -> str:
+    """Lista no formato das listas de vocabulário B1: palavra – definição /fonética/ (classe) "exemplo" """
+    rng = random.Random(seed)
+    lines = []
+    for i in range(entries):
+        word = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) + str(i)
+        topic = rng.choice(TOPICS)
+        line = f"{word} – something related to {topic} that people use every day /ˈ{word[:4]}/ ({rng.choice(POS)})"
+        if rng.random() < 0.7:
+            line += f' "We talked about the {word} at {topic} yesterday."'
+        lines.append(line)
+    
+    paragraphs = ["\n".join(lines[i:i + per_paragraph]) for i in range(0, len(lines), per_paragraph)]
+    return "\n\n".join(paragraphs)
+
+def legacy_extract_vocabulary(processor: DataProcessor, document_data):
+    """Implementação anterior de extract_vocabulary (referência de saída e de tempo)"""
+    patterns = processor.vocabulary_patterns
+    
+    def extract_examples(text):
+        examples = re.findall(patterns['example_sentence'], text)
+        return [ex.strip() for ex in examples if len(ex.strip()) > 10]
+    
+    def extract_phonetic(text):
+        phonetic = re.search(patterns['phonetic'], text)
+        return phonetic.group(1) if phonetic else ""
+    
+    def extract_part_of_speech(text):
+        pos = re.search(patterns['part_of_speech'], text)
+        return pos.group(1) if pos else "unknown"
+    
+    vocabulary = {}
+    content = document_data.get('content', {})
+    for paragraph in content.get('paragraphs', []):
+        matches = re.findall(patterns['word_definition'], paragraph)
+        for word, definition in matches:
+            if len(word) > 2:
+                vocabulary[word.lower()] = {
+                    "word": word.strip(),
+                    "definition_en": definition.strip(),
+                    "definition_pt": "",
+                    "level": processor.level,
+                    "category": processor.identify_vocabulary_category(word, definition),
+                    "examples": extract_examples(paragraph),
+                    "phonetic": extract_phonetic(paragraph),
+                    "part_of_speech": extract_part_of_speech(paragraph),
+                    "is_phrasal_verb": ' ' in word,
+                    "source_document": document_data.get('filename', ''),
+                    "context": paragraph[:200] + "..." if len(paragraph) > 200 else paragraph
+                }
+    
+    for table in document_data.get('tables', []):
+        vocabulary.update(processor.process_vocabulary_table(table))
+    
+    return vocabulary
+
+def measure(function, runs: int) -> float:
+    """Mediana do tempo (ms) de uma função"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark do scanner de vocabulário")
+    parser.add_argument("--file", type=Path, help="Lista de vocabulário em texto (padrão: lista sintética)")
+    parser.add_argument("--entries", type=int, default=3000, help="Entradas da lista sintética")
+    parser.add_argument("--per-paragraph", type=int, default=12, help="Entradas por parágrafo da lista sintética")
+    parser.add_argument("--runs", type=int, default=5, help="Execuções de cada implementação")
+    args = parser.parse_args()
+    
+    logger.remove()
+    
+    text = args.file.read_text(encoding='utf-8') if args.file else synthetic_vocabulary_list(args.entries, args.per_paragraph)
+    document_data = {
+        "filename": args.file.name if args.file else "B1_vocabulary_list.txt",
+        "content": CompactContent.from_pages(text.split('\f')),
+        "tables": []
+    }
+    
+    processor = DataProcessor(Config(str(PROJECT_ROOT / "config" / "settings.yaml")), "B1")
+    
+    expected = legacy_extract_vocabulary(processor, document_data)
+    result = processor.extract_vocabulary(document_data)
+    if result != expected:
+        print("❌ Saída diferente da implementação anterior")
+        return 1
+    print(f"✅ Saída idêntica: {len(result)} palavras em {len(document_data['content']['paragraphs'])} parágrafos")
+    
+    legacy_ms = measure(lambda: legacy_extract_vocabulary(processor, document_data), args.runs)
+    scanner_ms = measure(lambda: processor.extract_vocabulary(document_data), args.runs)
+    
+    print(f"Anterior: {legacy_ms:8.1f} ms")
+    print(f"Scanner:  {scanner_ms:8.1f} ms")
+    print(f"Ganho:    {legacy_ms / scanner_ms:8.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
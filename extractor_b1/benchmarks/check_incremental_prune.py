@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+🧹 VERIFICAÇÃO - --incremental --prune-cache PRESERVA O CACHE
+Executa o pipeline completo e depois duas vezes com --incremental --prune-cache sobre
+os mesmos materiais: documentos inalterados (reaproveitados da extração anterior)
+continuam usando suas entradas no cache de extração, que não podem ser podadas.
+
+Uso (a partir da pasta extractor_b1; precisa de materiais convertidos pelo Docling):
+    python benchmarks/check_incremental_prune.py
+    python benchmarks/check_incremental_prune.py --level B1 --materials materials/B1
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def run_pipeline(workspace: Path, level: str, config_file: Path, *flags: str):
+    """Executa o main.py no workspace (saídas e cache relativos a ele)"""
+    command = [sys.executable, str(PROJECT_ROOT / "main.py"), "--level", level, "--config", str(config_file),
+               "--export", "none", *flags]
+    subprocess.run(command, cwd=workspace, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+def cache_entries(workspace: Path) -> int:
+    return len(list((workspace / "output" / "cache" / "extraction").glob("*.json")))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verifica que --incremental --prune-cache mantém o cache dos inalterados")
+    parser.add_argument("--level", default="B1", help="Nível dos materiais")
+    parser.add_argument("--materials", type=Path, default=None, help="Pasta de materiais (padrão: materials/<nível>)")
+    parser.add_argument("--config", type=Path, default=PROJECT_ROOT / "config" / "settings.yaml", help="Arquivo de configuração")
+    args = parser.parse_args()
+    
+    materials = (args.materials or PROJECT_ROOT / "materials" / args.level).resolve()
+    if not materials.is_dir():
+        print(f"❌ Pasta de materiais não encontrada: {materials}")
+        return 1
+    
+    with tempfile.TemporaryDirectory(prefix="prune_check_") as tmp:
+        workspace = Path(tmp)
+        shutil.copytree(materials, workspace / "materials" / args.level)
+        config_file = args.config.resolve()
+        
+        run_pipeline(workspace, args.level, config_file)
+        expected = cache_entries(workspace)
+        print(f"Execução completa: {expected} entradas no cache de extração")
+        if not expected:
+            print("❌ Nenhum documento passou pelo Docling; use materiais em PDF")
+            return 1
+        
+        for run in (1, 2):
+            run_pipeline(workspace, args.level, config_file, "--incremental", "--prune-cache")
+            entries = cache_entries(workspace)
+            status = "✅" if entries == expected else "❌"
+            print(f"{status} --incremental --prune-cache #{run}: {entries} entradas (esperado {expected})")
+            if entries != expected:
+                return 1
+    
+    print("✅ Cache preservado")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
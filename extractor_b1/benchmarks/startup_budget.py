@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+⏱️ ORÇAMENTO DE TEMPO DE INICIALIZAÇÃO
+Mede o tempo dos comandos que não extraem documentos (incluindo os caminhos reais do
+CLI com --from-processed) e garante que nenhum deles carrega o Docling.
+
+Uso (a partir da pasta extractor_b1):
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --budget-ms 600 --runs 10
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LEVEL = "B1"
+
+# Comando -> argumentos; nenhum deles deve importar o Docling
+COMMANDS = {
+    "help": [sys.executable, "main.py", "--help"],
+    "import_package": [sys.executable, "-c", "import sys; sys.path.insert(0, '..'); import extractor_b1"],
+    "import_extractor": [sys.executable, "-c", "import scripts.extractor"],
+    "import_processor": [sys.executable, "-c", "import scripts.processor"],
+    "import_validator": [sys.executable, "-c", "import scripts.validator"],
+}
+
+# Caminhos do CLI sobre dados já processados (rodam em um workspace temporário)
+CLI_COMMANDS = {
+    "from_processed_validate": ["--from-processed", "--validate", "--export", "none"],
+    "from_processed_json": ["--from-processed", "--export", "json"],
+}
+
+DOCLING_CHECK = (
+    "import sys, importlib; "
+    "[importlib.import_module(m) for m in ('scripts.extractor', 'scripts.processor', 'scripts.validator')]; "
+    "sys.exit(1 if any(m == 'docling' or m.startswith('docling.') for m in sys.modules) else 0)"
+)
+
+# Executa o main.py no mesmo processo e sai com 3 se o Docling foi carregado
+CLI_DOCLING_CHECK = """
+import runpy, sys
+main_file = sys.argv.pop(1)
+sys.path.insert(0, str(__import__('pathlib').Path(main_file).parent))
+sys.argv[0] = main_file
+try:
+    runpy.run_path(main_file, run_name='__main__')
+except SystemExit as e:
+    if e.code:
+        raise
+sys.exit(3 if any(m == 'docling' or m.startswith('docling.') for m in sys.modules) else 0)
+"""
+
+# Dados processados mínimos (padrão de --processed): mede a inicialização, não o volume
+SAMPLE_DATA = {
+    "vocabulary": {
+        "mother": {"word": "mother", "definition_en": "a female parent", "definition_pt": "mãe", "level": LEVEL,
+                   "category": "family", "examples": ["My mother is a teacher."], "phonetic": "",
+                   "part_of_speech": "noun", "is_phrasal_verb": False, "source_document": "sample.pdf",
+                   "context": "mother - a female parent"}
+    },
+    "grammar": {
+        "present_perfect": {"rule_name": "Present Perfect", "category": "tenses", "level": LEVEL,
+                            "description": "Use for past actions with present relevance",
+                            "examples": ["I have been to Paris"], "rules": [], "exercises": [],
+                            "source_document": "sample.pdf", "context": "Present Perfect"}
+    },
+    "reading_materials": {
+        "text_sample": {"title": "A Town by the Sea", "level": LEVEL, "category": "reading",
+                        "content": "This reading text is about a town by the sea where many people live and work.",
+                        "word_count": 17, "difficulty": "medium", "source_document": "sample.pdf",
+                        "questions": ["What is the main idea of the text?"]}
+    }
+}
+
+def prepare_workspace(workspace: Path, config_file: Path, source: Optional[Path] = None):
+    """Dados processados (de ``source`` ou de exemplo) e configuração no workspace"""
+    processed = workspace / "output" / "processed_data" / LEVEL
+    if source is not None:
+        shutil.copytree(source, processed)
+    else:
+        processed.mkdir(parents=True)
+        for category, data in SAMPLE_DATA.items():
+            (processed / f"{category}.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    shutil.copy(config_file, workspace / "settings.yaml")
+
+def cli_command(name: str, docling_check: bool = False):
+    """main.py (via CLI_DOCLING_CHECK, se pedido) com os argumentos de CLI_COMMANDS[name]"""
+    main_file = str(PROJECT_ROOT / "main.py")
+    prefix = [sys.executable, "-c", CLI_DOCLING_CHECK, main_file] if docling_check else [sys.executable, main_file]
+    return prefix + ["--level", LEVEL, "--config", "settings.yaml"] + CLI_COMMANDS[name]
+
+def measure(command, runs: int, cwd: Path = PROJECT_ROOT) -> Optional[float]:
+    """Mediana do tempo de parede (ms) de um comando, ou None se ele falhar"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        timings.append((time.perf_counter() - start) * 1000)
+        if completed.returncode:
+            output = completed.stdout.strip().splitlines()
+            print(f"   falhou (código {completed.returncode}): {output[-1] if output else 'sem saída'}")
+            return None
+    return statistics.median(timings)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Orçamento de tempo de inicialização do Extractor B1")
+    parser.add_argument("--budget-ms", type=float, default=500.0, help="Tempo máximo por comando (mediana, ms)")
+    parser.add_argument("--runs", type=int, default=5, help="Execuções por comando")
+    parser.add_argument("--config", type=Path, default=PROJECT_ROOT / "config" / "settings.yaml", help="Arquivo de configuração")
+    parser.add_argument("--processed", type=Path, default=None,
+                        help="Pasta de dados processados para os comandos --from-processed (padrão: dados de exemplo)")
+    args = parser.parse_args()
+    
+    baseline = measure([sys.executable, "-c", "pass"], args.runs)
+    print(f"Interpretador vazio: {baseline:.0f} ms")
+    
+    over_budget = []
+    
+    def report(name: str, elapsed: Optional[float]):
+        if elapsed is None:
+            print(f"❌ {name:<24}   falhou (orçamento {args.budget_ms:.0f} ms)")
+            over_budget.append(name)
+            return
+        status = "✅" if elapsed <= args.budget_ms else "❌"
+        print(f"{status} {name:<24} {elapsed:7.0f} ms (orçamento {args.budget_ms:.0f} ms)")
+        if elapsed > args.budget_ms:
+            over_budget.append(name)
+    
+    for name, command in COMMANDS.items():
+        report(name, measure(command, args.runs))
+    
+    docling_loaded = subprocess.run([sys.executable, "-c", DOCLING_CHECK], cwd=PROJECT_ROOT).returncode != 0
+    print(f"{'❌' if docling_loaded else '✅'} Docling carregado na importação das etapas: {'sim' if docling_loaded else 'não'}")
+    
+    with tempfile.TemporaryDirectory(prefix="startup_budget_") as tmp:
+        workspace = Path(tmp)
+        prepare_workspace(workspace, args.config.resolve(), args.processed.resolve() if args.processed else None)
+        
+        for name in CLI_COMMANDS:
+            report(name, measure(cli_command(name), args.runs, cwd=workspace))
+            
+            returncode = subprocess.run(cli_command(name, docling_check=True), cwd=workspace,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+            if returncode:
+                docling_loaded = True
+            detail = "sim" if returncode == 3 else f"falhou (código {returncode})" if returncode else "não"
+            print(f"{'❌' if returncode else '✅'} Docling carregado em {name}: {detail}")
+    
+    return 1 if over_budget or docling_loaded else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,21 +6,11 @@ Processa materiais Cambridge e extrai dados estruturados para a plataforma
 
 import click
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.table import Table
 
-from scripts.extractor import DocumentExtractor
-from scripts.processor import DataProcessor
-from scripts.validator import DataValidator
-from scripts.exporter import DataExporter
-from utils.config import Config
-from utils.logger import setup_logger
-
-console = Console()
-logger = setup_logger()
+# As etapas (Docling, rich, sinks do loguru) são importadas dentro de main():
+# `python main.py --help` não paga o custo de carregá-las.
 
 @click.command()
 @click.option('--level', '-l', 
@@ -31,14 +21,60 @@ logger = setup_logger()
               is_flag=True, 
               help='Executar validação dos dados extraídos')
 @click.option('--export', '-e', 
-              type=click.Choice(['json', 'sql', 'csv', 'all']),
+              type=click.Choice(['json', 'sql', 'csv', 'all', 'none']),
               default='all', 
-              help='Formato de exportação')
+              help='Formato de exportação (none para não exportar)')
 @click.option('--config', '-c', 
               default='config/settings.yaml', 
               help='Arquivo de configuração')
-def main(level, validate, export, config):
+@click.option('--workers', '-w', 
+              type=click.IntRange(min=1),
+              default=None, 
+              help='Processos de extração paralela (padrão: extraction.max_workers)')
+@click.option('--no-cache', 
+              is_flag=True, 
+              help='Ignorar o cache de extração e reconverter todos os documentos')
+@click.option('--prune-cache', 
+              is_flag=True, 
+              help='Remover do cache as entradas não usadas nesta execução')
+@click.option('--from-processed', 
+              is_flag=True, 
+              help='Pular extração e processamento, usando os dados já processados em output/processed_data')
+@click.option('--incremental', '-i', 
+              is_flag=True, 
+              help='Extrair e processar apenas arquivos novos, alterados ou com falha desde a última execução')
+@click.option('--diff', 'show_diff', 
+              is_flag=True, 
+              help='Apenas listar arquivos novos, alterados e removidos desde a última extração')
+@click.option('--watch', 
+              is_flag=True, 
+              help='Manter o pipeline rodando e sincronizar arquivos novos ou alterados com o SQLite')
+@click.option('--interval', 
+              type=click.FloatRange(min=0.1),
+              default=None, 
+              help='Intervalo (segundos) entre verificações no modo watch (padrão: extraction.watch_interval_seconds)')
+@click.option('--pipeline', '-p', 
+              is_flag=True, 
+              help='Sobrepor extração, processamento e validação documento a documento')
+@click.option('--build-lexicon', 'lexicon_source',
+              type=click.Path(exists=True, dir_okay=False),
+              default=None, 
+              help='Gerar o índice do léxico CEFR a partir de uma lista de vocabulário (PDF ou texto) do nível')
+def main(level, validate, export, config, workers, no_cache, prune_cache, from_processed, incremental, show_diff,
+         watch, interval, pipeline, lexicon_source):
     """🚀 EXTRACTOR B1 - Pipeline de Extração de Materiais Cambridge"""
+    from loguru import logger
+    from rich.console import Console
+    from rich.panel import Panel
+    
+    from utils.config import Config
+    from utils.logger import setup_logger
+    
+    if watch and level == 'ALL':
+        raise click.BadParameter("o modo watch observa um nível por vez", param_hint="--level")
+    
+    console = Console()
+    setup_logger()
     
     console.print(Panel.fit(
         "[bold blue]🚀 EXTRACTOR B1[/bold blue]\n"
@@ -51,70 +87,54 @@ def main(level, validate, export, config):
         config_obj = Config(config)
         console.print(f"✅ Configurações carregadas de: [blue]{config}[/blue]")
         
+        if lexicon_source:
+            if level == 'ALL':
+                raise click.BadParameter("a lista de vocabulário é de um nível", param_hint="--level")
+            build_lexicon(config_obj, Path(lexicon_source), level, not no_cache, console)
+            return
+        
+        if watch:
+            from scripts.watcher import MaterialWatcher
+            
+            watcher = MaterialWatcher(config_obj, level, max_workers=workers, use_cache=not no_cache,
+                                      validate=validate, interval=interval)
+            console.print(f"👀 Observando [blue]{watcher.extractor.materials_path}[/blue] (Ctrl+C para sair)")
+            watcher.run(on_sync=lambda result: show_watch_sync(result, console))
+            return
+        
         # Determinar níveis para processar
         levels_to_process = [level] if level != 'ALL' else ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
         
-        for current_level in levels_to_process:
-            console.print(f"\n[bold green]🎯 PROCESSANDO NÍVEL: {current_level}[/bold green]")
-            
-            # ETAPA 1: EXTRAÇÃO BRUTA
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Extraindo documentos...", total=None)
-                
-                extractor = DocumentExtractor(config_obj, current_level)
-                raw_data = extractor.extract_all()
-                
-                progress.update(task, description=f"✅ Extração concluída: {len(raw_data)} documentos")
+        if show_diff:
+            from scripts.extractor import DocumentExtractor
             
-            # ETAPA 2: PROCESSAMENTO E ESTRUTURAÇÃO
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processando e estruturando dados...", total=None)
-                
-                processor = DataProcessor(config_obj, current_level)
-                processed_data = processor.process_all(raw_data)
-                
-                progress.update(task, description=f"✅ Processamento concluído: {len(processed_data)} categorias")
-            
-            # ETAPA 3: VALIDAÇÃO (OPCIONAL)
-            if validate:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console
-                ) as progress:
-                    task = progress.add_task("Validando dados...", total=None)
-                    
-                    validator = DataValidator(config_obj, current_level)
-                    validation_results = validator.validate_all(processed_data)
-                    
-                    progress.update(task, description="✅ Validação concluída")
-                
-                # Mostrar resultados da validação
-                show_validation_results(validation_results, console)
-            
-            # ETAPA 4: EXPORTAÇÃO
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Exportando dados...", total=None)
-                
-                exporter = DataExporter(config_obj, current_level)
-                export_results = exporter.export_all(processed_data, export)
-                
-                progress.update(task, description="✅ Exportação concluída")
+            for current_level in levels_to_process:
+                extractor = DocumentExtractor(config_obj, current_level, use_cache=False)
+                show_materials_diff(extractor.diff_materials(), current_level, console)
+            return
+        
+        options = {
+            "validate": validate,
+            "export": export,
+            "workers": workers,
+            "use_cache": not no_cache,
+            "from_processed": from_processed,
+            "incremental": incremental,
+            "pipeline": pipeline
+        }
+        
+        if len(levels_to_process) == 1:
+            results = [run_level(config_obj, levels_to_process[0], options, console)]
+        else:
+            results = run_levels(config_obj, levels_to_process, options, console)
+            show_levels_summary(results, console)
+        
+        if prune_cache and not from_processed:
+            from utils.extraction_cache import ExtractionCache
             
-            # Mostrar resumo dos resultados
-            show_export_summary(export_results, current_level, console)
+            used_cache_keys = set().union(*(result['cache_keys'] for result in results))
+            removed = ExtractionCache(config_obj).prune(used_cache_keys)
+            console.print(f"♻️ Cache de extração podado: [yellow]{removed}[/yellow] entradas removidas")
         
         console.print("\n[bold green]🎉 PIPELINE CONCLUÍDO COM SUCESSO![/bold green]")
         console.print("📁 Verifique as pastas de output para os resultados")
@@ -124,9 +144,181 @@ def main(level, validate, export, config):
         console.print(f"\n[bold red]❌ ERRO NO PIPELINE:[/bold red] {str(e)}")
         sys.exit(1)
 
-def show_validation_results(results, console):
+def run_levels(config_obj, levels, options, console):
+    """Executa vários níveis ao mesmo tempo, compartilhando o pool de extração e o cache
+    
+    Cada nível grava em suas próprias pastas output/*/<nível>; até
+    performance.max_parallel_levels níveis rodam em paralelo. As conversões Docling de
+    todos os níveis disputam o mesmo pool de workers (extraction.max_workers), então o
+    paralelismo entre níveis aproveita os workers ociosos sem multiplicar processos.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import ExitStack
+    
+    parallel_levels = min(config_obj.get_max_parallel_levels(), len(levels))
+    console.print(f"\n[bold green]🎯 PROCESSANDO NÍVEIS: {', '.join(levels)}[/bold green] ({parallel_levels} em paralelo)")
+    
+    with ExitStack() as stack:
+        shared = {}
+        if not options['from_processed']:
+            from scripts.extractor import create_extraction_pool
+            from utils.extraction_cache import ExtractionCache
+            
+            if options['use_cache'] and config_obj.is_extraction_cache_enabled():
+                shared['cache'] = ExtractionCache(config_obj)
+            
+            workers = options['workers'] or config_obj.get_max_workers()
+            if workers > 1 or config_obj.should_isolate_documents():
+                shared['pool'] = stack.enter_context(create_extraction_pool(config_obj, workers, options['use_cache']))
+        
+        # Spinners do rich não podem ficar ativos em várias threads; com níveis em paralelo
+        # cada etapa concluída é apenas impressa
+        live = parallel_levels == 1
+        with ThreadPoolExecutor(max_workers=parallel_levels, thread_name_prefix="level") as executor:
+            futures = [
+                executor.submit(run_level, config_obj, current_level, options, console, shared, live)
+                for current_level in levels
+            ]
+            return [future.result() for future in futures]
+
+def run_level(config_obj, current_level, options, console, shared=None, live=True):
+    """Executa extração, processamento, validação e exportação de um nível"""
+    import time
+    
+    shared = shared or {}
+    started = time.perf_counter()
+    console.print(f"\n[bold green]🎯 PROCESSANDO NÍVEL: {current_level}[/bold green]")
+    
+    extraction_summary = None
+    validation_results = None
+    export_results = None
+    cache_keys = set()
+    
+    if options['from_processed']:
+        from scripts.records import load_processed_data
+        
+        # Sem o processador: nem suas tabelas e padrões nem o NumPy entram na inicialização
+        processed_data = load_processed_data(current_level)
+        console.print(f"📂 Dados processados carregados: {sum(len(v) for v in processed_data.values())} itens")
+    elif options['pipeline']:
+        from scripts.pipeline import StreamingPipeline
+        
+        # ETAPAS 1-3 SOBREPOSTAS: EXTRAÇÃO -> PROCESSAMENTO -> VALIDAÇÃO
+        with stage_progress(console, "Extraindo e processando documentos...", current_level, live) as done:
+            streaming = StreamingPipeline(config_obj, current_level, max_workers=options['workers'],
+                                          use_cache=options['use_cache'], validate=options['validate'],
+                                          incremental=options['incremental'], **shared)
+            pipeline_results = streaming.run()
+            extraction_summary = pipeline_results['extraction_summary']
+            processed_data = pipeline_results['processed_data']
+            validation_results = pipeline_results['validation_results']
+            cache_keys = streaming.extractor.cache_keys_used
+            
+            done(f"✅ Pipeline concluído: {extraction_summary['total_documents']} documentos")
+    else:
+        from scripts.extractor import DocumentExtractor
+        from scripts.processor import DataProcessor
+        
+        # ETAPA 1: EXTRAÇÃO BRUTA
+        with stage_progress(console, "Extraindo documentos...", current_level, live) as done:
+            extractor = DocumentExtractor(config_obj, current_level, max_workers=options['workers'],
+                                          use_cache=options['use_cache'], **shared)
+            extraction_summary = extractor.extract_to_ndjson(incremental=options['incremental'])
+            cache_keys = extractor.cache_keys_used
+            
+            done(f"✅ Extração concluída: {extraction_summary['total_documents']} documentos")
+        
+        # ETAPA 2: PROCESSAMENTO E ESTRUTURAÇÃO
+        with stage_progress(console, "Processando e estruturando dados...", current_level, live) as done:
+            processor = DataProcessor(config_obj, current_level)
+            processed_data = processor.process_file(Path(extraction_summary['output_file']),
+                                                  incremental=options['incremental'])
+            
+            done(f"✅ Processamento concluído: {len(processed_data)} categorias")
+    
+    # ETAPA 3: VALIDAÇÃO (OPCIONAL; no modo pipeline já foi feita)
+    if options['validate'] and validation_results is None:
+        from scripts.validator import DataValidator
+        
+        with stage_progress(console, "Validando dados...", current_level, live) as done:
+            validator = DataValidator(config_obj, current_level)
+            validation_results = validator.validate_all(processed_data)
+            
+            done("✅ Validação concluída")
+    
+    # Mostrar resultados da validação
+    if validation_results is not None:
+        show_validation_results(validation_results, console, current_level)
+    
+    # ETAPA 4: EXPORTAÇÃO
+    if options['export'] != 'none':
+        from scripts.exporter import DataExporter
+        
+        with stage_progress(console, "Exportando dados...", current_level, live) as done:
+            exporter = DataExporter(config_obj, current_level)
+            export_results = exporter.export_all(processed_data, options['export'])
+            
+            done("✅ Exportação concluída")
+        
+        # Mostrar resumo dos resultados
+        show_export_summary(export_results, current_level, console)
+    
+    return {
+        "level": current_level,
+        "extraction_summary": extraction_summary,
+        "item_count": sum(len(data) for data in processed_data.values()),
+        "validation_results": validation_results,
+        "export_results": export_results,
+        "cache_keys": cache_keys,
+        "elapsed_seconds": time.perf_counter() - started
+    }
+
+def build_lexicon(config_obj, source_file, level, use_cache, console):
+    """Extrai a lista de vocabulário e grava (ou complementa) o índice do léxico CEFR"""
+    from scripts.document_model import load_content
+    from scripts.extractor import DocumentExtractor
+    from utils.cefr_lexicon import build_lexicon_index, parse_vocabulary_list
+    
+    extractor = DocumentExtractor(config_obj, None, use_cache=use_cache)
+    with stage_progress(console, "Extraindo lista de vocabulário...", level) as done:
+        document = extractor.extract_document(source_file)
+        done(f"✅ Lista extraída: {source_file.name}")
+    
+    full_text = load_content(document.get('content', {})).get('full_text', '')
+    entries = list(parse_vocabulary_list(full_text, level))
+    if not entries:
+        raise ValueError(f"Nenhuma entrada de vocabulário reconhecida em {source_file.name}")
+    
+    index_file = config_obj.get_lexicon_index_file()
+    total = build_lexicon_index(entries, index_file, source=source_file.name)
+    console.print(f"📚 Léxico CEFR: [green]{len(entries)}[/green] entradas {level} de {source_file.name}, "
+                  f"[green]{total}[/green] palavras em [blue]{index_file}[/blue]")
+
+@contextmanager
+def stage_progress(console, description, level, live=True):
+    """Spinner de uma etapa; o bloco recebe uma função para marcar a conclusão
+    
+    Sem live (níveis em paralelo), apenas a conclusão é impressa, prefixada pelo nível.
+    """
+    if not live:
+        yield lambda text: console.print(f"[{level}] {text}", markup=False)
+        return
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield lambda text: progress.update(task, description=text)
+
+def show_validation_results(results, console, level=None):
     """Mostra resultados da validação"""
-    table = Table(title="📊 Resultados da Validação")
+    from rich.table import Table
+    
+    table = Table(title=f"📊 Resultados da Validação - Nível {level}" if level else "📊 Resultados da Validação")
     table.add_column("Categoria", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("Itens", style="yellow")
@@ -144,8 +336,69 @@ def show_validation_results(results, console):
     
     console.print(table)
 
+def show_watch_sync(result, console):
+    """Mostra o resultado de uma sincronização do modo watch"""
+    status = "✅" if result['export'].get('success') else "❌"
+    console.print(
+        f"{status} Sincronizado em [yellow]{result['elapsed_seconds']:.2f}s[/yellow]: "
+        f"{len(result['updated'])} atualizados, {len(result['removed'])} removidos"
+    )
+    if result['validation']:
+        show_validation_results(result['validation'], console)
+
+def show_materials_diff(diff, level, console):
+    """Mostra os arquivos que mudaram desde a última extração"""
+    from rich.table import Table
+    
+    table = Table(title=f"🗂️ Alterações nos Materiais - Nível {level}")
+    table.add_column("Situação", style="cyan")
+    table.add_column("Arquivo", style="blue")
+    
+    labels = {"added": "➕ novo", "changed": "✏️ alterado", "removed": "➖ removido"}
+    for change, label in labels.items():
+        for key in diff[change]:
+            table.add_row(label, key)
+    
+    console.print(table)
+    console.print(f"Inalterados: [green]{len(diff['unchanged'])}[/green]")
+
+def show_levels_summary(results, console):
+    """Mostra o resumo combinado de todos os níveis processados"""
+    from rich.table import Table
+    
+    table = Table(title="🧾 Resumo por Nível")
+    table.add_column("Nível", style="cyan")
+    table.add_column("Documentos", style="yellow")
+    table.add_column("Falhas", style="red")
+    table.add_column("Itens", style="yellow")
+    table.add_column("Qualidade", style="green")
+    table.add_column("Exportação", style="green")
+    table.add_column("Tempo", style="blue")
+    
+    for result in results:
+        summary = result['extraction_summary'] or {}
+        validation = result['validation_results']
+        quality = (
+            sum(r.get('quality_score', 0) for r in validation.values()) / len(validation)
+            if validation else None
+        )
+        exports = result['export_results']
+        table.add_row(
+            result['level'],
+            str(summary.get('total_documents', '-')),
+            str(summary.get('failed_extractions', '-')),
+            str(result['item_count']),
+            f"{quality:.1f}" if quality is not None else "-",
+            ("✅" if all(r['success'] for r in exports.values()) else "❌") if exports else "-",
+            f"{result['elapsed_seconds']:.1f}s"
+        )
+    
+    console.print(table)
+
 def show_export_summary(results, level, console):
     """Mostra resumo da exportação"""
+    from rich.table import Table
+    
     table = Table(title=f"📤 Resumo da Exportação - Nível {level}")
     table.add_column("Formato", style="cyan")
     table.add_column("Arquivo", style="blue")
@@ -157,7 +410,7 @@ def show_export_summary(results, level, console):
         table.add_row(
             format_type.upper(),
             result.get('filename', 'N/A'),
-            result.get('size', 'N/A'),
+            str(result.get('size', 'N/A')),
             status
         )
     
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+📊 MOTOR DE DIFICULDADE - LEGIBILIDADE VETORIZADA
+Tokeniza um lote de parágrafos uma vez e calcula, em arrays NumPy, palavras por frase,
+sílabas por palavra e cobertura de uma lista de palavras CEFR para classificar
+leitura, listening e speaking em easy/medium/hard
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable, Sequence, NamedTuple
+import numpy as np
+from loguru import logger
+
+from utils.cefr_lexicon import CEFR_LEVELS
+
+# Palavra = letras ASCII, com apóstrofos internos ("don't"); mesma definição das máscaras abaixo
+WORD = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+def _byte_table(characters: bytes) -> np.ndarray:
+    """Tabela de consulta byte -> pertence ao conjunto"""
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(characters, dtype=np.uint8)] = True
+    return table
+
+_LETTERS = _byte_table(b"abcdefghijklmnopqrstuvwxyz")
+_VOWELS = _byte_table(b"aeiouy")
+_SENTENCE_END = _byte_table(b".!?")
+_APOSTROPHE = ord("'")
+
+# Limiares padrão do nível de leitura ajustado: [easy abaixo de, hard a partir de]
+DEFAULT_THRESHOLDS = {
+    'reading': (6.0, 10.0),
+    'listening': (5.0, 9.0),
+    'speaking': (5.0, 9.0)
+}
+
+def load_word_list(word_list_file: Optional[str]) -> Optional[List[str]]:
+    """Carrega uma lista de palavras (uma por linha, '#' para comentários)"""
+    if not word_list_file:
+        return None
+    path = Path(word_list_file)
+    if not path.exists():
+        logger.warning(f"Lista de palavras não encontrada: {path}")
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip().lower() for line in f if line.strip() and not line.startswith('#')]
+
+class TextScan(NamedTuple):
+    """Palavras e frases de um texto (ou de um lote de textos unidos)"""
+    text: str
+    word_starts: np.ndarray
+    syllables: np.ndarray
+    sentence_starts: np.ndarray
+
+def scan_text(text: str) -> TextScan:
+    """Localiza palavras, sílabas (grupos de vogais, 'e' final mudo, mínimo 1) e finais de
+    frase com máscaras sobre os bytes do texto em minúsculas, sem laço por palavra"""
+    text = text.lower()
+    # Caracteres fora do ASCII viram '?' (um byte cada), mantendo as posições do texto
+    buffer = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+    
+    letter = _LETTERS[buffer]
+    apostrophe = (buffer == _APOSTROPHE) & np.concatenate(([False], letter[:-1])) & np.concatenate((letter[1:], [False]))
+    in_word = letter | apostrophe
+    word_starts = np.flatnonzero(in_word & ~np.concatenate(([False], in_word[:-1])))
+    word_ends = np.flatnonzero(in_word & ~np.concatenate((in_word[1:], [False])))
+    
+    vowel = _VOWELS[buffer]
+    vowel_groups = (vowel & ~np.concatenate(([False], vowel[:-1]))).astype(np.int64)
+    if len(word_starts):
+        # Cada segmento vai até o início da palavra seguinte; fora das palavras não há vogais
+        syllables = np.add.reduceat(vowel_groups, word_starts)
+        word_lengths = word_ends - word_starts + 1
+        silent_e = (buffer[word_ends] == ord('e')) & (buffer[word_ends - 1] != ord('l')) & (word_lengths > 2) & (syllables > 1)
+        syllables = np.maximum(syllables - silent_e, 1)
+    else:
+        syllables = np.zeros(0, dtype=np.int64)
+    
+    sentence_mark = _SENTENCE_END[buffer]
+    sentence_starts = np.flatnonzero(sentence_mark & ~np.concatenate(([False], sentence_mark[:-1])))
+    
+    return TextScan(text, word_starts, syllables, sentence_starts)
+
+class DifficultyEngine:
+    """Classificador de dificuldade em lote
+    
+    O nível ajustado é o Flesch-Kincaid (0,39 × palavras por frase + 11,8 × sílabas por
+    palavra − 15,59) somado a coverage_weight × fração de palavras fora da lista CEFR,
+    quando há lista. Cada tipo de material tem seus limiares easy/hard.
+    """
+    
+    FEATURES = ("words", "words_per_sentence", "syllables_per_word", "coverage")
+    
+    def __init__(self, known_words: Optional[Iterable[str]] = None,
+                 thresholds: Optional[Dict[str, Sequence[float]]] = None, coverage_weight: float = 8.0):
+        self.known_words = np.unique(np.array(list(known_words), dtype=str)) if known_words else None
+        self.thresholds = {kind: tuple(values) for kind, values in {**DEFAULT_THRESHOLDS, **(thresholds or {})}.items()}
+        self.coverage_weight = coverage_weight
+    
+    @classmethod
+    def from_config(cls, config, known_words: Optional[Iterable[str]] = None, lexicon=None,
+                    level: Optional[str] = None) -> "DifficultyEngine":
+        """Cria o motor com processing.difficulty (lista de palavras, limiares e peso da cobertura)
+        
+        Sem word_list, as palavras conhecidas são as do léxico CEFR (--build-lexicon)
+        até o nível, quando ele foi construído.
+        """
+        settings = config.get_difficulty_settings()
+        if known_words is None:
+            known_words = load_word_list(settings.get('word_list'))
+        if known_words is None and lexicon is not None and level in CEFR_LEVELS:
+            known_words = lexicon.words(level)
+        return cls(known_words, settings.get('thresholds'), float(settings.get('coverage_weight', 8.0)))
+    
+    def features(self, texts: Sequence[str]) -> np.ndarray:
+        """Matriz (textos × FEATURES); cobertura é NaN sem lista de palavras
+        
+        Os textos são unidos e varridos uma vez (scan_text); as contagens de cada texto
+        saem de bincount sobre a posição das palavras e frases no buffer.
+        """
+        n = len(texts)
+        # Minúsculas antes de medir: lower() pode mudar o comprimento ('İ' -> 'i̇')
+        texts = [text.lower() for text in texts]
+        scan = scan_text("\n".join(texts))
+        
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=n)
+        text_starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1])) if n else np.zeros(0, dtype=np.int64)
+        word_text = np.searchsorted(text_starts, scan.word_starts, side='right') - 1
+        sentence_text = np.searchsorted(text_starts, scan.sentence_starts, side='right') - 1
+        
+        word_counts = np.bincount(word_text, minlength=n)
+        sentence_counts = np.bincount(sentence_text, minlength=n)
+        safe_counts = np.maximum(word_counts, 1)
+        
+        result = np.empty((n, len(self.FEATURES)))
+        result[:, 0] = word_counts
+        result[:, 1] = word_counts / np.maximum(sentence_counts, 1)
+        result[:, 2] = np.bincount(word_text, weights=scan.syllables, minlength=n) / safe_counts
+        
+        if self.known_words is not None:
+            words = np.array(WORD.findall(scan.text), dtype=str)
+            known = np.isin(words, self.known_words) if len(words) else np.zeros(0, dtype=bool)
+            known_per_text = np.bincount(word_text, weights=known, minlength=n)
+            result[:, 3] = np.where(word_counts > 0, known_per_text / safe_counts, 1.0)
+        else:
+            result[:, 3] = np.nan
+        return result
+    
+    def grades(self, texts: Sequence[str]) -> np.ndarray:
+        """Nível de leitura ajustado de cada texto"""
+        features = self.features(texts)
+        grade = 0.39 * features[:, 1] + 11.8 * features[:, 2] - 15.59
+        coverage = features[:, 3]
+        return np.where(np.isnan(coverage), grade, grade + self.coverage_weight * (1.0 - coverage))
+    
+    def assess(self, texts: Sequence[str], kinds: Sequence[str]) -> List[str]:
+        """easy/medium/hard de cada texto, com os limiares do tipo de material correspondente"""
+        if not texts:
+            return []
+        grade = self.grades(texts)
+        easy_below = np.array([self.thresholds.get(kind, DEFAULT_THRESHOLDS['reading'])[0] for kind in kinds])
+        hard_from = np.array([self.thresholds.get(kind, DEFAULT_THRESHOLDS['reading'])[1] for kind in kinds])
+        labels = np.select([grade < easy_below, grade >= hard_from], ["easy", "hard"], "medium")
+        return labels.tolist()
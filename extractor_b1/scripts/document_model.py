@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+🧱 MODELO COMPACTO DE DOCUMENTO
+Texto armazenado uma única vez; páginas, parágrafos e frases como spans (offset, tamanho)
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterator, Tuple
+
+Span = Tuple[int, int]
+
+CONTENT_FORMAT = "spans"
+
+def strip_span(text: str, start: int, end: int) -> Span:
+    """Ajusta o intervalo [start, end) removendo espaços nas pontas, como str.strip()"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end - start
+
+def split_spans(text: str, separator: str) -> List[Span]:
+    """Equivalente a [p.strip() for p in text.split(separator) if p.strip()], mas em spans"""
+    spans = []
+    start = 0
+    step = len(separator)
+    while True:
+        end = text.find(separator, start)
+        chunk_end = end if end != -1 else len(text)
+        offset, length = strip_span(text, start, chunk_end)
+        if length:
+            spans.append((offset, length))
+        if end == -1:
+            return spans
+        start = end + step
+
+class CompactContent(Mapping):
+    """Conteúdo textual de um documento com acesso preguiçoso às visões derivadas
+    
+    Mantém a interface de dicionário usada pelo DataProcessor: ``full_text``,
+    ``pages`` (lista de dicts), ``paragraphs`` e ``sentences`` (listas de strings).
+    """
+    
+    KEYS = ("full_text", "pages", "paragraphs", "sentences")
+    
+    __slots__ = ("text", "page_spans", "paragraph_spans", "sentence_spans", "_views")
+    
+    def __init__(self, text: str, page_spans: List[Span], paragraph_spans: List[Span], sentence_spans: List[Span]):
+        self.text = text
+        self.page_spans = page_spans
+        self.paragraph_spans = paragraph_spans
+        self.sentence_spans = sentence_spans
+        self._views = {}
+    
+    @classmethod
+    def from_pages(cls, page_texts: List[str]) -> "CompactContent":
+        """Monta o conteúdo a partir do texto de cada página (sem concatenação quadrática)"""
+        page_spans = []
+        offset = 0
+        for page_text in page_texts:
+            page_spans.append((offset, len(page_text)))
+            offset += len(page_text) + 1
+        
+        text = "".join(page_text + "\n" for page_text in page_texts)
+        if not text:
+            return cls("", page_spans, [], [])
+        
+        return cls(text, page_spans, split_spans(text, "\n\n"), split_spans(text, "."))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactContent":
+        """Reconstrói o conteúdo a partir da forma serializada"""
+        return cls(
+            data.get("text", ""),
+            [tuple(span) for span in data.get("pages", [])],
+            [tuple(span) for span in data.get("paragraphs", [])],
+            [tuple(span) for span in data.get("sentences", [])]
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Forma serializada: texto único e listas de [offset, tamanho]"""
+        return {
+            "format": CONTENT_FORMAT,
+            "text": self.text,
+            "pages": [list(span) for span in self.page_spans],
+            "paragraphs": [list(span) for span in self.paragraph_spans],
+            "sentences": [list(span) for span in self.sentence_spans]
+        }
+    
+    def slice(self, span: Span) -> str:
+        """Texto correspondente a um span"""
+        offset, length = span
+        return self.text[offset:offset + length]
+    
+    def page_texts(self) -> List[str]:
+        """Texto de cada página"""
+        return [self.slice(span) for span in self.page_spans]
+    
+    def build_view(self, key: str) -> Any:
+        if key == "full_text":
+            return self.text
+        if key == "pages":
+            pages = []
+            for i, page_text in enumerate(self.page_texts()):
+                pages.append({
+                    "page_number": i + 1,
+                    "text": page_text,
+                    "word_count": len(page_text.split()) if page_text else 0
+                })
+            return pages
+        if key == "paragraphs":
+            return [self.slice(span) for span in self.paragraph_spans]
+        if key == "sentences":
+            return [self.slice(span).replace('\n', ' ') for span in self.sentence_spans]
+        raise KeyError(key)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._views:
+            self._views[key] = self.build_view(key)
+        return self._views[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+def load_content(content: Any) -> Any:
+    """Converte o conteúdo serializado em CompactContent (conteúdo legado é mantido como está)"""
+    if isinstance(content, dict) and content.get("format") == CONTENT_FORMAT:
+        return CompactContent.from_dict(content)
+    return content
@@ -11,9 +11,32 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from loguru import logger
 
+from scripts.records import records_to_dicts
+from utils.hashing import json_sha256
+
+def sql_escape(value) -> str:
+    """Texto para um literal SQL entre aspas simples (aspas simples duplicadas)"""
+    return str(value if value is not None else '').replace("'", "''")
+
 class DataExporter:
     """Exporta dados processados em múltiplos formatos"""
     
+    # Tabelas do SQLite (uma por categoria processada)
+    SQL_TABLES = [
+        "vocabulary",
+        "grammar",
+        "reading_materials",
+        "listening_materials",
+        "writing_prompts",
+        "speaking_topics"
+    ]
+    
+    # Colunas (JSON) das categorias cujas quase duplicatas são reunidas em um item
+    SQL_DUPLICATE_COLUMNS = {
+        "reading_materials": ("sources", "duplicate_ids"),
+        "listening_materials": ("sources", "duplicate_ids")
+    }
+    
     def __init__(self, config, level: str):
         self.config = config
         self.level = level
@@ -26,6 +49,9 @@ class DataExporter:
         """Exporta todos os dados no formato especificado"""
         export_results = {}
         
+        # Registros compactos do processador viram dicionários só aqui, na exportação
+        processed_data = records_to_dicts(processed_data)
+        
         if export_format in ['json', 'all']:
             export_results['json'] = self.export_to_json(processed_data)
         
@@ -116,6 +142,83 @@ class DataExporter:
                 'error': str(e)
             }
     
+    def sync_documents_to_sql(self, documents: Dict[str, Dict[str, Any]], removed_sources: List[str] = (),
+                              replace_all: bool = False) -> Dict[str, Any]:
+        """Atualiza o SQLite apenas com os documentos alterados (modo watch)
+        
+        ``documents`` mapeia source_document -> todos os itens do nível com essa origem, por
+        categoria (a visão mesclada e com duplicatas reunidas). Em cada documento alterado
+        só são tocados os itens cujo hash mudou: itens com o mesmo item_id e item_hash
+        ficam como estão, os demais são apagados e reinseridos.
+        Documentos removidos perdem todas as linhas. Tudo ocorre em uma única transação;
+        com replace_all=True as tabelas são esvaziadas antes.
+        """
+        try:
+            db_file = self.output_path / f"{self.level}_data.db"
+            
+            conn = sqlite3.connect(str(db_file))
+            try:
+                cursor = conn.cursor()
+                self.create_sqlite_tables(cursor)
+                
+                for table in self.SQL_TABLES:
+                    if replace_all:
+                        cursor.execute(f"DELETE FROM {table}")
+                    else:
+                        for source in removed_sources:
+                            cursor.execute(f"DELETE FROM {table} WHERE source_document = ?", (source,))
+                
+                items_written = 0
+                items_deleted = 0
+                for source, document_processed in documents.items():
+                    for table in self.SQL_TABLES:
+                        data = document_processed.get(table) or {}
+                        
+                        existing = dict(cursor.execute(
+                            f"SELECT item_id, item_hash FROM {table} WHERE source_document = ?", (source,)
+                        ).fetchall())
+                        changed = {
+                            item_id: item_data for item_id, item_data in data.items()
+                            if existing.get(item_id) != json_sha256(item_data)
+                        }
+                        stale = [item_id for item_id in existing if item_id not in data or item_id in changed]
+                        
+                        for item_id in stale:
+                            if item_id is None:
+                                cursor.execute(f"DELETE FROM {table} WHERE source_document = ? AND item_id IS NULL", (source,))
+                            else:
+                                cursor.execute(f"DELETE FROM {table} WHERE source_document = ? AND item_id = ?", (source, item_id))
+                        
+                        if changed:
+                            self.insert_category_data(cursor, table, changed)
+                        
+                        items_written += len(changed)
+                        items_deleted += len(stale)
+                
+                conn.commit()
+            finally:
+                conn.close()
+            
+            logger.info(f"✅ SQLite atualizado: {len(documents)} documentos ({items_written} itens gravados, "
+                        f"{items_deleted} apagados), {len(removed_sources)} removidos")
+            
+            return {
+                'success': True,
+                'filename': str(db_file),
+                'size': db_file.stat().st_size,
+                'documents_updated': len(documents),
+                'documents_removed': len(removed_sources),
+                'items_written': items_written,
+                'items_deleted': items_deleted
+            }
+        
+        except Exception as e:
+            logger.error(f"❌ Erro na atualização do SQLite: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     def export_to_csv(self, processed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Exporta dados para CSV"""
         try:
@@ -186,6 +289,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS vocabulary (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 word TEXT NOT NULL,
                 definition_en TEXT NOT NULL,
                 definition_pt TEXT,
@@ -204,6 +309,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS grammar (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 rule_name TEXT NOT NULL,
                 category TEXT NOT NULL,
                 level TEXT NOT NULL,
@@ -220,6 +327,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS reading_materials (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 title TEXT NOT NULL,
                 content TEXT NOT NULL,
                 word_count INTEGER,
@@ -227,7 +336,9 @@ class DataExporter:
                 category TEXT NOT NULL,
                 difficulty TEXT,
                 source_document TEXT,
-                questions TEXT
+                questions TEXT,
+                sources TEXT,
+                duplicate_ids TEXT
             )
         ''')
         
@@ -235,6 +346,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS listening_materials (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 title TEXT NOT NULL,
                 content TEXT NOT NULL,
                 type TEXT,
@@ -242,7 +355,9 @@ class DataExporter:
                 category TEXT NOT NULL,
                 difficulty TEXT,
                 source_document TEXT,
-                questions TEXT
+                questions TEXT,
+                sources TEXT,
+                duplicate_ids TEXT
             )
         ''')
         
@@ -250,6 +365,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS writing_prompts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 title TEXT NOT NULL,
                 prompt TEXT NOT NULL,
                 type TEXT,
@@ -265,6 +382,8 @@ class DataExporter:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS speaking_topics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id TEXT,
+                item_hash TEXT,
                 title TEXT NOT NULL,
                 topic TEXT NOT NULL,
                 type TEXT,
@@ -275,6 +394,15 @@ class DataExporter:
                 questions TEXT
             )
         ''')
+        
+        # Bancos criados antes dos IDs estáveis (e da reunião de duplicatas) ganham as colunas novas
+        for table in self.SQL_TABLES:
+            columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            added = ('item_id', 'item_hash') + self.SQL_DUPLICATE_COLUMNS.get(table, ())
+            for column in added:
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_source ON {table}(source_document, item_id)")
     
     def insert_category_data(self, cursor, category: str, data: Dict[str, Any]):
         """Insere dados de uma categoria no SQLite"""
@@ -282,11 +410,13 @@ class DataExporter:
             for word_id, word_data in data.items():
                 cursor.execute('''
                     INSERT INTO vocabulary (
-                        word, definition_en, definition_pt, level, category,
+                        item_id, item_hash, word, definition_en, definition_pt, level, category,
                         examples, phonetic, part_of_speech, is_phrasal_verb,
                         source_document, context
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    word_id,
+                    json_sha256(word_data),
                     word_data.get('word', ''),
                     word_data.get('definition_en', ''),
                     word_data.get('definition_pt', ''),
@@ -304,10 +434,12 @@ class DataExporter:
             for rule_id, rule_data in data.items():
                 cursor.execute('''
                     INSERT INTO grammar (
-                        rule_name, category, level, description, examples,
+                        item_id, item_hash, rule_name, category, level, description, examples,
                         rules, exercises, source_document, context
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    rule_id,
+                    json_sha256(rule_data),
                     rule_data.get('rule_name', ''),
                     rule_data.get('category', ''),
                     rule_data.get('level', ''),
@@ -323,10 +455,12 @@ class DataExporter:
             for text_id, text_data in data.items():
                 cursor.execute('''
                     INSERT INTO reading_materials (
-                        title, content, word_count, level, category,
-                        difficulty, source_document, questions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        item_id, item_hash, title, content, word_count, level, category,
+                        difficulty, source_document, questions, sources, duplicate_ids
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    text_id,
+                    json_sha256(text_data),
                     text_data.get('title', ''),
                     text_data.get('content', ''),
                     text_data.get('word_count', 0),
@@ -334,17 +468,21 @@ class DataExporter:
                     text_data.get('category', ''),
                     text_data.get('difficulty', ''),
                     text_data.get('source_document', ''),
-                    json.dumps(text_data.get('questions', []))
+                    json.dumps(text_data.get('questions', [])),
+                    json.dumps(text_data.get('sources', [])),
+                    json.dumps(text_data.get('duplicate_ids', []))
                 ))
         
         elif category == 'listening_materials':
             for dialogue_id, dialogue_data in data.items():
                 cursor.execute('''
                     INSERT INTO listening_materials (
-                        title, content, type, level, category,
-                        difficulty, source_document, questions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        item_id, item_hash, title, content, type, level, category,
+                        difficulty, source_document, questions, sources, duplicate_ids
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    dialogue_id,
+                    json_sha256(dialogue_data),
                     dialogue_data.get('title', ''),
                     dialogue_data.get('content', ''),
                     dialogue_data.get('type', ''),
@@ -352,17 +490,21 @@ class DataExporter:
                     dialogue_data.get('category', ''),
                     dialogue_data.get('difficulty', ''),
                     dialogue_data.get('source_document', ''),
-                    json.dumps(dialogue_data.get('questions', []))
+                    json.dumps(dialogue_data.get('questions', [])),
+                    json.dumps(dialogue_data.get('sources', [])),
+                    json.dumps(dialogue_data.get('duplicate_ids', []))
                 ))
         
         elif category == 'writing_prompts':
             for prompt_id, prompt_data in data.items():
                 cursor.execute('''
                     INSERT INTO writing_prompts (
-                        title, prompt, type, level, category,
+                        item_id, item_hash, title, prompt, type, level, category,
                         word_limit, source_document, suggestions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    prompt_id,
+                    json_sha256(prompt_data),
                     prompt_data.get('title', ''),
                     prompt_data.get('prompt', ''),
                     prompt_data.get('type', ''),
@@ -377,10 +519,12 @@ class DataExporter:
             for topic_id, topic_data in data.items():
                 cursor.execute('''
                     INSERT INTO speaking_topics (
-                        title, topic, type, level, category,
+                        item_id, item_hash, title, topic, type, level, category,
                         difficulty, source_document, questions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
+                    topic_id,
+                    json_sha256(topic_data),
                     topic_data.get('title', ''),
                     topic_data.get('topic', ''),
                     topic_data.get('type', ''),
@@ -472,6 +616,8 @@ CREATE TABLE IF NOT EXISTS reading_materials (
     difficulty VARCHAR(20),
     source_document VARCHAR(255),
     questions JSONB,
+    sources JSONB,
+    duplicate_ids JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -485,6 +631,8 @@ CREATE TABLE IF NOT EXISTS listening_materials (
     difficulty VARCHAR(20),
     source_document VARCHAR(255),
     questions JSONB,
+    sources JSONB,
+    duplicate_ids JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -532,17 +680,17 @@ CREATE INDEX IF NOT EXISTS idx_grammar_category ON grammar(category);
         if category == 'vocabulary':
             for word_id, word_data in data.items():
                 sql += f"INSERT INTO vocabulary (word, definition_en, definition_pt, level, category, examples, phonetic, part_of_speech, is_phrasal_verb, source_document, context) VALUES (\n"
-                sql += f"    '{word_data.get('word', '').replace(\"'\", \"''\")}',\n"
-                sql += f"    '{word_data.get('definition_en', '').replace(\"'\", \"''\")}',\n"
-                sql += f"    '{word_data.get('definition_pt', '').replace(\"'\", \"''\")}',\n"
-                sql += f"    '{word_data.get('level', '')}',\n"
-                sql += f"    '{word_data.get('category', '')}',\n"
-                sql += f"    '{json.dumps(word_data.get('examples', []))}',\n"
-                sql += f"    '{word_data.get('phonetic', '')}',\n"
-                sql += f"    '{word_data.get('part_of_speech', '')}',\n"
+                sql += f"    '{sql_escape(word_data.get('word', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('definition_en', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('definition_pt', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('level', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('category', ''))}',\n"
+                sql += f"    '{sql_escape(json.dumps(word_data.get('examples', [])))}',\n"
+                sql += f"    '{sql_escape(word_data.get('phonetic', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('part_of_speech', ''))}',\n"
                 sql += f"    {str(word_data.get('is_phrasal_verb', False)).lower()},\n"
-                sql += f"    '{word_data.get('source_document', '')}',\n"
-                sql += f"    '{word_data.get('context', '').replace(\"'\", \"''\")}'\n"
+                sql += f"    '{sql_escape(word_data.get('source_document', ''))}',\n"
+                sql += f"    '{sql_escape(word_data.get('context', ''))}'\n"
                 sql += f");\n\n"
         
         # Adicionar outras categorias conforme necessário
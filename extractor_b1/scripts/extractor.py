@@ -5,74 +5,448 @@ Extrai conteúdo bruto de PDFs, DOCXs e outros formatos
 """
 
 import os
+import re
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Tuple, TYPE_CHECKING
 from loguru import logger
 
-try:
-    from docling import DocumentConverter
+from scripts.document_model import CompactContent, load_content
+from scripts.native_parsers import NATIVE_PARSERS
+from scripts.supervisor import SupervisedPool, WorkerFailure
+from utils.extraction_cache import ExtractionCache
+from utils.manifest import MaterialManifest, MANIFEST_FILE
+from utils.ndjson import NDJSONWriter, RAW_EXTRACTION_FILE, iter_raw_extraction
+
+if TYPE_CHECKING:
     from docling.document import DoclingDocument
-except ImportError:
-    logger.error("Docling não encontrado. Instale com: pip install docling")
-    raise
+
+def load_document_converter():
+    """Importa o Docling sob demanda (o import e os modelos são caros)"""
+    try:
+        from docling import DocumentConverter
+    except ImportError:
+        logger.error("Docling não encontrado. Instale com: pip install docling")
+        raise
+    return DocumentConverter
+
+# Extrator mantido em cada processo do pool (um conversor Docling aquecido por worker)
+_worker_extractor = None
+
+def _init_extraction_worker(config, use_cache: bool):
+    """Inicializa o extrator do processo worker (sem nível: o mesmo pool atende todos os níveis)"""
+    global _worker_extractor
+    _worker_extractor = DocumentExtractor(config, None, max_workers=1, use_cache=use_cache)
+
+def _extract_in_worker(task: Tuple[Path, Optional[Tuple[int, int]]]) -> Dict[str, Any]:
+    """Extrai um arquivo (ou um intervalo de páginas dele) usando o extrator do processo worker
+    
+    Erros são propagados para que o pool supervisionado repita a tarefa.
+    """
+    file_path, page_range = task
+    if page_range:
+        return _worker_extractor.extract_shard(file_path, page_range)
+    logger.info(f"Processando: {file_path.name}")
+    return _worker_extractor.extract_document(file_path)
+
+def count_pdf_pages(file_path: Path) -> int:
+    """Conta as páginas de um PDF sem convertê-lo (pypdfium2 se disponível, senão pelos objetos /Page)"""
+    try:
+        import pypdfium2
+        pdf = pypdfium2.PdfDocument(str(file_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except Exception:
+        with open(file_path, 'rb') as f:
+            return len(re.findall(rb'/Type\s*/Page(?![a-zA-Z])', f.read()))
+
+def create_extraction_pool(config, workers: int, use_cache: bool = True) -> SupervisedPool:
+    """Pool supervisionado de workers de extração, compartilhável entre níveis"""
+    return SupervisedPool(
+        workers,
+        initializer=_init_extraction_worker,
+        initargs=(config, use_cache),
+        timeout=config.get_document_timeout(),
+        max_retries=config.get_max_retries(),
+        retry_delay=config.get_retry_delay(),
+        memory_limit_mb=config.get_worker_memory_limit_mb()
+    )
 
 class DocumentExtractor:
     """Extrator de documentos usando Docling"""
     
-    def __init__(self, config, level: str):
+    def __init__(self, config, level: Optional[str], max_workers: Optional[int] = None, use_cache: bool = True,
+                 pool: Optional[SupervisedPool] = None, cache: Optional[ExtractionCache] = None):
         self.config = config
         self.level = level
         self.materials_path = Path(f"materials/{level}")
         self.output_path = Path(f"output/raw_extraction/{level}")
         self.supported_formats = ['.pdf', '.docx', '.pptx', '.xlsx', '.html', '.txt']
         
+        # Formatos simples são lidos por parsers nativos; o Docling fica com os demais
+        native_formats = config.get_native_formats()
+        self.native_parsers = {ext: parser for ext, parser in NATIVE_PARSERS.items() if ext in native_formats}
+        
+        # Configurações de processamento paralelo (supervisão dos workers: create_extraction_pool)
+        self.max_workers = max_workers or config.get_max_workers()
+        self.isolate_documents = config.should_isolate_documents()
+        
+        # Pool persistente opcional (modo watch, vários níveis): workers e conversores ficam
+        # aquecidos entre execuções
+        self.pool = pool
+        
+        # PDFs grandes são divididos em intervalos de páginas convertidos em paralelo
+        self.max_file_size = config.get_max_file_size()
+        self.shard_threshold = config.get_shard_threshold_mb() * 1024 * 1024
+        self.shard_pages = config.get_shard_pages()
+        
+        # Cache de extração por hash de conteúdo
+        self.use_cache = use_cache and config.is_extraction_cache_enabled()
+        self.cache = (cache or ExtractionCache(config)) if self.use_cache else None
+        self.cache_keys_used = set()
+        
+        # Docling é carregado apenas quando um documento precisa ser convertido
+        self._converter = None
+        
+        # Extratores dos workers (sem nível) apenas convertem documentos, sem gravar saídas
+        if level is None:
+            return
+        
         # Criar diretórios se não existirem
         self.output_path.mkdir(parents=True, exist_ok=True)
         
-        # Inicializar Docling
-        self.converter = DocumentConverter()
-        
         logger.info(f"Extractor inicializado para nível {level}")
         logger.info(f"Pasta de materiais: {self.materials_path}")
         logger.info(f"Pasta de saída: {self.output_path}")
     
+    @property
+    def converter(self):
+        """Conversor Docling, criado na primeira conversão e reaproveitado depois"""
+        if self._converter is None:
+            logger.info("Carregando Docling...")
+            self._converter = load_document_converter()()
+        return self._converter
+    
     def extract_all(self) -> Dict[str, Any]:
         """Extrai todos os documentos do nível especificado"""
+        documents = {}
+        self.extract_to_ndjson(on_document=documents.__setitem__)
+        return documents
+    
+    def extract_to_ndjson(self, on_document=None, incremental: bool = False, on_extracted=None,
+                          retry_failed: bool = True) -> Dict[str, Any]:
+        """Extrai os documentos gravando um registro por documento assim que fica pronto
+        
+        Com incremental=True, só arquivos novos, alterados ou que falharam (se retry_failed)
+        são extraídos; os registros dos inalterados são copiados da extração anterior.
+        on_document recebe todos os registros gravados; on_extracted, apenas os extraídos
+        nesta execução.
+        """
+        output_file = self.output_path / RAW_EXTRACTION_FILE
+        summary = self.new_summary()
+        
+        files = {self.document_key(file_path): file_path for file_path in self.list_files()}
+        manifest = MaterialManifest(self.output_path / MANIFEST_FILE)
+        current = manifest.scan(files)
+        
+        reused = set()
+        previous_file = output_file.with_name(output_file.name + ".prev")
+        if incremental and output_file.exists():
+            diff = manifest.diff(current, retry_failed=retry_failed)
+            self.log_diff(diff)
+            reused = set(diff["unchanged"])
+            os.replace(output_file, previous_file)
+        
+        statuses = {}
+        try:
+            with NDJSONWriter(output_file) as writer:
+                for key, extracted_data in self.iter_merged(files, reused, previous_file):
+                    writer.write_document(key, extracted_data)
+                    self.update_summary(summary, extracted_data)
+                    if key not in reused:
+                        statuses[key] = extracted_data.get('status', 'failed')
+                        if on_extracted:
+                            on_extracted(key, extracted_data)
+                    if on_document:
+                        on_document(key, extracted_data)
+            
+            logger.info(f"✅ Extração bruta salva em: {output_file}")
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar extração bruta: {str(e)}")
+            raise
+        finally:
+            if previous_file.exists():
+                previous_file.unlink()
+        
+        manifest.update(current, statuses)
+        manifest.save()
+        
+        summary["reused_documents"] = len(reused)
+        self.save_summary(summary)
+        summary["output_file"] = str(output_file)
+        return summary
+    
+    def iter_merged(self, files: Dict[str, Path], reused: set, previous_file: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Intercala, na ordem dos arquivos, registros reaproveitados e documentos extraídos agora"""
+        extracted = self.iter_extract([file_path for key, file_path in files.items() if key not in reused])
+        previous = iter_raw_extraction(previous_file) if reused else iter([])
+        
+        for key, file_path in files.items():
+            if key not in reused:
+                yield next(extracted)
+                continue
+            
+            # A extração anterior está na mesma ordem; registros de arquivos removidos são pulados
+            for previous_key, document in previous:
+                if previous_key == key:
+                    break
+            else:
+                logger.warning(f"Registro anterior não encontrado, extraindo novamente: {key}")
+                document = self.extract_file(file_path)
+            
+            # Entradas de cache de registros reaproveitados continuam em uso (--prune-cache)
+            if document.get('cache_key'):
+                self.cache_keys_used.add(document['cache_key'])
+            yield key, document
+    
+    def diff_materials(self, retry_failed: bool = True) -> Dict[str, List[str]]:
+        """Compara os materiais atuais com o manifesto da última extração, sem extrair nada"""
+        files = {self.document_key(file_path): file_path for file_path in self.list_files()}
+        manifest = MaterialManifest(self.output_path / MANIFEST_FILE)
+        return manifest.diff(manifest.scan(files), retry_failed=retry_failed)
+    
+    def log_diff(self, diff: Dict[str, List[str]]):
+        """Registra nos logs o resultado da comparação com o manifesto"""
+        logger.info(
+            f"Materiais: {len(diff['added'])} novos, {len(diff['changed'])} alterados, "
+            f"{len(diff['removed'])} removidos, {len(diff['unchanged'])} inalterados"
+        )
+    
+    def document_key(self, file_path: Path) -> str:
+        """Chave do documento: caminho relativo à pasta de materiais"""
+        return file_path.relative_to(self.materials_path).as_posix()
+    
+    def list_files(self) -> List[Path]:
+        """Lista os arquivos suportados da pasta de materiais (incluindo subpastas), em ordem determinística"""
         if not self.materials_path.exists():
             logger.warning(f"Pasta de materiais não encontrada: {self.materials_path}")
-            return {}
+            return []
         
-        documents = {}
-        files_found = list(self.materials_path.glob("*"))
+        files_found = sorted(
+            (
+                file_path for file_path in self.materials_path.rglob("*")
+                if file_path.is_file() and not any(
+                    part.startswith('.') for part in file_path.relative_to(self.materials_path).parts
+                )
+            ),
+            key=self.document_key
+        )
         
         logger.info(f"Encontrados {len(files_found)} arquivos em {self.materials_path}")
         
+        files_to_extract = []
         for file_path in files_found:
             if file_path.suffix.lower() in self.supported_formats:
-                try:
-                    logger.info(f"Processando: {file_path.name}")
-                    extracted_data = self.extract_document(file_path)
-                    documents[file_path.name] = extracted_data
-                except Exception as e:
-                    logger.error(f"Erro ao processar {file_path.name}: {str(e)}")
-                    documents[file_path.name] = {
-                        "error": str(e),
-                        "status": "failed"
-                    }
+                files_to_extract.append(file_path)
             else:
-                logger.warning(f"Formato não suportado: {file_path.name}")
+                logger.warning(f"Formato não suportado: {self.document_key(file_path)}")
         
-        # Salvar extração bruta
-        self.save_raw_extraction(documents)
+        return files_to_extract
+    
+    def iter_extract(self, files: Optional[List[Path]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Extrai os documentos um a um, produzindo pares (caminho relativo, documento)"""
+        files_to_extract = self.list_files() if files is None else files
         
-        return documents
+        results = None
+        if self.max_workers > 1 or self.isolate_documents:
+            plans = [(file_path, self.plan_file(file_path)) for file_path in files_to_extract]
+            task_count = sum(len(plan) for _, plan in plans)
+            if task_count > 1 or (task_count and (self.isolate_documents or self.pool)):
+                results = self.extract_parallel(plans)
+        
+        if results is None:
+            results = ((file_path, self.extract_file(file_path)) for file_path in files_to_extract)
+        
+        for file_path, extracted_data in results:
+            if extracted_data.get('cache_key'):
+                self.cache_keys_used.add(extracted_data['cache_key'])
+            yield self.document_key(file_path), extracted_data
+    
+    def needs_docling(self, file_path: Path) -> bool:
+        """Verifica se o arquivo precisa do Docling (formatos sem parser nativo)"""
+        return file_path.suffix.lower() not in self.native_parsers
+    
+    def exceeds_max_size(self, file_path: Path) -> bool:
+        """Verifica se o arquivo ultrapassa extraction.max_file_size_mb"""
+        return file_path.stat().st_size > self.max_file_size
+    
+    def plan_file(self, file_path: Path) -> List[Tuple[Path, Optional[Tuple[int, int]]]]:
+        """Tarefas do pool para um arquivo; lista vazia = extrair no processo principal"""
+        if not self.needs_docling(file_path) or self.exceeds_max_size(file_path):
+            return []
+        
+        page_ranges = self.plan_shards(file_path)
+        if page_ranges is None:
+            return [(file_path, None)]
+        if not page_ranges:
+            return []
+        return [(file_path, page_range) for page_range in page_ranges]
+    
+    def plan_shards(self, file_path: Path) -> Optional[List[Tuple[int, int]]]:
+        """Intervalos de páginas (1-based, inclusivos) de um PDF grande
+        
+        Retorna None se o arquivo não deve ser dividido e [] se já está no cache.
+        """
+        if file_path.suffix.lower() != '.pdf' or file_path.stat().st_size < self.shard_threshold:
+            return None
+        
+        if self.cache and self.cache.contains(self.cache.make_key(file_path)):
+            return []
+        
+        page_count = count_pdf_pages(file_path)
+        if page_count <= self.shard_pages:
+            return None
+        
+        page_ranges = [
+            (start, min(start + self.shard_pages - 1, page_count))
+            for start in range(1, page_count + 1, self.shard_pages)
+        ]
+        logger.info(f"Dividindo {file_path.name} ({page_count} páginas) em {len(page_ranges)} partes")
+        return page_ranges
+    
+    def extract_parallel(self, plans: List[Tuple[Path, List[Tuple[Path, Optional[Tuple[int, int]]]]]]) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Extrai as tarefas Docling em um pool supervisionado, preservando a ordem dos arquivos
+        
+        Cada documento (ou parte de PDF) roda em um worker com timeout, limite de memória e
+        novas tentativas; uma falha definitiva vira um registro 'failed' sem interromper os
+        demais. Arquivos sem tarefas (parser nativo, cache, tamanho excedido) são tratados no
+        processo principal enquanto o pool trabalha.
+        """
+        tasks = [task for _, plan in plans for task in plan]
+        if self.pool is not None:
+            logger.info(f"Extração supervisionada: {self.pool.worker_count} processos, {len(tasks)} tarefas")
+            yield from self.collect_parallel(self.pool, plans, tasks)
+            return
+        
+        workers = min(self.max_workers, len(tasks))
+        logger.info(f"Extração supervisionada: {workers} processos, {len(tasks)} tarefas")
+        with self.create_pool(workers) as pool:
+            yield from self.collect_parallel(pool, plans, tasks)
+    
+    def create_pool(self, workers: int) -> SupervisedPool:
+        """Pool supervisionado de workers de extração para este extrator"""
+        return create_extraction_pool(self.config, workers, self.use_cache)
+    
+    def collect_parallel(self, pool: SupervisedPool, plans, tasks) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Submete as tarefas ao pool e produz os documentos na ordem dos arquivos"""
+        futures = iter([pool.submit(_extract_in_worker, task, description=self.describe_task(task)) for task in tasks])
+        
+        for file_path, plan in plans:
+            if not plan:
+                extracted_data = self.extract_file(file_path)
+            elif plan[0][1] is None:
+                extracted_data = self.collect_result(file_path, next(futures))
+            else:
+                extracted_data = self.collect_shards(file_path, [(task, next(futures)) for task in plan])
+            yield file_path, extracted_data
+    
+    def describe_task(self, task: Tuple[Path, Optional[Tuple[int, int]]]) -> str:
+        """Descrição de uma tarefa do pool para os logs"""
+        file_path, page_range = task
+        if page_range:
+            return f"{file_path.name} (páginas {page_range[0]}-{page_range[1]})"
+        return file_path.name
+    
+    def failure_record(self, failure: WorkerFailure, error: Optional[str] = None) -> Dict[str, Any]:
+        """Registro de falha gravado na extração bruta"""
+        return {
+            "error": error or failure.message,
+            "status": "failed",
+            "failure_reason": failure.reason,
+            "attempts": failure.attempts
+        }
+    
+    def collect_result(self, file_path: Path, future) -> Dict[str, Any]:
+        """Resultado de um documento convertido no pool"""
+        try:
+            return future.result()
+        except WorkerFailure as failure:
+            return self.failure_record(failure)
+    
+    def collect_shards(self, file_path: Path, shard_futures: List[Tuple[Any, Any]]) -> Dict[str, Any]:
+        """Reúne as partes de um PDF convertidas no pool (uma parte com falha invalida o documento)"""
+        shards = []
+        for task, future in shard_futures:
+            try:
+                shards.append(future.result())
+            except WorkerFailure as failure:
+                return self.failure_record(failure, f"{self.describe_task(task)}: {failure.message}")
+        return self.merge_shards(file_path, shards)
+    
+    def extract_file(self, file_path: Path) -> Dict[str, Any]:
+        """Extrai um arquivo, registrando falhas como entradas com status 'failed'"""
+        try:
+            logger.info(f"Processando: {file_path.name}")
+            return self.extract_document(file_path)
+        except Exception as e:
+            logger.error(f"Erro ao processar {file_path.name}: {str(e)}")
+            return {
+                "error": str(e),
+                "status": "failed"
+            }
     
     def extract_document(self, file_path: Path) -> Dict[str, Any]:
-        """Extrai um documento específico"""
+        """Extrai um documento específico, escolhendo entre parser nativo e Docling"""
+        if self.exceeds_max_size(file_path):
+            size_mb = file_path.stat().st_size / (1024 * 1024)
+            raise ValueError(f"Arquivo excede o limite de {self.max_file_size // (1024 * 1024)} MB ({size_mb:.1f} MB)")
+        
+        native_parser = self.native_parsers.get(file_path.suffix.lower())
+        if native_parser:
+            return self.extract_native(file_path, native_parser)
+        return self.extract_with_docling(file_path)
+    
+    def extract_native(self, file_path: Path, parser) -> Dict[str, Any]:
+        """Extrai formatos simples com parser nativo (milissegundos, sem cache)"""
+        try:
+            extracted_data = {
+                "filename": file_path.name,
+                "file_path": str(file_path),
+                "file_size": file_path.stat().st_size,
+                "file_type": file_path.suffix.lower(),
+                "status": "success",
+                "extractor": "native"
+            }
+            extracted_data.update(parser(file_path))
+            
+            logger.info(f"✅ Documento extraído com parser nativo: {file_path.name}")
+            return extracted_data
+            
+        except Exception as e:
+            logger.error(f"❌ Erro na extração de {file_path.name}: {str(e)}")
+            raise
+    
+    def extract_with_docling(self, file_path: Path) -> Dict[str, Any]:
+        """Extrai com Docling (reaproveitando o cache quando o arquivo não mudou)"""
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(file_path)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached.update({
+                    "content": load_content(cached.get('content', {})),
+                    "filename": file_path.name,
+                    "file_path": str(file_path),
+                    "cache_key": cache_key
+                })
+                logger.info(f"♻️ Documento recuperado do cache: {file_path.name}")
+                return cached
+        
         try:
             # Converter documento usando Docling
-            doc: DoclingDocument = self.converter.convert(str(file_path))
+            doc: "DoclingDocument" = self.converter.convert(str(file_path))
             
             # Extrair diferentes tipos de conteúdo
             extracted_data = {
@@ -81,6 +455,7 @@ class DocumentExtractor:
                 "file_size": file_path.stat().st_size,
                 "file_type": file_path.suffix.lower(),
                 "status": "success",
+                "extractor": "docling",
                 "metadata": self.extract_metadata(doc),
                 "content": self.extract_content(doc),
                 "tables": self.extract_tables(doc),
@@ -88,6 +463,10 @@ class DocumentExtractor:
                 "structure": self.extract_structure(doc)
             }
             
+            if self.cache:
+                self.cache.put(cache_key, extracted_data)
+                extracted_data["cache_key"] = cache_key
+            
             logger.info(f"✅ Documento extraído com sucesso: {file_path.name}")
             return extracted_data
             
@@ -95,7 +474,73 @@ class DocumentExtractor:
             logger.error(f"❌ Erro na extração de {file_path.name}: {str(e)}")
             raise
     
-    def extract_metadata(self, doc: DoclingDocument) -> Dict[str, Any]:
+    def extract_shard(self, file_path: Path, page_range: Tuple[int, int]) -> Dict[str, Any]:
+        """Converte um intervalo de páginas de um PDF (executado nos workers)"""
+        logger.info(f"Processando: {file_path.name} (páginas {page_range[0]}-{page_range[1]})")
+        doc: "DoclingDocument" = self.converter.convert(str(file_path), page_range=page_range)
+        return {
+            "status": "success",
+            "page_range": list(page_range),
+            "metadata": self.extract_metadata(doc),
+            "content": self.extract_content(doc),
+            "tables": self.extract_tables(doc),
+            "images": self.extract_images(doc),
+            "structure": self.extract_structure(doc)
+        }
+    
+    def merge_shards(self, file_path: Path, shards: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Reúne as partes de um PDF em um único documento, com numeração de páginas global"""
+        page_texts = []
+        tables = []
+        images = []
+        structure = {"headings": [], "sections": [], "lists": [], "footnotes": []}
+        
+        for shard in shards:
+            first_page, last_page = shard["page_range"]
+            content = load_content(shard["content"])
+            if isinstance(content, CompactContent):
+                page_texts.extend(content.page_texts())
+            
+            for table in shard["tables"]:
+                tables.append(dict(table, table_number=len(tables) + 1))
+            for image in shard["images"]:
+                images.append(dict(image, image_number=len(images) + 1))
+            
+            shard_structure = shard.get("structure") or {}
+            for heading in shard_structure.get("headings", []):
+                page = heading.get("page")
+                # Páginas relativas à parte são convertidas para a numeração do documento
+                if isinstance(page, int) and not first_page <= page <= last_page:
+                    page += first_page - 1
+                structure["headings"].append(dict(heading, page=page))
+            for key in ("sections", "lists", "footnotes"):
+                structure[key].extend(shard_structure.get(key, []))
+        
+        metadata = dict(shards[0]["metadata"], page_count=len(page_texts))
+        extracted_data = {
+            "filename": file_path.name,
+            "file_path": str(file_path),
+            "file_size": file_path.stat().st_size,
+            "file_type": file_path.suffix.lower(),
+            "status": "success",
+            "extractor": "docling",
+            "shards": len(shards),
+            "metadata": metadata,
+            "content": CompactContent.from_pages(page_texts),
+            "tables": tables,
+            "images": images,
+            "structure": structure
+        }
+        
+        if self.cache:
+            cache_key = self.cache.make_key(file_path)
+            self.cache.put(cache_key, extracted_data)
+            extracted_data["cache_key"] = cache_key
+        
+        logger.info(f"✅ Documento extraído com sucesso: {file_path.name} ({len(shards)} partes)")
+        return extracted_data
+    
+    def extract_metadata(self, doc: "DoclingDocument") -> Dict[str, Any]:
         """Extrai metadados do documento"""
         try:
             return {
@@ -110,43 +555,28 @@ class DocumentExtractor:
             logger.warning(f"Erro ao extrair metadados: {str(e)}")
             return {}
     
-    def extract_content(self, doc: DoclingDocument) -> Dict[str, Any]:
+    def extract_content(self, doc: "DoclingDocument") -> Dict[str, Any]:
         """Extrai conteúdo textual do documento"""
         try:
-            content = {
-                "full_text": "",
-                "pages": [],
-                "paragraphs": [],
-                "sentences": []
-            }
+            page_texts = []
             
             if hasattr(doc, 'pages'):
-                for i, page in enumerate(doc.pages):
+                for page in doc.pages:
                     page_text = ""
                     if hasattr(page, 'text'):
                         page_text = page.text
                     elif hasattr(page, 'content'):
                         page_text = str(page.content)
-                    
-                    content["pages"].append({
-                        "page_number": i + 1,
-                        "text": page_text,
-                        "word_count": len(page_text.split()) if page_text else 0
-                    })
-                    content["full_text"] += page_text + "\n"
+                    page_texts.append(page_text or "")
             
-            # Dividir em parágrafos e frases
-            if content["full_text"]:
-                content["paragraphs"] = [p.strip() for p in content["full_text"].split('\n\n') if p.strip()]
-                content["sentences"] = [s.strip() for s in content["full_text"].replace('\n', ' ').split('.') if s.strip()]
-            
-            return content
+            # Texto armazenado uma vez; páginas, parágrafos e frases viram spans
+            return CompactContent.from_pages(page_texts)
             
         except Exception as e:
             logger.warning(f"Erro ao extrair conteúdo: {str(e)}")
             return {"error": str(e)}
     
-    def extract_tables(self, doc: DoclingDocument) -> List[Dict[str, Any]]:
+    def extract_tables(self, doc: "DoclingDocument") -> List[Dict[str, Any]]:
         """Extrai tabelas do documento"""
         try:
             tables = []
@@ -178,7 +608,7 @@ class DocumentExtractor:
             logger.warning(f"Erro ao extrair tabelas: {str(e)}")
             return []
     
-    def extract_images(self, doc: DoclingDocument) -> List[Dict[str, Any]]:
+    def extract_images(self, doc: "DoclingDocument") -> List[Dict[str, Any]]:
         """Extrai informações sobre imagens"""
         try:
             images = []
@@ -199,7 +629,7 @@ class DocumentExtractor:
             logger.warning(f"Erro ao extrair imagens: {str(e)}")
             return []
     
-    def extract_structure(self, doc: DoclingDocument) -> Dict[str, Any]:
+    def extract_structure(self, doc: "DoclingDocument") -> Dict[str, Any]:
         """Extrai estrutura hierárquica do documento"""
         try:
             structure = {
@@ -241,32 +671,58 @@ class DocumentExtractor:
             return {}
     
     def save_raw_extraction(self, documents: Dict[str, Any]):
-        """Salva a extração bruta em arquivo JSON"""
-        output_file = self.output_path / "raw_extraction.json"
+        """Salva a extração bruta em arquivo NDJSON (um documento por linha)"""
+        output_file = self.output_path / RAW_EXTRACTION_FILE
+        summary = self.new_summary()
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(documents, f, indent=2, ensure_ascii=False, default=str)
+            with NDJSONWriter(output_file) as writer:
+                for key, extracted_data in documents.items():
+                    writer.write_document(key, extracted_data)
+                    self.update_summary(summary, extracted_data)
             
             logger.info(f"✅ Extração bruta salva em: {output_file}")
-            
-            # Salvar também um resumo
-            summary = {
-                "level": self.level,
-                "total_documents": len(documents),
-                "successful_extractions": len([d for d in documents.values() if d.get('status') == 'success']),
-                "failed_extractions": len([d for d in documents.values() if d.get('status') == 'failed']),
-                "file_types": list(set([d.get('file_type', 'unknown') for d in documents.values()])),
-                "total_pages": sum([len(d.get('content', {}).get('pages', [])) for d in documents.values() if d.get('status') == 'success']),
-                "total_words": sum([d.get('content', {}).get('full_text', '').count(' ') for d in documents.values() if d.get('status') == 'success'])
-            }
-            
-            summary_file = self.output_path / "extraction_summary.json"
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar extração bruta: {str(e)}")
+            raise
+        
+        self.save_summary(summary)
+    
+    def new_summary(self) -> Dict[str, Any]:
+        """Cria o resumo da extração, acumulado documento a documento"""
+        return {
+            "level": self.level,
+            "total_documents": 0,
+            "successful_extractions": 0,
+            "failed_extractions": 0,
+            "file_types": [],
+            "total_pages": 0,
+            "total_words": 0
+        }
+    
+    def update_summary(self, summary: Dict[str, Any], extracted_data: Dict[str, Any]):
+        """Acumula um documento no resumo da extração"""
+        summary["total_documents"] += 1
+        
+        file_type = extracted_data.get('file_type', 'unknown')
+        if file_type not in summary["file_types"]:
+            summary["file_types"].append(file_type)
+        
+        if extracted_data.get('status') == 'success':
+            content = load_content(extracted_data.get('content', {}))
+            summary["successful_extractions"] += 1
+            summary["total_pages"] += len(content.get('pages', []))
+            summary["total_words"] += content.get('full_text', '').count(' ')
+        elif extracted_data.get('status') == 'failed':
+            summary["failed_extractions"] += 1
+    
+    def save_summary(self, summary: Dict[str, Any]):
+        """Salva o resumo da extração"""
+        summary_file = self.output_path / "extraction_summary.json"
+        try:
             with open(summary_file, 'w', encoding='utf-8') as f:
                 json.dump(summary, f, indent=2, ensure_ascii=False)
             
             logger.info(f"✅ Resumo da extração salvo em: {summary_file}")
-            
         except Exception as e:
-            logger.error(f"❌ Erro ao salvar extração bruta: {str(e)}")
-            raise
+            logger.error(f"❌ Erro ao salvar resumo da extração: {str(e)}")
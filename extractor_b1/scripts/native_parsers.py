@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+⚡ PARSERS NATIVOS - FORMATOS SIMPLES SEM DOCLING
+Extraem TXT, HTML e DOCX com a biblioteca padrão, no mesmo formato do Docling
+"""
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Any, Callable
+
+from scripts.document_model import CompactContent
+
+def empty_structure() -> Dict[str, Any]:
+    """Estrutura vazia com as mesmas chaves de DocumentExtractor.extract_structure"""
+    return {
+        "headings": [],
+        "sections": [],
+        "lists": [],
+        "footnotes": []
+    }
+
+def build_table(table_number: int, rows: List[List[str]]) -> Dict[str, Any]:
+    """Monta uma tabela no formato de DocumentExtractor.extract_tables"""
+    return {
+        "table_number": table_number,
+        "rows": rows,
+        "columns": len(rows[0]) if rows else 0,
+        "data": rows
+    }
+
+def build_metadata(page_count: int, title: str = None, author: str = None,
+                   creation_date: str = None, modification_date: str = None) -> Dict[str, Any]:
+    """Monta os metadados no formato de DocumentExtractor.extract_metadata"""
+    return {
+        "title": title,
+        "author": author,
+        "language": None,
+        "page_count": page_count,
+        "creation_date": creation_date,
+        "modification_date": modification_date
+    }
+
+# =====================================================
+# TXT
+# =====================================================
+
+def parse_text(file_path: Path) -> Dict[str, Any]:
+    """Texto puro: páginas separadas por form feed (\\f)"""
+    text = Path(file_path).read_text(encoding='utf-8', errors='replace')
+    page_texts = text.split('\f')
+    
+    return {
+        "metadata": build_metadata(len(page_texts)),
+        "content": CompactContent.from_pages(page_texts),
+        "tables": [],
+        "images": [],
+        "structure": empty_structure()
+    }
+
+# =====================================================
+# HTML
+# =====================================================
+
+class _HTMLContentParser(HTMLParser):
+    """Coleta blocos de texto, cabeçalhos, listas, tabelas e imagens de um HTML"""
+    
+    BLOCK_TAGS = {'p', 'div', 'section', 'article', 'header', 'footer', 'li', 'blockquote',
+                  'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr', 'br', 'hr', 'table', 'ul', 'ol'}
+    SKIP_TAGS = {'script', 'style', 'head', 'noscript', 'template'}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self.current = []
+        self.title = None
+        self.headings = []
+        self.lists = []
+        self.tables = []
+        self.images = []
+        
+        self._skip_depth = 0
+        self._in_title = False
+        self._title_parts = []
+        self._heading_level = None
+        self._heading_parts = []
+        self._list_stack = []
+        self._item_parts = None
+        self._table_stack = []
+        self._cell_parts = None
+    
+    def flush_block(self):
+        text = re.sub(r'[ \t\r\n]+', ' ', "".join(self.current)).strip()
+        if text:
+            self.blocks.append(text)
+        self.current = []
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in self.SKIP_TAGS:
+            if tag == 'head':
+                return
+            self._skip_depth += 1
+            return
+        if tag == 'title':
+            self._in_title = True
+            return
+        if tag in self.BLOCK_TAGS:
+            self.flush_block()
+        
+        if re.fullmatch(r'h[1-6]', tag):
+            self._heading_level = int(tag[1])
+            self._heading_parts = []
+        elif tag in ('ul', 'ol'):
+            self._list_stack.append({"type": "ordered" if tag == 'ol' else "unordered", "items": []})
+        elif tag == 'li':
+            self._item_parts = []
+        elif tag == 'table':
+            self._table_stack.append([])
+        elif tag == 'tr' and self._table_stack:
+            self._table_stack[-1].append([])
+        elif tag in ('td', 'th'):
+            if "".join(self.current).strip():
+                self.current.append(" | ")
+            self._cell_parts = []
+        elif tag == 'img':
+            self.images.append({
+                "image_number": len(self.images) + 1,
+                "type": Path(attrs.get('src') or '').suffix.lstrip('.') or 'unknown',
+                "size": None,
+                "caption": attrs.get('title'),
+                "alt_text": attrs.get('alt')
+            })
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            if tag != 'head':
+                self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if tag == 'title':
+            self._in_title = False
+            self.title = "".join(self._title_parts).strip() or None
+            return
+        
+        if re.fullmatch(r'h[1-6]', tag) and self._heading_level:
+            text = " ".join("".join(self._heading_parts).split())
+            if text:
+                self.headings.append({"text": text, "level": self._heading_level, "page": 1})
+            self._heading_level = None
+        elif tag == 'li' and self._item_parts is not None:
+            text = " ".join("".join(self._item_parts).split())
+            if text and self._list_stack:
+                self._list_stack[-1]["items"].append(text)
+            self._item_parts = None
+        elif tag in ('ul', 'ol') and self._list_stack:
+            self.lists.append(self._list_stack.pop())
+        elif tag in ('td', 'th') and self._cell_parts is not None:
+            if self._table_stack and self._table_stack[-1]:
+                self._table_stack[-1][-1].append(" ".join("".join(self._cell_parts).split()))
+            self._cell_parts = None
+        elif tag == 'table' and self._table_stack:
+            rows = [row for row in self._table_stack.pop() if row]
+            if rows:
+                self.tables.append(build_table(len(self.tables) + 1, rows))
+        
+        if tag in self.BLOCK_TAGS:
+            self.flush_block()
+    
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+            return
+        if self._skip_depth:
+            return
+        
+        self.current.append(data)
+        if self._heading_level:
+            self._heading_parts.append(data)
+        if self._item_parts is not None:
+            self._item_parts.append(data)
+        if self._cell_parts is not None:
+            self._cell_parts.append(data)
+
+def parse_html(file_path: Path) -> Dict[str, Any]:
+    """HTML: cada bloco vira um parágrafo; cabeçalhos, listas e tabelas vão para a estrutura"""
+    parser = _HTMLContentParser()
+    parser.feed(Path(file_path).read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+    parser.flush_block()
+    
+    structure = empty_structure()
+    structure["headings"] = parser.headings
+    structure["lists"] = parser.lists
+    
+    return {
+        "metadata": build_metadata(1, title=parser.title),
+        "content": CompactContent.from_pages(["\n\n".join(parser.blocks)]),
+        "tables": parser.tables,
+        "images": parser.images,
+        "structure": structure
+    }
+
+# =====================================================
+# DOCX
+# =====================================================
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+CORE_NS = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+}
+
+def _docx_run_text(element) -> str:
+    """Texto de um parágrafo DOCX (w:t, tabulações e quebras de linha)"""
+    parts = []
+    for node in element.iter():
+        if node.tag == f"{W_NS}t" and node.text:
+            parts.append(node.text)
+        elif node.tag == f"{W_NS}tab":
+            parts.append("\t")
+        elif node.tag in (f"{W_NS}br", f"{W_NS}cr") and node.get(f"{W_NS}type") != "page":
+            parts.append("\n")
+    return "".join(parts)
+
+def _docx_has_page_break(element) -> bool:
+    """Verifica se o parágrafo contém quebra de página explícita"""
+    for node in element.iter(f"{W_NS}br"):
+        if node.get(f"{W_NS}type") == "page":
+            return True
+    return False
+
+def _docx_heading_level(paragraph) -> int:
+    """Nível do cabeçalho pelo estilo (Heading1, Titulo2, Title...); 0 se não for cabeçalho"""
+    style = paragraph.find(f"{W_NS}pPr/{W_NS}pStyle")
+    if style is None:
+        return 0
+    name = (style.get(f"{W_NS}val") or "").lower()
+    if name == "title":
+        return 1
+    match = re.match(r'(?:heading|ttulo|titulo)(\d)', name)
+    return int(match.group(1)) if match else 0
+
+def parse_docx(file_path: Path) -> Dict[str, Any]:
+    """DOCX: lê word/document.xml diretamente; quebras de página explícitas separam páginas"""
+    with zipfile.ZipFile(file_path) as archive:
+        document = ET.fromstring(archive.read("word/document.xml"))
+        core = ET.fromstring(archive.read("docProps/core.xml")) if "docProps/core.xml" in archive.namelist() else None
+    
+    body = document.find(f"{W_NS}body")
+    pages = [[]]
+    structure = empty_structure()
+    tables = []
+    current_list = None
+    
+    for block in (body if body is not None else []):
+        if block.tag == f"{W_NS}p":
+            text = _docx_run_text(block).strip()
+            is_list_item = block.find(f"{W_NS}pPr/{W_NS}numPr") is not None
+            
+            if text:
+                pages[-1].append(text)
+                level = _docx_heading_level(block)
+                if level:
+                    structure["headings"].append({"text": text, "level": level, "page": len(pages)})
+                
+                if is_list_item:
+                    if current_list is None:
+                        current_list = {"type": "unordered", "items": []}
+                        structure["lists"].append(current_list)
+                    current_list["items"].append(text)
+            
+            if not is_list_item:
+                current_list = None
+            if _docx_has_page_break(block):
+                pages.append([])
+        
+        elif block.tag == f"{W_NS}tbl":
+            rows = []
+            for row in block.iter(f"{W_NS}tr"):
+                cells = [" ".join(_docx_run_text(cell).split()) for cell in row.iter(f"{W_NS}tc")]
+                if cells:
+                    rows.append(cells)
+            if rows:
+                tables.append(build_table(len(tables) + 1, rows))
+                pages[-1].append("\n".join(" | ".join(row) for row in rows))
+            current_list = None
+    
+    metadata = build_metadata(len(pages))
+    if core is not None:
+        metadata.update({
+            "title": core.findtext("dc:title", namespaces=CORE_NS),
+            "author": core.findtext("dc:creator", namespaces=CORE_NS),
+            "language": core.findtext("dc:language", namespaces=CORE_NS),
+            "creation_date": core.findtext("dcterms:created", namespaces=CORE_NS),
+            "modification_date": core.findtext("dcterms:modified", namespaces=CORE_NS)
+        })
+    
+    return {
+        "metadata": metadata,
+        "content": CompactContent.from_pages(["\n\n".join(page) for page in pages]),
+        "tables": tables,
+        "images": [],
+        "structure": structure
+    }
+
+# Formato -> parser nativo
+NATIVE_PARSERS: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    ".txt": parse_text,
+    ".html": parse_html,
+    ".htm": parse_html,
+    ".docx": parse_docx,
+}
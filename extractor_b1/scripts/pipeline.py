@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🌊 PIPELINE EM STREAMING - ETAPAS SOBREPOSTAS
+Cada documento segue extração -> processamento -> validação assim que fica pronto;
+só a mesclagem final e a exportação esperam por todos os documentos
+"""
+
+import queue
+import threading
+from typing import Dict, List, Any, Optional
+from loguru import logger
+
+from scripts.extractor import DocumentExtractor
+from scripts.processor import DataProcessor
+from scripts.validator import DataValidator
+
+# Marca o fim do fluxo em uma fila
+_END = object()
+
+class _StageError:
+    """Exceção de uma etapa, repassada pelas filas até o consumidor final"""
+    
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+
+class StreamingPipeline:
+    """Extração, processamento e validação em threads ligadas por filas limitadas
+    
+    A extração (limitada pelo Docling, em workers) alimenta o processamento por regex,
+    que alimenta a validação por item. As filas têm capacidade
+    processing.pipeline_queue_size: se uma etapa atrasar, as anteriores esperam em vez
+    de acumular documentos em memória. A ordem dos documentos é preservada, então o
+    resultado é o mesmo da execução em etapas.
+    """
+    
+    def __init__(self, config, level: str, max_workers: Optional[int] = None, use_cache: bool = True,
+                 validate: bool = False, incremental: bool = False, pool=None, cache=None):
+        self.config = config
+        self.level = level
+        self.validate = validate
+        self.incremental = incremental
+        self.queue_size = config.get_pipeline_queue_size()
+        
+        self.extractor = DocumentExtractor(config, level, max_workers=max_workers, use_cache=use_cache,
+                                           pool=pool, cache=cache)
+        self.processor = DataProcessor(config, level)
+        self.validator = DataValidator(config, level) if validate else None
+        
+        self._stop = threading.Event()
+        
+        logger.info(f"Pipeline em streaming inicializado para nível {level} (filas: {self.queue_size})")
+    
+    def run(self) -> Dict[str, Any]:
+        """Executa o pipeline e retorna resumo da extração, dados processados e validação"""
+        extracted = queue.Queue(maxsize=self.queue_size)
+        processed = queue.Queue(maxsize=self.queue_size)
+        result: Dict[str, Any] = {}
+        
+        extract_thread = threading.Thread(target=self._extract_stage, args=(extracted, result),
+                                          name="pipeline-extract", daemon=True)
+        process_thread = threading.Thread(target=self._process_stage, args=(extracted, processed, extract_thread),
+                                          name="pipeline-process", daemon=True)
+        threads = [extract_thread, process_thread]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            processed_data, item_issues = self._validate_stage(processed, process_thread)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        
+        # Mesclagem final: únicos passos que esperam por todos os documentos
+        self.processor.collapse_duplicates(processed_data)
+        self.processor.save_processed_data(processed_data)
+        validation_results = self.validator.validate_all(processed_data, item_issues) if self.validate else None
+        
+        return {
+            "extraction_summary": result["extraction_summary"],
+            "processed_data": processed_data,
+            "validation_results": validation_results
+        }
+    
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Coloca um item na fila, desistindo se o pipeline for interrompido"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self, source: queue.Queue, producer: Optional[threading.Thread] = None) -> Any:
+        """Retira um item da fila; com o pipeline interrompido, encerra a etapa
+        
+        Se a thread produtora terminou e a fila está vazia, nada mais vai chegar:
+        retorna um _StageError em vez de esperar para sempre.
+        """
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                if producer is not None and not producer.is_alive() and source.empty():
+                    return _StageError(producer.name, RuntimeError(f"Thread {producer.name} terminou sem concluir"))
+        return _END
+    
+    def _extract_stage(self, output: queue.Queue, result: Dict[str, Any]):
+        """Etapa 1: extração, gravando o NDJSON e repassando cada documento"""
+        def forward(key: str, document_data: Dict[str, Any]):
+            if not self._put(output, (key, document_data)):
+                raise RuntimeError("Pipeline interrompido")
+        
+        try:
+            result["extraction_summary"] = self.extractor.extract_to_ndjson(
+                on_document=forward,
+                incremental=self.incremental
+            )
+            self._put(output, _END)
+        except BaseException as e:
+            self._put(output, _StageError("extração", e))
+    
+    def _process_stage(self, source: queue.Queue, output: queue.Queue, producer: threading.Thread):
+        """Etapa 2: processamento por documento (DataProcessor.process_one, como em process_stream)"""
+        try:
+            while True:
+                item = self._get(source, producer)
+                if item is _END or isinstance(item, _StageError):
+                    self._put(output, item)
+                    return
+                
+                filename, document_data = item
+                document_processed = self.processor.process_one(filename, document_data) or {}
+                
+                if not self._put(output, document_processed):
+                    return
+        except BaseException as e:
+            self._put(output, _StageError("processamento", e))
+    
+    def _validate_stage(self, source: queue.Queue, producer: threading.Thread):
+        """Etapa 3 (thread principal): validação por item e mesclagem na ordem dos documentos"""
+        processed_data = {category: {} for category in DataProcessor.CATEGORIES}
+        item_issues: Dict[str, Dict[str, List[str]]] = {}
+        
+        while True:
+            item = self._get(source, producer)
+            if item is _END:
+                return processed_data, item_issues
+            if isinstance(item, _StageError):
+                logger.error(f"❌ Erro na etapa de {item.stage}: {str(item.error)}")
+                raise item.error
+            
+            self.processor.merge_document(processed_data, item)
+            if self.validate:
+                for category, data in item.items():
+                    if data:
+                        item_issues.setdefault(category, {}).update(self.validator.validate_items(category, data))
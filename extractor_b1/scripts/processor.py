@@ -4,19 +4,132 @@
 Processa dados extraídos e os organiza em categorias estruturadas
 """
 
+import os
 import re
+import sys
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from loguru import logger
 
+from scripts.difficulty import DifficultyEngine
+from scripts.document_model import load_content
+from scripts.records import (CATEGORIES, PROCESSED_DATA_DIR, GrammarRule, ListeningDialogue, ReadingText, Record,
+                             SpeakingTopic, VocabularyEntry, WritingPrompt, frozen, json_default, load_processed_data)
+from scripts.section_splitter import iter_sections, split_sections
+from scripts.vocabulary_scanner import VocabularyScanner
+from utils.cefr_lexicon import CEFRLexicon, CEFR_LEVELS
+from utils.document_index import DocumentIndex, DOCUMENT_INDEX_FILE, document_items
+from utils.hashing import content_id, file_sha256, json_sha256
+from utils.keyword_matcher import KeywordMatcher, merge_category_names
+from utils.memo_cache import MemoCache, MemoStore
+from utils.ndjson import iter_raw_extraction
+from utils.similarity import near_duplicate_clusters, shingles
+
+# Processador mantido em cada processo do pool de processamento
+_worker_processor = None
+
+def _init_processing_worker(config, level: str):
+    """Inicializa o processador do processo worker (tabelas e padrões compilados uma vez)"""
+    global _worker_processor
+    _worker_processor = DataProcessor(config, level, max_workers=1)
+
+def _process_in_worker(filename: str, document_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Processa um documento usando o processador do processo worker"""
+    return _worker_processor.process_uncached(filename, document_data)
+
+# Módulos cujo código define o resultado do processamento (parte da chave da memoização)
+PROCESSING_MODULES = (
+    "scripts.processor", "scripts.difficulty", "scripts.document_model", "scripts.records",
+    "scripts.section_splitter", "scripts.vocabulary_scanner", "utils.cefr_lexicon", "utils.keyword_matcher"
+)
+
+def processing_code_hash() -> str:
+    """Hash do código-fonte dos módulos de processamento: alterar as regras invalida a memoização"""
+    return json_sha256([file_sha256(Path(sys.modules[name].__file__)) for name in PROCESSING_MODULES])
+
 class DataProcessor:
     """Processa dados extraídos e os estrutura para a plataforma"""
     
-    def __init__(self, config, level: str):
+    CATEGORIES = CATEGORIES
+    
+    # Categorias extraídas parágrafo a parágrafo (gramática é extraída por seções)
+    PARAGRAPH_CATEGORIES = [
+        "vocabulary",
+        "reading_materials",
+        "listening_materials",
+        "writing_prompts",
+        "speaking_topics"
+    ]
+    
+    # Tipo de material usado pelo motor de dificuldade em cada categoria
+    DIFFICULTY_KINDS = {
+        "reading_materials": "reading",
+        "listening_materials": "listening",
+        "speaking_topics": "speaking"
+    }
+    
+    # Categorias de textos longos em que cópias quase idênticas viram um único item
+    # (collapse_duplicates)
+    DUPLICATE_CATEGORIES = {
+        "reading_materials": "content",
+        "listening_materials": "content"
+    }
+    
+    # Perguntas e sugestões padrão: os mesmos valores imutáveis (frozen) em todos os itens
+    READING_QUESTIONS = frozen([
+        {"question": "What is the main topic of this text?", "type": "main_idea"},
+        {"question": "What are the key points mentioned?", "type": "key_points"}
+    ])
+    LISTENING_QUESTIONS = frozen([
+        {"question": "What is the conversation about?", "type": "topic"},
+        {"question": "What are the speakers discussing?", "type": "discussion"}
+    ])
+    SPEAKING_QUESTIONS = frozen([
+        {"question": "What is your opinion on this topic?", "type": "opinion"},
+        {"question": "Can you share a related experience?", "type": "experience"}
+    ])
+    WRITING_SUGGESTIONS = frozen([
+        "Use clear topic sentences",
+        "Include supporting details",
+        "Use appropriate vocabulary",
+        "Check grammar and spelling"
+    ])
+    
+    # Palavras-chave dos classificadores (a ordem das categorias é a prioridade)
+    VOCABULARY_CATEGORY_KEYWORDS = {
+        'family': ['family', 'mother', 'father', 'sister', 'brother'],
+        'food': ['food', 'eat', 'drink', 'cook', 'restaurant'],
+        'jobs': ['job', 'work', 'career', 'profession', 'employee'],
+        'weather': ['weather', 'climate', 'temperature', 'rain', 'sun'],
+        'transport': ['transport', 'car', 'bus', 'train', 'airplane'],
+        'house': ['house', 'home', 'room', 'furniture', 'kitchen']
+    }
+    
+    GRAMMAR_CATEGORY_KEYWORDS = {
+        'tenses': ['tense', 'present', 'past', 'future'],
+        'conditionals': ['conditional', 'if'],
+        'modals': ['modal', 'can', 'must', 'should'],
+        'prepositions': ['preposition', 'in', 'on', 'at']
+    }
+    
+    CONTENT_TYPE_KEYWORDS = {
+        'vocabulary': ['vocabulary', 'word', 'phrase', 'meaning'],
+        'grammar': ['grammar', 'rule', 'tense', 'verb'],
+        'reading_materials': ['read', 'text', 'passage', 'article']
+    }
+    
+    WRITING_PROMPT_KEYWORDS = ['write', 'describe', 'explain', 'discuss', 'compare']
+    SPEAKING_TOPIC_KEYWORDS = ['talk about', 'discuss', 'describe', 'opinion', 'experience']
+    
+    def __init__(self, config, level: str, max_workers: Optional[int] = None):
         self.config = config
         self.level = level
-        self.output_path = Path(f"output/processed_data/{level}")
+        # Processamento é só CPU: mais processos que núcleos apenas somam custo de pickling
+        self.max_workers = min(max_workers or config.get_processing_workers(), os.cpu_count() or 1)
+        self.output_path = PROCESSED_DATA_DIR / level
         self.output_path.mkdir(parents=True, exist_ok=True)
         
         # Padrões para identificação de conteúdo
@@ -28,6 +141,46 @@ class DataProcessor:
             'part_of_speech': r'\b(noun|verb|adjective|adverb|preposition|conjunction|pronoun)\b'
         }
         
+        # Todas as tabelas de palavras-chave em um único matcher (uma passada por texto);
+        # categorias extras de processing.vocabulary_categories/grammar_categories entram no fim
+        self.keyword_matcher = KeywordMatcher({
+            'vocabulary_category': merge_category_names(self.VOCABULARY_CATEGORY_KEYWORDS, config.get_vocabulary_categories()),
+            'grammar_category': merge_category_names(self.GRAMMAR_CATEGORY_KEYWORDS, config.get_grammar_categories()),
+            'content_type': self.CONTENT_TYPE_KEYWORDS,
+            'paragraph_type': {
+                'writing_prompts': self.WRITING_PROMPT_KEYWORDS,
+                'speaking_topics': self.SPEAKING_TOPIC_KEYWORDS
+            }
+        })
+        
+        # Extratores por parágrafo usados pelo roteador (route_paragraphs)
+        self.paragraph_builders = {
+            'vocabulary': self.build_vocabulary_items,
+            'reading_materials': self.build_reading_item,
+            'listening_materials': self.build_listening_item,
+            'writing_prompts': self.build_writing_item,
+            'speaking_topics': self.build_speaking_item
+        }
+        
+        # Léxico CEFR pré-compilado (--build-lexicon): nível real de cada palavra extraída
+        self.lexicon = CEFRLexicon.load(config.get_lexicon_index_file())
+        self.drop_off_level = config.should_drop_off_level_words()
+        
+        # Legibilidade em lote (NumPy) para leitura, listening e speaking; sem word_list,
+        # a cobertura usa as palavras do léxico até o nível
+        self.difficulty = DifficultyEngine.from_config(config, lexicon=self.lexicon, level=level)
+        
+        # Memoização (performance.enable_cache/cache_size/cache_ttl): classificações de textos
+        # repetidos em memória e o resultado de cada documento também em disco, entre execuções
+        # (performance.memo_store_ttl; sem expiração por padrão)
+        cache_file = config.get_memo_cache_file()
+        self.text_cache = MemoCache.from_config(config, "textos")
+        self.document_cache = MemoCache.from_config(config, "documentos", store=MemoStore(cache_file, config.get_memo_store_ttl()) if cache_file else None)
+        self._cache_fingerprint = None
+        
+        # Padrões de vocabulário compilados uma vez (palavras com menos de 3 letras são ignoradas)
+        self.vocabulary_scanner = VocabularyScanner(self.vocabulary_patterns, min_word_length=3)
+        
         self.grammar_patterns = {
             'rule_name': r'([A-Z][^:]+):',
             'example': r'["""]([^"""]+)["""]',
@@ -35,45 +188,343 @@ class DataProcessor:
             'structure': r'(\w+\s+\w+\s+\w+)'
         }
         
+        # Padrões de gramática compilados uma vez; exemplos também vêm após "i.e." e
+        # exercícios são linhas com lacunas (___) ou numeradas como "Exercise"
+        self.grammar_regex = {name: re.compile(pattern) for name, pattern in self.grammar_patterns.items()}
+        self.grammar_regex['inline_example'] = re.compile(r'\bi\.e\.?[ \t]+([^\n]+)')
+        self.grammar_regex['exercise'] = re.compile(r'_{3,}|^\s*(?:exercise|ex\.)\s*\d*', re.IGNORECASE)
+        
         logger.info(f"Processador inicializado para nível {level}")
     
     def process_all(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Processa todos os dados extraídos"""
-        processed_data = {
-            "vocabulary": {},
-            "grammar": {},
-            "exercises": {},
-            "reading_materials": {},
-            "listening_materials": {},
-            "writing_prompts": {},
-            "speaking_topics": {}
-        }
-        
-        for filename, document_data in raw_data.items():
-            if document_data.get('status') == 'success':
-                try:
-                    logger.info(f"Processando documento: {filename}")
-                    document_processed = self.process_document(filename, document_data)
-                    
-                    # Mesclar dados processados
-                    for category, data in document_processed.items():
-                        if data:
-                            if category not in processed_data:
-                                processed_data[category] = {}
-                            processed_data[category].update(data)
-                
-                except Exception as e:
-                    logger.error(f"Erro ao processar {filename}: {str(e)}")
+        return self.process_stream(raw_data.items())
+    
+    def process_file(self, raw_file: Path, incremental: bool = False) -> Dict[str, Any]:
+        """Processa a extração bruta lendo um documento por vez do arquivo NDJSON
+        
+        Com incremental=True só os documentos novos ou alterados desde o último
+        processamento são processados (veja process_incremental).
+        """
+        if incremental:
+            return self.process_incremental(raw_file)
+        return self.process_stream(iter_raw_extraction(raw_file))
+    
+    def process_stream(self, documents: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Processa documentos à medida que são lidos, sem manter a extração bruta em memória"""
+        processed_data = {category: {} for category in self.CATEGORIES}
+        index = DocumentIndex(self.output_path / DOCUMENT_INDEX_FILE)
+        index.documents = {}
+        
+        for filename, document_data, document_hash, document_processed in self.iter_processed(documents):
+            index.documents[filename] = {
+                "hash": document_hash,
+                "items": document_items(document_processed)
+            }
+            if document_processed is not None:
+                self.merge_document(processed_data, document_processed)
+        
+        self.collapse_duplicates(processed_data)
         
         # Salvar dados processados
         self.save_processed_data(processed_data)
+        index.save()
         
         return processed_data
     
+    def process_incremental(self, raw_file: Path) -> Dict[str, Any]:
+        """Reprocessa só os documentos novos ou alterados, retirando os itens dos removidos
+        
+        O índice de documentos guarda o hash de cada registro da extração bruta e as chaves
+        dos itens que ele produziu. Itens de documentos alterados ou removidos são
+        substituídos ou retirados nos dados salvos e só as categorias afetadas são
+        regravadas. Quando uma chave também vem de outro documento (ex.: a mesma palavra
+        em duas listas), vale o último documento, como na execução completa; se esse
+        documento não foi reprocessado e não era o dono anterior, ele é processado de novo.
+        O resultado é o mesmo de processar tudo.
+        """
+        index = DocumentIndex(self.output_path / DOCUMENT_INDEX_FILE)
+        if not index.documents:
+            logger.info("Índice de documentos ausente, processando tudo")
+            return self.process_file(raw_file)
+        
+        old_documents = index.documents
+        old_producers = index.producers()
+        
+        # Documentos novos ou alterados são processados; os demais mantêm seus itens
+        outputs: Dict[str, Dict[str, Any]] = {}
+        new_documents: Dict[str, Dict[str, Any]] = {}
+        
+        def changed_documents():
+            for filename, document_data in iter_raw_extraction(raw_file):
+                document_hash = json_sha256(document_data)
+                previous = old_documents.get(filename)
+                if previous and previous.get("hash") == document_hash:
+                    new_documents[filename] = previous
+                    continue
+                new_documents[filename] = {"hash": document_hash, "items": {}}
+                yield filename, document_data
+        
+        for filename, document_data, _, document_processed in self.iter_processed(changed_documents()):
+            outputs[filename] = document_processed or {}
+            new_documents[filename]["items"] = document_items(document_processed)
+        
+        removed = [key for key in old_documents if key not in new_documents]
+        if not outputs and not removed:
+            logger.info("♻️ Nenhum documento alterado, dados processados mantidos")
+            return self.load_processed_data()
+        
+        logger.info(f"♻️ Processamento incremental: {len(outputs)} documentos processados, {len(removed)} removidos")
+        
+        index.documents = new_documents
+        new_producers = index.producers()
+        
+        # Chaves afetadas: itens antigos e novos dos documentos alterados ou removidos
+        affected: Dict[str, set] = {}
+        for key in list(outputs) + removed:
+            for entry in (old_documents.get(key), new_documents.get(key)):
+                for category, item_keys in (entry or {}).get("items", {}).items():
+                    affected.setdefault(category, set()).update(item_keys)
+        
+        # Dono de cada chave afetada = último documento que a produz
+        owners: Dict[str, Dict[str, Optional[str]]] = {}
+        stale_owners = set()
+        for category, item_keys in affected.items():
+            owners[category] = {}
+            for item_key in item_keys:
+                owner = (new_producers.get(category, {}).get(item_key) or [None])[-1]
+                previous_owner = (old_producers.get(category, {}).get(item_key) or [None])[-1]
+                owners[category][item_key] = owner
+                if owner is not None and owner not in outputs and owner != previous_owner:
+                    stale_owners.add(owner)
+        
+        if stale_owners:
+            for filename, document_data, _, document_processed in self.iter_processed(
+                (filename, document_data) for filename, document_data in iter_raw_extraction(raw_file)
+                if filename in stale_owners
+            ):
+                outputs[filename] = document_processed or {}
+        
+        processed_data = self.load_processed_data()
+        
+        # Cópias retiradas por collapse_duplicates não estão nos dados salvos: os documentos
+        # que as produziram são processados de novo (em geral servidos pela memoização)
+        collapsed_owners = set()
+        for category in affected:
+            if category not in self.DUPLICATE_CATEGORIES:
+                continue
+            previous = processed_data.get(category, {})
+            for item_key, producers in new_producers.get(category, {}).items():
+                owner = producers[-1]
+                if item_key in previous or (item_key in affected[category] and owner in outputs):
+                    continue
+                affected[category].add(item_key)
+                owners[category][item_key] = owner
+                if owner not in outputs:
+                    collapsed_owners.add(owner)
+        if collapsed_owners:
+            for filename, document_data, _, document_processed in self.iter_processed(
+                (filename, document_data) for filename, document_data in iter_raw_extraction(raw_file)
+                if filename in collapsed_owners
+            ):
+                outputs[filename] = document_processed or {}
+        
+        try:
+            self.rebuild_categories(processed_data, affected, owners, outputs, new_documents)
+        except KeyError as e:
+            logger.warning(f"Dados processados salvos incompletos ({str(e)}), processando tudo")
+            return self.process_file(raw_file)
+        
+        # Categorias reconstruídas têm todas as cópias de novo; as demais já estão reunidas
+        self.collapse_duplicates(processed_data, categories=affected)
+        
+        self.save_processed_data(processed_data, categories=affected)
+        index.save()
+        
+        return processed_data
+    
+    def rebuild_categories(self, processed_data: Dict[str, Any], affected: Dict[str, set],
+                           owners: Dict[str, Dict[str, Optional[str]]], outputs: Dict[str, Dict[str, Any]],
+                           documents: Dict[str, Dict[str, Any]]):
+        """Reconstrói as categorias afetadas na ordem dos documentos (mesma ordem de chaves
+        da execução completa), reaproveitando os valores salvos das chaves não afetadas"""
+        for category, item_keys in affected.items():
+            previous = processed_data.get(category, {})
+            rebuilt = {}
+            for key, entry in documents.items():
+                for item_key in entry.get("items", {}).get(category, []):
+                    if item_key in rebuilt:
+                        continue
+                    owner = owners[category].get(item_key)
+                    if item_key in item_keys and owner in outputs:
+                        rebuilt[item_key] = outputs[owner][category][item_key]
+                    else:
+                        rebuilt[item_key] = previous[item_key]
+            processed_data[category] = rebuilt
+    
+    def iter_processed(self, documents: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any], str, Optional[Dict[str, Any]]]]:
+        """Processa documentos e os devolve na ordem de entrada com os dados brutos e o hash
+        do registro (processado = None quando ignorado ou com erro)
+        
+        O hash é calculado uma vez e serve à memoização e ao índice de documentos.
+        
+        Com processing.max_workers > 1 os documentos são processados em um pool de
+        processos; os resultados continuam saindo na ordem dos documentos, então a
+        mesclagem é idêntica à da execução serial. Poucos documentos ficam em andamento
+        por vez, preservando a leitura em streaming do NDJSON.
+        """
+        if self.max_workers <= 1:
+            for filename, document_data in documents:
+                document_hash = json_sha256(document_data)
+                yield filename, document_data, document_hash, self.process_one(filename, document_data, document_hash)
+            return
+        
+        # Documentos memoizados não vão para o pool; os demais são memoizados ao voltar
+        def finish(entry):
+            filename, document_data, document_hash, document_processed, future = entry
+            if future is not None:
+                document_processed = future.result()
+                if document_processed is not None:
+                    self.document_cache.put(self.document_cache_key(filename, document_hash), document_processed)
+            return filename, document_data, document_hash, document_processed
+        
+        with ProcessPoolExecutor(self.max_workers, initializer=_init_processing_worker,
+                                 initargs=(self.config, self.level)) as pool:
+            pending = deque()
+            for filename, document_data in documents:
+                document_hash = json_sha256(document_data)
+                document_processed = future = None
+                if document_data.get('status') == 'success':
+                    document_processed = self.document_cache.get(self.document_cache_key(filename, document_hash))
+                    if document_processed is None:
+                        future = pool.submit(_process_in_worker, filename, document_data)
+                pending.append((filename, document_data, document_hash, document_processed, future))
+                if len(pending) >= self.max_workers * 2:
+                    yield finish(pending.popleft())
+            
+            while pending:
+                yield finish(pending.popleft())
+    
+    def document_cache_key(self, filename: str, document_hash: str) -> Optional[str]:
+        """Chave da memoização de um documento: chave do documento (origem e IDs dos itens) +
+        hash do registro bruto + nível, configuração de processamento, léxico e código
+        (None com o cache desabilitado)"""
+        if not self.document_cache.enabled:
+            return None
+        if self._cache_fingerprint is None:
+            data_files = [self.config.get_lexicon_index_file(), self.config.get_difficulty_settings().get('word_list')]
+            self._cache_fingerprint = json_sha256({
+                "level": self.level,
+                "processing": self.config.get_processing_config(),
+                "data_files": [file_sha256(Path(path)) if path and Path(path).exists() else None for path in data_files],
+                "code": processing_code_hash()
+            })
+        return f"{self._cache_fingerprint}:{filename}:{document_hash}"
+    
+    def process_one(self, filename: str, document_data: Dict[str, Any],
+                    document_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Processa um documento extraído com sucesso; erros são registrados e resultam em None
+        
+        O resultado é memoizado pelo conteúdo do registro (document_cache): um documento
+        inalterado desde a última execução não é processado de novo.
+        """
+        if document_data.get('status') != 'success':
+            return None
+        
+        key = None
+        if self.document_cache.enabled:
+            key = self.document_cache_key(filename, document_hash or json_sha256(document_data))
+        document_processed = self.document_cache.get(key)
+        if document_processed is None:
+            document_processed = self.process_uncached(filename, document_data)
+            if document_processed is not None:
+                self.document_cache.put(key, document_processed)
+        return document_processed
+    
+    def process_uncached(self, filename: str, document_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Processa um documento sem consultar a memoização"""
+        try:
+            logger.info(f"Processando documento: {filename}")
+            return self.process_document(filename, document_data)
+        except Exception as e:
+            logger.error(f"Erro ao processar {filename}: {str(e)}")
+            return None
+    
+    def merge_document(self, processed_data: Dict[str, Any], document_processed: Dict[str, Any]):
+        """Mescla os dados processados de um documento no conjunto do nível"""
+        for category, data in document_processed.items():
+            if data:
+                if category not in processed_data:
+                    processed_data[category] = {}
+                processed_data[category].update(data)
+    
+    def collapse_duplicates(self, processed_data: Dict[str, Any], categories: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Reúne quase duplicatas de leitura e listening (o mesmo texto em vários documentos)
+        
+        Textos com similaridade de Jaccard >= validation.duplicate_threshold (MinHash + LSH
+        sobre os pares de palavras) formam um grupo; fica o primeiro item, com ``sources``
+        (documentos de origem do grupo) e ``duplicate_ids`` (itens retirados). Deve receber
+        as categorias completas, com todas as cópias (``categories`` limita as categorias
+        reunidas). Os registros dos documentos não são alterados.
+        """
+        if not self.config.should_collapse_duplicates():
+            return processed_data
+        threshold = min(self.config.get_duplicate_threshold(), 1.0)
+        categories = set(categories) if categories is not None else set(self.DUPLICATE_CATEGORIES)
+        
+        for category, field in self.DUPLICATE_CATEGORIES.items():
+            items = processed_data.get(category)
+            if category not in categories or not items:
+                continue
+            
+            clusters = near_duplicate_clusters(
+                {item_id: shingles(item.get(field) or '') for item_id, item in items.items()},
+                threshold, self.config.get_minhash_permutations()
+            )
+            groups = {cluster[0]: cluster for cluster in clusters}
+            removed = {item_id for cluster in clusters for item_id in cluster[1:]}
+            
+            collapsed = {}
+            for item_id, item in items.items():
+                if item_id in removed:
+                    continue
+                cluster = groups.get(item_id)
+                if cluster is not None:
+                    sources = list(dict.fromkeys(items[member].get('source_document', '') for member in cluster))
+                    item = self.replace_item(item, sources=sources, duplicate_ids=cluster[1:])
+                elif 'sources' in item or 'duplicate_ids' in item:
+                    # Item que já foi reunido e não tem mais cópias
+                    item = self.replace_item(item, sources=None, duplicate_ids=None)
+                collapsed[item_id] = item
+            
+            if removed:
+                logger.info(f"♻️ {category}: {len(removed)} quase duplicatas reunidas em {len(clusters)} itens")
+            processed_data[category] = collapsed
+        
+        return processed_data
+    
+    def replace_item(self, item: Any, **fields: Any) -> Any:
+        """Cópia de um item (registro ou dicionário) com campos alterados (None retira o campo)"""
+        if isinstance(item, Record):
+            return item.replace(**fields)
+        item = dict(item)
+        for key, value in fields.items():
+            if value is None:
+                item.pop(key, None)
+            else:
+                item[key] = value
+        return item
+    
     def process_document(self, filename: str, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Processa um documento específico"""
         processed = {}
         
+        # Conteúdo compacto (spans) é exposto com a mesma interface de dicionário; a origem
+        # dos itens é a chave do documento (caminho relativo), única mesmo com nomes repetidos
+        # em subpastas
+        document_data = dict(document_data, content=load_content(document_data.get('content', {})),
+                             source_document=filename)
+        
         # Identificar tipo de documento baseado no nome
         if 'vocabulary' in filename.lower() or 'vocab' in filename.lower():
             processed['vocabulary'] = self.extract_vocabulary(document_data)
@@ -95,29 +546,7 @@ class DataProcessor:
     
     def extract_vocabulary(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai vocabulário do documento"""
-        vocabulary = {}
-        content = document_data.get('content', {})
-        full_text = content.get('full_text', '')
-        
-        # Processar parágrafos para encontrar vocabulário
-        for paragraph in content.get('paragraphs', []):
-            # Procurar por padrões de palavra-definição
-            matches = re.findall(self.vocabulary_patterns['word_definition'], paragraph)
-            for word, definition in matches:
-                if len(word) > 2:  # Filtrar palavras muito curtas
-                    vocabulary[word.lower()] = {
-                        "word": word.strip(),
-                        "definition_en": definition.strip(),
-                        "definition_pt": "",  # Será preenchido posteriormente
-                        "level": self.level,
-                        "category": self.identify_vocabulary_category(word, definition),
-                        "examples": self.extract_examples(paragraph),
-                        "phonetic": self.extract_phonetic(paragraph),
-                        "part_of_speech": self.extract_part_of_speech(paragraph),
-                        "is_phrasal_verb": ' ' in word,
-                        "source_document": document_data.get('filename', ''),
-                        "context": paragraph[:200] + "..." if len(paragraph) > 200 else paragraph
-                    }
+        vocabulary = self.route_paragraphs(document_data, ['vocabulary'])['vocabulary']
         
         # Processar tabelas para vocabulário estruturado
         for table in document_data.get('tables', []):
@@ -133,203 +562,269 @@ class DataProcessor:
         content = document_data.get('content', {})
         full_text = content.get('full_text', '')
         
-        # Processar por seções
-        sections = self.split_into_sections(full_text)
-        
-        for section_name, section_content in sections.items():
-            if section_name and len(section_name) > 3:
-                grammar[section_name] = {
-                    "rule_name": section_name.strip(),
-                    "category": self.identify_grammar_category(section_name),
-                    "level": self.level,
-                    "description": self.extract_grammar_description(section_content),
-                    "examples": self.extract_grammar_examples(section_content),
-                    "rules": self.extract_grammar_rules(section_content),
-                    "exercises": self.extract_grammar_exercises(section_content),
-                    "source_document": document_data.get('filename', ''),
-                    "context": section_content[:300] + "..." if len(section_content) > 300 else section_content
-                }
+        # Processar por seções (spans sobre o texto; só o que é guardado é fatiado)
+        for section_name, start, end in iter_sections(full_text):
+            if len(section_name) > 3 and end > start:
+                section_content = full_text[start:end]
+                grammar[section_name] = GrammarRule(
+                    rule_name=section_name,
+                    category=self.identify_grammar_category(section_name),
+                    level=self.level,
+                    description=self.extract_grammar_description(section_content),
+                    examples=self.extract_grammar_examples(section_content),
+                    rules=self.extract_grammar_rules(section_content),
+                    exercises=self.extract_grammar_exercises(section_content),
+                    source_document=self.document_source(document_data),
+                    context=section_content[:300] + "..." if len(section_content) > 300 else section_content
+                )
         
         logger.info(f"✅ Gramática extraída: {len(grammar)} regras")
         return grammar
     
     def extract_reading_materials(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai materiais de leitura"""
-        reading = {}
-        content = document_data.get('content', {})
-        
-        # Identificar textos de leitura
-        paragraphs = content.get('paragraphs', [])
-        for i, paragraph in enumerate(paragraphs):
-            if len(paragraph) > 100:  # Textos longos são candidatos a leitura
-                reading[f"text_{i+1}"] = {
-                    "title": f"Reading Text {i+1}",
-                    "content": paragraph,
-                    "word_count": len(paragraph.split()),
-                    "level": self.level,
-                    "category": "reading_comprehension",
-                    "difficulty": self.assess_reading_difficulty(paragraph),
-                    "source_document": document_data.get('filename', ''),
-                    "questions": self.generate_reading_questions(paragraph)
-                }
-        
-        return reading
+        return self.route_paragraphs(document_data, ['reading_materials'])['reading_materials']
     
     def extract_listening_materials(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai materiais de listening"""
-        listening = {}
-        content = document_data.get('content', {})
-        
-        # Identificar diálogos e conversas
-        paragraphs = content.get('paragraphs', [])
-        for i, paragraph in enumerate(paragraphs):
-            if self.is_dialogue(paragraph):
-                listening[f"dialogue_{i+1}"] = {
-                    "title": f"Listening Dialogue {i+1}",
-                    "content": paragraph,
-                    "type": "dialogue",
-                    "level": self.level,
-                    "category": "listening_comprehension",
-                    "difficulty": self.assess_listening_difficulty(paragraph),
-                    "source_document": document_data.get('filename', ''),
-                    "questions": self.generate_listening_questions(paragraph)
-                }
-        
-        return listening
+        return self.route_paragraphs(document_data, ['listening_materials'])['listening_materials']
     
     def extract_writing_prompts(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai prompts de escrita"""
-        writing = {}
-        content = document_data.get('content', {})
-        
-        # Identificar tópicos de escrita
-        paragraphs = content.get('paragraphs', [])
-        for i, paragraph in enumerate(paragraphs):
-            if self.is_writing_prompt(paragraph):
-                writing[f"prompt_{i+1}"] = {
-                    "title": f"Writing Prompt {i+1}",
-                    "prompt": paragraph,
-                    "type": "writing_task",
-                    "level": self.level,
-                    "category": "writing_practice",
-                    "word_limit": self.extract_word_limit(paragraph),
-                    "source_document": document_data.get('filename', ''),
-                    "suggestions": self.generate_writing_suggestions(paragraph)
-                }
-        
-        return writing
+        return self.route_paragraphs(document_data, ['writing_prompts'])['writing_prompts']
     
     def extract_speaking_topics(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extrai tópicos de speaking"""
-        speaking = {}
-        content = document_data.get('content', {})
-        
-        # Identificar tópicos de conversa
-        paragraphs = content.get('paragraphs', [])
-        for i, paragraph in enumerate(paragraphs):
-            if self.is_speaking_topic(paragraph):
-                speaking[f"topic_{i+1}"] = {
-                    "title": f"Speaking Topic {i+1}",
-                    "topic": paragraph,
-                    "type": "conversation_topic",
-                    "level": self.level,
-                    "category": "speaking_practice",
-                    "difficulty": self.assess_speaking_difficulty(paragraph),
-                    "source_document": document_data.get('filename', ''),
-                    "questions": self.generate_speaking_questions(paragraph)
-                }
-        
-        return speaking
+        return self.route_paragraphs(document_data, ['speaking_topics'])['speaking_topics']
     
     def auto_identify_content(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Identifica automaticamente o tipo de conteúdo"""
+        """Identifica automaticamente o tipo de conteúdo
+        
+        Materiais mistos (planos de aula) rendem itens de várias categorias: os parágrafos
+        são percorridos uma única vez e cada um vai para todos os extratores interessados.
+        """
         content = document_data.get('content', {})
-        full_text = content.get('full_text', '').lower()
+        full_text = content.get('full_text', '')
+        
+        # Identificar por palavras-chave (uma passada pelo texto para todos os tipos);
+        # listening, escrita e speaking são reconhecidos parágrafo a parágrafo
+        content_types = self.keyword_matcher.labels(full_text, 'content_type')
+        categories = [
+            category for category in self.PARAGRAPH_CATEGORIES
+            if category in content_types or category not in self.CONTENT_TYPE_KEYWORDS
+        ]
         
-        identified = {}
+        identified = self.route_paragraphs(document_data, categories)
         
-        # Identificar por palavras-chave
-        if any(word in full_text for word in ['vocabulary', 'word', 'phrase', 'meaning']):
-            identified['vocabulary'] = self.extract_vocabulary(document_data)
+        if 'vocabulary' in identified:
+            for table in document_data.get('tables', []):
+                identified['vocabulary'].update(self.process_vocabulary_table(table))
         
-        if any(word in full_text for word in ['grammar', 'rule', 'tense', 'verb']):
+        if 'grammar' in content_types:
             identified['grammar'] = self.extract_grammar(document_data)
         
-        if any(word in full_text for word in ['read', 'text', 'passage', 'article']):
-            identified['reading_materials'] = self.extract_reading_materials(document_data)
+        return {category: identified[category] for category in self.CATEGORIES if category in identified}
+    
+    def document_source(self, document_data: Dict[str, Any]) -> str:
+        """Origem dos itens de um documento: a chave do documento (caminho relativo à pasta
+        de materiais) definida em process_document, ou o nome do arquivo"""
+        return document_data.get('source_document') or document_data.get('filename', '')
+    
+    def route_paragraphs(self, document_data: Dict[str, Any], categories: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Percorre os parágrafos uma vez, entregando cada um aos extratores das categorias pedidas
+        
+        Itens de parágrafo têm IDs estáveis derivados do documento e do conteúdo
+        (content_id), então itens de documentos diferentes nunca colidem na mesclagem.
+        """
+        categories = [category for category in self.PARAGRAPH_CATEGORIES if category in categories]
+        routed = {category: {} for category in categories}
+        if not categories:
+            return routed
+        
+        content = document_data.get('content', {})
+        source = self.document_source(document_data)
+        
+        # Dificuldade é calculada em lote, com todos os candidatos do documento
+        pending: List[Tuple[Dict[str, Any], str, str]] = []
+        
+        for i, paragraph in enumerate(content.get('paragraphs', [])):
+            for category in self.classify_paragraph(paragraph, categories):
+                items = self.paragraph_builders[category](i, paragraph, source)
+                routed[category].update(items)
+                if category in self.DIFFICULTY_KINDS:
+                    pending.extend((item, paragraph, self.DIFFICULTY_KINDS[category]) for item in items.values())
+        
+        if pending:
+            labels = self.difficulty.assess([text for _, text, _ in pending], [kind for _, _, kind in pending])
+            for (item, _, _), label in zip(pending, labels):
+                item["difficulty"] = label
+        
+        return routed
+    
+    def classify_paragraph(self, paragraph: str, categories: Iterable[str]) -> List[str]:
+        """Categorias (entre as pedidas) a que um parágrafo pode contribuir"""
+        prompt_types = None
+        matched = []
+        for category in categories:
+            if category in ('writing_prompts', 'speaking_topics'):
+                # Uma única varredura de palavras-chave serve a escrita e speaking
+                if prompt_types is None:
+                    prompt_types = self.keyword_matcher.labels(paragraph, 'paragraph_type')
+                if category in prompt_types:
+                    matched.append(category)
+            elif category == 'reading_materials':
+                if len(paragraph) > 100:  # Textos longos são candidatos a leitura
+                    matched.append(category)
+            elif category == 'listening_materials':
+                if self.is_dialogue(paragraph):
+                    matched.append(category)
+            else:
+                matched.append(category)
+        return matched
+    
+    def build_vocabulary_items(self, index: int, paragraph: str, source: str) -> Dict[str, Any]:
+        """Vocabulário de um parágrafo (uma varredura; exemplos, fonética e classe
+        gramatical são do parágrafo, não de cada palavra)"""
+        scan = self.vocabulary_scanner.scan(paragraph)
+        if scan is None:
+            return {}
+        
+        # Categorias de todas as definições do parágrafo em uma passada de palavras-chave
+        categories = self.keyword_matcher.first_in_spans(paragraph, scan.definition_spans, 'vocabulary_category', 'general')
         
-        return identified
+        vocabulary = {}
+        examples = frozen(scan.examples)  # Uma tupla por parágrafo, compartilhada pelas palavras
+        for (word, definition), category in zip(scan.pairs, categories):
+            vocabulary[word.lower()] = VocabularyEntry(
+                word=word.strip(),
+                definition_en=definition.strip(),
+                definition_pt="",  # Será preenchido posteriormente
+                level=self.level,
+                category=category,
+                examples=examples,
+                phonetic=scan.phonetic,
+                part_of_speech=scan.part_of_speech,
+                is_phrasal_verb=' ' in word,
+                source_document=source,
+                context=scan.context
+            )
+        return self.apply_lexicon(vocabulary)
+    
+    def build_reading_item(self, index: int, paragraph: str, source: str) -> Dict[str, Any]:
+        """Texto de leitura a partir de um parágrafo longo"""
+        return {
+            content_id("text", source, paragraph): ReadingText(
+                title=f"Reading Text {index+1}",
+                content=paragraph,
+                word_count=len(paragraph.split()),
+                level=self.level,
+                category="reading_comprehension",
+                difficulty=None,  # Preenchido em lote por route_paragraphs
+                source_document=source,
+                questions=self.generate_reading_questions(paragraph)
+            )
+        }
+    
+    def build_listening_item(self, index: int, paragraph: str, source: str) -> Dict[str, Any]:
+        """Diálogo de listening a partir de um parágrafo"""
+        return {
+            content_id("dialogue", source, paragraph): ListeningDialogue(
+                title=f"Listening Dialogue {index+1}",
+                content=paragraph,
+                type="dialogue",
+                level=self.level,
+                category="listening_comprehension",
+                difficulty=None,  # Preenchido em lote por route_paragraphs
+                source_document=source,
+                questions=self.generate_listening_questions(paragraph)
+            )
+        }
+    
+    def build_writing_item(self, index: int, paragraph: str, source: str) -> Dict[str, Any]:
+        """Prompt de escrita a partir de um parágrafo"""
+        return {
+            content_id("prompt", source, paragraph): WritingPrompt(
+                title=f"Writing Prompt {index+1}",
+                prompt=paragraph,
+                type="writing_task",
+                level=self.level,
+                category="writing_practice",
+                word_limit=self.extract_word_limit(paragraph),
+                source_document=source,
+                suggestions=self.generate_writing_suggestions(paragraph)
+            )
+        }
+    
+    def build_speaking_item(self, index: int, paragraph: str, source: str) -> Dict[str, Any]:
+        """Tópico de speaking a partir de um parágrafo"""
+        return {
+            content_id("topic", source, paragraph): SpeakingTopic(
+                title=f"Speaking Topic {index+1}",
+                topic=paragraph,
+                type="conversation_topic",
+                level=self.level,
+                category="speaking_practice",
+                difficulty=None,  # Preenchido em lote por route_paragraphs
+                source_document=source,
+                questions=self.generate_speaking_questions(paragraph)
+            )
+        }
     
     # Métodos auxiliares
     def identify_vocabulary_category(self, word: str, definition: str) -> str:
         """Identifica categoria do vocabulário"""
-        definition_lower = definition.lower()
-        
-        categories = {
-            'family': ['family', 'mother', 'father', 'sister', 'brother'],
-            'food': ['food', 'eat', 'drink', 'cook', 'restaurant'],
-            'jobs': ['job', 'work', 'career', 'profession', 'employee'],
-            'weather': ['weather', 'climate', 'temperature', 'rain', 'sun'],
-            'transport': ['transport', 'car', 'bus', 'train', 'airplane'],
-            'house': ['house', 'home', 'room', 'furniture', 'kitchen']
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in definition_lower for keyword in keywords):
-                return category
-        
-        return 'general'
+        return self.text_cache.get_or_compute(
+            ('vocabulary_category', definition),
+            lambda: self.keyword_matcher.first(definition, 'vocabulary_category', 'general')
+        )
     
     def identify_grammar_category(self, rule_name: str) -> str:
         """Identifica categoria da regra gramatical"""
-        rule_lower = rule_name.lower()
-        
-        if any(word in rule_lower for word in ['tense', 'present', 'past', 'future']):
-            return 'tenses'
-        elif any(word in rule_lower for word in ['conditional', 'if']):
-            return 'conditionals'
-        elif any(word in rule_lower for word in ['modal', 'can', 'must', 'should']):
-            return 'modals'
-        elif any(word in rule_lower for word in ['preposition', 'in', 'on', 'at']):
-            return 'prepositions'
-        else:
-            return 'general'
+        return self.text_cache.get_or_compute(
+            ('grammar_category', rule_name),
+            lambda: self.keyword_matcher.first(rule_name, 'grammar_category', 'general')
+        )
     
     def extract_examples(self, text: str) -> List[str]:
         """Extrai exemplos de uso"""
-        examples = re.findall(self.vocabulary_patterns['example_sentence'], text)
-        return [ex.strip() for ex in examples if len(ex.strip()) > 10]
+        return self.vocabulary_scanner.find_examples(text)
     
     def extract_phonetic(self, text: str) -> str:
         """Extrai transcrição fonética"""
-        phonetic = re.search(self.vocabulary_patterns['phonetic'], text)
-        return phonetic.group(1) if phonetic else ""
+        return self.vocabulary_scanner.find_phonetic(text)
     
     def extract_part_of_speech(self, text: str) -> str:
         """Extrai classe gramatical"""
-        pos = re.search(self.vocabulary_patterns['part_of_speech'], text)
-        return pos.group(1) if pos else "unknown"
+        return self.vocabulary_scanner.find_part_of_speech(text)
     
     def split_into_sections(self, text: str) -> Dict[str, str]:
         """Divide texto em seções"""
-        sections = {}
-        current_section = ""
-        current_content = ""
-        
-        lines = text.split('\n')
-        for line in lines:
-            if re.match(r'^[A-Z][^:]*:', line):  # Nova seção
-                if current_section:
-                    sections[current_section] = current_content.strip()
-                current_section = line.strip()
-                current_content = ""
-            else:
-                current_content += line + "\n"
-        
-        if current_section:
-            sections[current_section] = current_content.strip()
-        
-        return sections
+        return split_sections(text)
+    
+    def extract_grammar_description(self, text: str) -> str:
+        """Descrição da regra: até duas frases da primeira regra (sem os exemplos)"""
+        first_rule = next(iter(self.extract_grammar_rules(text)), '')
+        sentences = [s.strip() for s in self.grammar_regex['explanation'].findall(first_rule)[:2]]
+        return " ".join(s for s in sentences if s) or first_rule
+    
+    def extract_grammar_examples(self, text: str) -> List[str]:
+        """Exemplos entre aspas e após "i.e." (estilo das listas de gramática por nível)"""
+        examples = [ex.strip() for ex in self.grammar_regex['example'].findall(text) if len(ex.strip()) > 3]
+        examples += [ex.strip() for ex in self.grammar_regex['inline_example'].findall(text) if ex.strip()]
+        return examples
+    
+    def extract_grammar_rules(self, text: str) -> List[str]:
+        """Uma regra por linha não vazia, sem os exemplos"""
+        rules = []
+        for line in text.split('\n'):
+            rule = self.grammar_regex['inline_example'].split(line, 1)[0].strip().rstrip(',').strip()
+            if rule and not self.grammar_regex['exercise'].search(line):
+                rules.append(rule)
+        return rules
+    
+    def extract_grammar_exercises(self, text: str) -> List[str]:
+        """Linhas com lacunas ou marcadas como exercício"""
+        return [line.strip() for line in text.split('\n') if self.grammar_regex['exercise'].search(line)]
     
     def process_vocabulary_table(self, table: Dict[str, Any]) -> Dict[str, Any]:
         """Processa tabela de vocabulário"""
@@ -347,30 +842,56 @@ class DataProcessor:
                 definition = row[1].strip()
                 
                 if word and definition and len(word) > 2:
-                    vocabulary[word.lower()] = {
-                        "word": word,
-                        "definition_en": definition,
-                        "definition_pt": "",
-                        "level": self.level,
-                        "category": self.identify_vocabulary_category(word, definition),
-                        "examples": [],
-                        "phonetic": "",
-                        "part_of_speech": "unknown",
-                        "is_phrasal_verb": ' ' in word,
-                        "source_document": "table_extraction",
-                        "context": f"From table: {word} - {definition}"
-                    }
+                    vocabulary[word.lower()] = VocabularyEntry(
+                        word=word,
+                        definition_en=definition,
+                        definition_pt="",
+                        level=self.level,
+                        category=self.identify_vocabulary_category(word, definition),
+                        examples=[],
+                        phonetic="",
+                        part_of_speech="unknown",
+                        is_phrasal_verb=' ' in word,
+                        source_document="table_extraction",
+                        context=f"From table: {word} - {definition}"
+                    )
+        
+        return self.apply_lexicon(vocabulary)
+    
+    def apply_lexicon(self, vocabulary: Dict[str, Any]) -> Dict[str, Any]:
+        """Nível e classe gramatical de cada palavra pelo léxico CEFR, marcando com off_level
+        as que estão fora dele ou acima do nível (descartadas com processing.lexicon.drop_off_level)"""
+        if self.lexicon is None:
+            return vocabulary
         
-        return vocabulary
+        max_level = CEFR_LEVELS.index(self.level)
+        tagged = {}
+        for key, word_data in vocabulary.items():
+            entry = self.lexicon.lookup(word_data['word'])
+            off_level = entry is None or CEFR_LEVELS.index(entry.level) > max_level
+            if off_level and self.drop_off_level:
+                continue
+            if entry is not None:
+                word_data['level'] = entry.level
+                if word_data['part_of_speech'] == 'unknown':
+                    word_data['part_of_speech'] = entry.part_of_speech[0]
+            word_data['off_level'] = off_level
+            tagged[key] = word_data
+        return tagged
     
-    def save_processed_data(self, processed_data: Dict[str, Any]):
-        """Salva dados processados"""
+    def save_processed_data(self, processed_data: Dict[str, Any], categories: Optional[Iterable[str]] = None):
+        """Salva dados processados
+        
+        Com ``categories`` só essas categorias são regravadas (mesmo vazias, para não
+        deixar itens retirados no arquivo); o resumo é sempre atualizado.
+        """
+        categories = set(categories) if categories is not None else None
         for category, data in processed_data.items():
-            if data:
+            if (categories is None and data) or (categories is not None and category in categories):
                 output_file = self.output_path / f"{category}.json"
                 try:
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+                        json.dump(data, f, indent=2, ensure_ascii=False, default=json_default)
                     logger.info(f"✅ {category} salvo em: {output_file}")
                 except Exception as e:
                     logger.error(f"❌ Erro ao salvar {category}: {str(e)}")
@@ -394,27 +915,26 @@ class DataProcessor:
             logger.info(f"✅ Resumo do processamento salvo em: {summary_file}")
         except Exception as e:
             logger.error(f"❌ Erro ao salvar resumo: {str(e)}")
+        
+        self.document_cache.log_stats()
+        self.text_cache.log_stats()
+    
+    def load_processed_data(self) -> Dict[str, Any]:
+        """Carrega dados processados salvos anteriormente (para validar/exportar sem reprocessar)"""
+        return load_processed_data(self.level, self.CATEGORIES)
     
     # Métodos de avaliação de dificuldade
     def assess_reading_difficulty(self, text: str) -> str:
         """Avalia dificuldade do texto de leitura"""
-        word_count = len(text.split())
-        avg_word_length = sum(len(word) for word in text.split()) / word_count if word_count > 0 else 0
-        
-        if word_count < 100 or avg_word_length < 4.5:
-            return "easy"
-        elif word_count < 300 or avg_word_length < 5.5:
-            return "medium"
-        else:
-            return "hard"
+        return self.difficulty.assess([text], ['reading'])[0]
     
     def assess_listening_difficulty(self, text: str) -> str:
         """Avalia dificuldade do material de listening"""
-        return self.assess_reading_difficulty(text)  # Mesma lógica por enquanto
+        return self.difficulty.assess([text], ['listening'])[0]
     
     def assess_speaking_difficulty(self, text: str) -> str:
         """Avalia dificuldade do tópico de speaking"""
-        return "medium"  # Padrão para speaking
+        return self.difficulty.assess([text], ['speaking'])[0]
     
     # Métodos de identificação de tipo
     def is_dialogue(self, text: str) -> bool:
@@ -423,47 +943,33 @@ class DataProcessor:
     
     def is_writing_prompt(self, text: str) -> bool:
         """Identifica se é um prompt de escrita"""
-        prompt_keywords = ['write', 'describe', 'explain', 'discuss', 'compare']
-        return any(keyword in text.lower() for keyword in prompt_keywords)
+        return 'writing_prompts' in self.keyword_matcher.labels(text, 'paragraph_type')
     
     def is_speaking_topic(self, text: str) -> bool:
         """Identifica se é um tópico de speaking"""
-        speaking_keywords = ['talk about', 'discuss', 'describe', 'opinion', 'experience']
-        return any(keyword in text.lower() for keyword in speaking_keywords)
+        return 'speaking_topics' in self.keyword_matcher.labels(text, 'paragraph_type')
     
     # Métodos de geração de conteúdo
     def extract_word_limit(self, text: str) -> str:
         """Extrai limite de palavras do prompt"""
-        word_limit_match = re.search(r'(\d+)\s*words?', text.lower())
-        return word_limit_match.group(1) + " words" if word_limit_match else "100 words"
+        def compute():
+            word_limit_match = re.search(r'(\d+)\s*words?', text.lower())
+            return word_limit_match.group(1) + " words" if word_limit_match else "100 words"
+        return self.text_cache.get_or_compute(('word_limit', text), compute)
     
-    def generate_reading_questions(self, text: str) -> List[Dict[str, str]]:
+    def generate_reading_questions(self, text: str) -> Tuple[Dict[str, str], ...]:
         """Gera perguntas de compreensão"""
         # Implementação básica - pode ser expandida
-        return [
-            {"question": "What is the main topic of this text?", "type": "main_idea"},
-            {"question": "What are the key points mentioned?", "type": "key_points"}
-        ]
+        return self.READING_QUESTIONS
     
-    def generate_listening_questions(self, text: str) -> List[Dict[str, str]]:
+    def generate_listening_questions(self, text: str) -> Tuple[Dict[str, str], ...]:
         """Gera perguntas de listening"""
-        return [
-            {"question": "What is the conversation about?", "type": "topic"},
-            {"question": "What are the speakers discussing?", "type": "discussion"}
-        ]
+        return self.LISTENING_QUESTIONS
     
-    def generate_speaking_questions(self, text: str) -> List[Dict[str, str]]:
+    def generate_speaking_questions(self, text: str) -> Tuple[Dict[str, str], ...]:
         """Gera perguntas para speaking"""
-        return [
-            {"question": "What is your opinion on this topic?", "type": "opinion"},
-            {"question": "Can you share a related experience?", "type": "experience"}
-        ]
+        return self.SPEAKING_QUESTIONS
     
-    def generate_writing_suggestions(self, text: str) -> List[str]:
+    def generate_writing_suggestions(self, text: str) -> Tuple[str, ...]:
         """Gera sugestões para escrita"""
-        return [
-            "Use clear topic sentences",
-            "Include supporting details",
-            "Use appropriate vocabulary",
-            "Check grammar and spelling"
-        ]
+        return self.WRITING_SUGGESTIONS
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+🧱 REGISTROS COMPACTOS - ITENS PROCESSADOS COM __slots__
+Cada item processado (palavra, regra, texto...) é um registro com campos fixos em
+__slots__ e valores repetidos (nível, categoria, documento de origem) internados;
+a forma de dicionário só é montada ao gravar ou exportar
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Tuple
+
+# Dados processados: um JSON por categoria em output/processed_data/<nível>
+PROCESSED_DATA_DIR = Path("output/processed_data")
+CATEGORIES = [
+    "vocabulary",
+    "grammar",
+    "exercises",
+    "reading_materials",
+    "listening_materials",
+    "writing_prompts",
+    "speaking_topics"
+]
+
+class FrozenDict(dict):
+    """Dicionário somente leitura, para valores compartilhados por vários registros
+    
+    Continua sendo um dict para o json e o pickle; qualquer alteração levanta TypeError.
+    """
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args: Any, **kwargs: Any):
+        raise TypeError(f"{type(self).__name__} é somente leitura")
+    
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+def frozen(value: Any) -> Any:
+    """Versão imutável de um valor compartilhado (listas viram tuplas, dicionários FrozenDict)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(frozen(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, frozen(item)) for key, item in value.items())
+    return value
+
+def thawed(value: Any) -> Any:
+    """Forma JSON de um valor (tuplas viram listas, FrozenDict vira dicionário)"""
+    if type(value) is tuple:
+        return [thawed(item) for item in value]
+    if type(value) is FrozenDict:
+        return {key: thawed(item) for key, item in value.items()}
+    return value
+
+class Record(Mapping):
+    """Item processado com a interface de dicionário usada pelo validador e pelo exportador
+    
+    Os campos ficam em __slots__ (sem o dicionário de cada item); um campo nunca
+    atribuído não faz parte do item, como uma chave ausente. Os valores de
+    ``INTERNED`` se repetem em milhares de itens e são guardados uma única vez.
+    Valores compartilhados entre itens (perguntas padrão, exemplos do parágrafo) são
+    imutáveis (``frozen``) e voltam a ser listas e dicionários em ``to_dict``.
+    """
+    
+    __slots__ = ()
+    
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED = frozenset({"level", "category", "type", "difficulty", "part_of_speech", "source_document"})
+    
+    def __init__(self, **fields: Any):
+        for key, value in fields.items():
+            self[key] = value
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Any:
+        """Registro a partir da forma de dicionário (dicionários com chaves fora de FIELDS
+        são mantidos como estão)"""
+        if not all(key in cls.__slots__ for key in data):
+            return data
+        return cls(**data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Forma de dicionário (mesmas chaves, na ordem de FIELDS; valores compartilhados copiados)"""
+        data = {}
+        for key in self.FIELDS:
+            try:
+                data[key] = thawed(getattr(self, key))
+            except AttributeError:
+                pass
+        return data
+    
+    def replace(self, **fields: Any) -> "Record":
+        """Cópia do registro com campos alterados (valor None retira o campo)"""
+        data = self.to_dict()
+        for key, value in fields.items():
+            if value is None:
+                data.pop(key, None)
+            else:
+                data[key] = value
+        return type(self)(**data)
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key in self.INTERNED and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, key, value)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Igual a outro registro ou dicionário com os mesmos itens (tuplas contam como listas)"""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == (other.to_dict() if isinstance(other, Record) else dict(other))
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+class VocabularyEntry(Record):
+    FIELDS = ("word", "definition_en", "definition_pt", "level", "category", "examples", "phonetic",
+              "part_of_speech", "is_phrasal_verb", "source_document", "context", "off_level")
+    __slots__ = FIELDS
+
+class GrammarRule(Record):
+    FIELDS = ("rule_name", "category", "level", "description", "examples", "rules", "exercises",
+              "source_document", "context")
+    __slots__ = FIELDS
+
+class ReadingText(Record):
+    FIELDS = ("title", "content", "word_count", "level", "category", "difficulty", "source_document", "questions",
+              "sources", "duplicate_ids")
+    __slots__ = FIELDS
+
+class ListeningDialogue(Record):
+    FIELDS = ("title", "content", "type", "level", "category", "difficulty", "source_document", "questions",
+              "sources", "duplicate_ids")
+    __slots__ = FIELDS
+
+class WritingPrompt(Record):
+    FIELDS = ("title", "prompt", "type", "level", "category", "word_limit", "source_document", "suggestions")
+    __slots__ = FIELDS
+
+class SpeakingTopic(Record):
+    FIELDS = ("title", "topic", "type", "level", "category", "difficulty", "source_document", "questions")
+    __slots__ = FIELDS
+
+# Categoria dos dados processados -> tipo de registro
+RECORD_TYPES = {
+    "vocabulary": VocabularyEntry,
+    "grammar": GrammarRule,
+    "reading_materials": ReadingText,
+    "listening_materials": ListeningDialogue,
+    "writing_prompts": WritingPrompt,
+    "speaking_topics": SpeakingTopic
+}
+
+def records_from_dicts(category: str, items: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte os itens de uma categoria (ex.: lidos do JSON salvo) em registros"""
+    record_type = RECORD_TYPES.get(category)
+    if record_type is None:
+        return items
+    return {item_id: record_type.from_dict(item) if isinstance(item, dict) else item
+            for item_id, item in items.items()}
+
+def load_processed_data(level: str, categories: Iterable[str] = CATEGORIES) -> Dict[str, Any]:
+    """Carrega os dados processados salvos de um nível como registros (categoria sem arquivo fica vazia)
+    
+    Não depende do processador: --from-processed valida e exporta sem montar suas tabelas.
+    """
+    processed_data = {}
+    for category in categories:
+        category_file = PROCESSED_DATA_DIR / level / f"{category}.json"
+        if category_file.exists():
+            with open(category_file, 'r', encoding='utf-8') as f:
+                processed_data[category] = records_from_dicts(category, json.load(f))
+        else:
+            processed_data[category] = {}
+    return processed_data
+
+def records_to_dicts(processed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dados processados na forma de dicionários (fronteira de exportação)"""
+    return {
+        category: {item_id: item.to_dict() if isinstance(item, Record) else item for item_id, item in data.items()}
+        if isinstance(data, dict) else data
+        for category, data in processed_data.items()
+    }
+
+def json_default(value: Any) -> Any:
+    """``default`` do json.dump: registros viram dicionários, o resto vira texto"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    return str(value)
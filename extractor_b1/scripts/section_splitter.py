@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+✂️ DIVISOR DE SEÇÕES - SPANS SOBRE O TEXTO ORIGINAL
+Localiza os títulos de seção com regex pré-compilados e produz (título, início, fim)
+do corpo de cada seção, sem copiar o texto
+"""
+
+import re
+from typing import Dict, Iterator, Optional, Tuple
+
+# Títulos no estilo das listas de gramática por nível: "B1 conditionals", "B1 future tenses:"
+LEVEL_HEADING = r'[ABC][12][ \t]+[^\n:.!?]{1,60}:?[ \t]*(?=\n|\Z)'
+
+# Títulos no estilo "Nome da regra: ..." (qualquer linha iniciando em maiúscula com dois-pontos)
+COLON_HEADING = r'[A-Z][^:\n]*:[^\n]*'
+
+class _HeadingPattern:
+    """Título no início do texto ou logo após uma quebra de linha
+    
+    O "\\n" literal no início do padrão deixa o regex saltar direto entre quebras de
+    linha, em vez de testar ^ em cada posição (re.MULTILINE).
+    """
+    
+    def __init__(self, line_pattern: str):
+        self.first_line = re.compile(line_pattern)
+        self.after_newline = re.compile(r'\n(' + line_pattern + ')')
+    
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Produz (linha do título, início, fim) de cada título"""
+        match = self.first_line.match(text)
+        if match:
+            yield match.group(0), match.start(), match.end()
+        for match in self.after_newline.finditer(text):
+            yield match.group(1), match.start(1), match.end(1)
+    
+    def search(self, text: str) -> Optional[Tuple[str, int, int]]:
+        """Primeiro título do texto, se houver"""
+        return next(self.finditer(text), None)
+
+LEVEL_HEADINGS = _HeadingPattern(LEVEL_HEADING)
+COLON_HEADINGS = _HeadingPattern(COLON_HEADING)
+
+_NON_SPACE = re.compile(r'\S')
+
+def iter_sections(text: str) -> Iterator[Tuple[str, int, int]]:
+    """Produz (título, início, fim) de cada seção; text[início:fim] é o corpo sem espaços nas pontas
+    
+    Se o texto tem títulos por nível, só eles abrem seções (linhas como "Pronouns: something,
+    anything" ficam no corpo); senão vale o estilo com dois-pontos. Texto antes do primeiro
+    título é ignorado.
+    """
+    headings = LEVEL_HEADINGS if LEVEL_HEADINGS.search(text) else COLON_HEADINGS
+    
+    heading = None
+    body_start = 0
+    for line, start, end in headings.finditer(text):
+        if heading is not None:
+            yield (heading,) + _trim(text, body_start, start)
+        heading = line.strip().rstrip(':').rstrip()
+        body_start = end
+    
+    if heading is not None:
+        yield (heading,) + _trim(text, body_start, len(text))
+
+def _trim(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Ajusta o intervalo para excluir espaços e quebras de linha nas pontas"""
+    first = _NON_SPACE.search(text, start, end)
+    if first is None:
+        return start, start
+    start = first.start()
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Seções como dicionário título -> corpo (títulos repetidos: vale a última seção)"""
+    return {heading: text[start:end] for heading, start, end in iter_sections(text)}
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+🛡️ POOL SUPERVISIONADO DE PROCESSOS
+Executa tarefas em processos worker com timeout, limite de memória, novas tentativas
+com backoff e isolamento de falhas (um worker que trava ou morre não derruba o pipeline)
+"""
+
+import os
+import time
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import Any, Callable, Deque, List, Optional, Tuple
+from loguru import logger
+
+POLL_INTERVAL = 0.1
+
+# Falhas do worker (não da tarefa) que justificam uma nova tentativa
+RETRYABLE_REASONS = frozenset(("crash", "timeout", "memory"))
+
+class WorkerFailure(Exception):
+    """Falha definitiva de uma tarefa após esgotar as tentativas"""
+    
+    def __init__(self, reason: str, message: str, attempts: int):
+        super().__init__(message)
+        self.reason = reason
+        self.message = message
+        self.attempts = attempts
+
+def _worker_main(conn, initializer: Optional[Callable], initargs: Tuple):
+    """Laço do processo worker: recebe (id, função, argumento) e devolve o resultado"""
+    if initializer:
+        initializer(*initargs)
+    
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        
+        task_id, fn, arg = message
+        try:
+            result = fn(arg)
+            conn.send((task_id, True, result))
+        except BaseException as e:
+            conn.send((task_id, False, f"{type(e).__name__}: {str(e)}"))
+
+def _process_rss_mb(pid: int) -> Optional[float]:
+    """Memória residente de um processo em MB (Linux: /proc; senão psutil, se instalado)"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+class _Task:
+    __slots__ = ("task_id", "fn", "arg", "future", "attempts", "ready_at", "description")
+    
+    def __init__(self, task_id: int, fn: Callable, arg: Any, description: str):
+        self.task_id = task_id
+        self.fn = fn
+        self.arg = arg
+        self.future = Future()
+        self.attempts = 0
+        self.ready_at = 0.0
+        self.description = description
+
+class _Worker:
+    def __init__(self, context, initializer: Optional[Callable], initargs: Tuple):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, initializer, initargs), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task: Optional[_Task] = None
+        self.deadline = 0.0
+    
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+    
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+class SupervisedPool:
+    """Pool de processos com supervisão por tarefa
+    
+    Cada tarefa roda em um worker persistente (o estado criado pelo ``initializer``,
+    como o conversor Docling, é reaproveitado). Se a tarefa ultrapassar ``timeout``
+    segundos, o worker exceder ``memory_limit_mb`` ou o processo morrer, o worker é
+    substituído e a tarefa é repetida até ``max_retries`` vezes, com espera de
+    ``retry_delay * 2 ** (tentativa - 1)`` segundos. Esgotadas as tentativas, o
+    Future da tarefa recebe um ``WorkerFailure``. Uma exceção da própria tarefa
+    (``reason="error"``) é determinística e vai direto para o Future, sem repetição.
+    """
+    
+    def __init__(self, workers: int, initializer: Optional[Callable] = None, initargs: Tuple = (),
+                 timeout: Optional[float] = None, max_retries: int = 0, retry_delay: float = 1.0,
+                 memory_limit_mb: Optional[float] = None):
+        self.worker_count = max(workers, 1)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.timeout = timeout or None
+        self.max_retries = max(max_retries, 0)
+        self.retry_delay = retry_delay
+        self.memory_limit_mb = memory_limit_mb or None
+        
+        self._context = multiprocessing.get_context()
+        self._workers: List[_Worker] = []
+        self._pending: Deque[_Task] = deque()
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._shutdown = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+    
+    def submit(self, fn: Callable, arg: Any, description: str = "") -> Future:
+        """Agenda fn(arg) em um worker; fn precisa ser uma função de módulo (serializável)"""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Pool supervisionado já foi encerrado")
+            self._next_id += 1
+            task = _Task(self._next_id, fn, arg, description or str(arg))
+            self._pending.append(task)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._supervise, name="supervised-pool", daemon=True)
+                self._thread.start()
+        return task.future
+    
+    def shutdown(self):
+        """Aguarda as tarefas pendentes e encerra os workers"""
+        with self._lock:
+            self._shutdown = True
+            thread = self._thread
+        if thread:
+            thread.join()
+    
+    # Supervisão (thread interna)
+    
+    def _supervise(self):
+        try:
+            while True:
+                with self._lock:
+                    busy = [w for w in self._workers if w.task]
+                    if self._shutdown and not self._pending and not busy:
+                        break
+                
+                self._dispatch()
+                self._collect()
+                self._enforce_limits()
+        finally:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+    
+    def _dispatch(self):
+        """Entrega tarefas prontas a workers livres, criando workers sob demanda"""
+        now = time.monotonic()
+        with self._lock:
+            for worker in [w for w in self._workers if w.task is None and not w.process.is_alive()]:
+                self._replace(worker)
+            
+            ready = [task for task in self._pending if task.ready_at <= now]
+            for task in ready:
+                worker = next((w for w in self._workers if w.task is None), None)
+                if worker is None:
+                    if len(self._workers) >= self.worker_count:
+                        break
+                    worker = _Worker(self._context, self.initializer, self.initargs)
+                    self._workers.append(worker)
+                
+                self._pending.remove(task)
+                if task.attempts == 0 and not task.future.set_running_or_notify_cancel():
+                    continue
+                task.attempts += 1
+                try:
+                    worker.conn.send((task.task_id, task.fn, task.arg))
+                except Exception as e:
+                    self._replace(worker)
+                    self._fail(task, "crash", f"Falha ao enviar tarefa ao worker: {str(e)}")
+                    continue
+                worker.task = task
+                worker.deadline = time.monotonic() + self.timeout if self.timeout else 0.0
+    
+    def _collect(self):
+        """Recebe resultados e detecta workers que morreram"""
+        busy = [w for w in self._workers if w.task]
+        if not busy:
+            time.sleep(POLL_INTERVAL)
+            return
+        
+        waitables = {}
+        for worker in busy:
+            waitables[worker.conn] = worker
+            waitables[worker.process.sentinel] = worker
+        
+        handled = set()
+        for ready in wait(list(waitables), timeout=POLL_INTERVAL):
+            worker = waitables[ready]
+            if worker.task is None or worker in handled:
+                continue
+            handled.add(worker)
+            task = worker.task
+            
+            message = None
+            try:
+                if worker.conn.poll():
+                    message = worker.conn.recv()
+            except (EOFError, OSError):
+                message = None
+            
+            if message is not None:
+                task_id, ok, payload = message
+                worker.task = None
+                if ok:
+                    task.future.set_result(payload)
+                else:
+                    self._fail(task, "error", payload)
+            elif not worker.process.is_alive():
+                exitcode = worker.process.exitcode
+                worker.task = None
+                self._replace(worker)
+                self._fail(task, "crash", f"Worker terminou inesperadamente (exitcode {exitcode})")
+    
+    def _enforce_limits(self):
+        """Aplica o timeout por tarefa e o limite de memória por worker"""
+        now = time.monotonic()
+        for worker in list(self._workers):
+            task = worker.task
+            if task is None:
+                continue
+            
+            if worker.deadline and now > worker.deadline:
+                worker.task = None
+                self._replace(worker)
+                self._fail(task, "timeout", f"Tempo limite de {self.timeout:.0f}s excedido")
+                continue
+            
+            if self.memory_limit_mb:
+                rss = _process_rss_mb(worker.process.pid)
+                if rss is not None and rss > self.memory_limit_mb:
+                    worker.task = None
+                    self._replace(worker)
+                    self._fail(task, "memory", f"Limite de memória excedido ({rss:.0f} MB > {self.memory_limit_mb:.0f} MB)")
+    
+    def _replace(self, worker: _Worker):
+        """Descarta um worker (morto, travado ou com memória excedida); outro é criado sob demanda"""
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+    
+    def _fail(self, task: _Task, reason: str, message: str):
+        """Agenda nova tentativa com backoff (só falhas do worker) ou conclui a tarefa com WorkerFailure"""
+        if reason in RETRYABLE_REASONS and task.attempts <= self.max_retries:
+            delay = self.retry_delay * (2 ** (task.attempts - 1))
+            logger.warning(f"Tentativa {task.attempts} falhou para {task.description} ({reason}: {message}); "
+                           f"nova tentativa em {delay:.1f}s")
+            task.ready_at = time.monotonic() + delay
+            with self._lock:
+                self._pending.append(task)
+            return
+        
+        logger.error(f"❌ {task.description} falhou após {task.attempts} tentativas ({reason}: {message})")
+        task.future.set_exception(WorkerFailure(reason, message, task.attempts))
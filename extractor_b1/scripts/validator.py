@@ -6,9 +6,11 @@ Valida dados processados e identifica problemas
 
 import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from loguru import logger
 
+from utils.similarity import exact_duplicates, group_pairs, shingles, similar_pairs
+
 class DataValidator:
     """Valida dados processados para garantir qualidade"""
     
@@ -21,49 +23,67 @@ class DataValidator:
         # Critérios de validação
         self.validation_rules = {
             'vocabulary': {
+                'duplicate_field': 'word',
                 'required_fields': ['word', 'definition_en', 'level', 'category'],
                 'word_min_length': 2,
                 'definition_min_length': 10,
                 'valid_categories': ['family', 'food', 'jobs', 'weather', 'transport', 'house', 'general']
             },
             'grammar': {
+                'duplicate_field': 'rule_name',
                 'required_fields': ['rule_name', 'category', 'level', 'description'],
                 'rule_name_min_length': 5,
                 'description_min_length': 20,
                 'valid_categories': ['tenses', 'conditionals', 'modals', 'prepositions', 'general']
             },
             'reading_materials': {
+                'duplicate_field': 'content',
                 'required_fields': ['title', 'content', 'level', 'category'],
                 'content_min_length': 50,
                 'valid_categories': ['reading_comprehension']
             },
             'listening_materials': {
+                'duplicate_field': 'content',
                 'required_fields': ['title', 'content', 'level', 'category'],
                 'content_min_length': 30,
                 'valid_categories': ['listening_comprehension']
             },
             'writing_prompts': {
+                'duplicate_field': 'prompt',
                 'required_fields': ['title', 'prompt', 'level', 'category'],
                 'prompt_min_length': 20,
                 'valid_categories': ['writing_practice']
             },
             'speaking_topics': {
+                'duplicate_field': 'topic',
                 'required_fields': ['title', 'topic', 'level', 'category'],
                 'topic_min_length': 20,
                 'valid_categories': ['speaking_practice']
             }
         }
         
+        # Categorias extras da configuração também são produzidas pelo processador
+        for category, extra in (('vocabulary', config.get_vocabulary_categories()),
+                                ('grammar', config.get_grammar_categories())):
+            valid = self.validation_rules[category]['valid_categories']
+            valid.extend(name for name in extra if name not in valid)
+        
         logger.info(f"Validador inicializado para nível {level}")
     
-    def validate_all(self, processed_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida todos os dados processados"""
+    def validate_all(self, processed_data: Dict[str, Any],
+                     item_issues: Optional[Dict[str, Dict[str, List[str]]]] = None) -> Dict[str, Any]:
+        """Valida todos os dados processados
+        
+        item_issues traz, por categoria, problemas de itens já validados (ex.: documento a
+        documento no pipeline em streaming); os itens ausentes são validados aqui.
+        """
         validation_results = {}
+        item_issues = item_issues or {}
         
         for category, data in processed_data.items():
             if data and category in self.validation_rules:
                 logger.info(f"Validando categoria: {category}")
-                validation_results[category] = self.validate_category(category, data)
+                validation_results[category] = self.validate_category(category, data, item_issues.get(category))
             elif data:
                 logger.warning(f"Categoria {category} não tem regras de validação definidas")
                 validation_results[category] = {
@@ -78,15 +98,26 @@ class DataValidator:
         
         return validation_results
     
-    def validate_category(self, category: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_items(self, category: str, data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Valida os itens de uma categoria individualmente (sem os critérios gerais)"""
+        if category not in self.validation_rules:
+            return {}
+        rules = self.validation_rules[category]
+        return {item_id: self.validate_item(category, item_data, rules) for item_id, item_data in data.items()}
+    
+    def validate_category(self, category: str, data: Dict[str, Any],
+                          known_issues: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """Valida uma categoria específica"""
         rules = self.validation_rules[category]
         issues = []
         warnings = []
         valid_items = 0
+        known_issues = known_issues or {}
         
         for item_id, item_data in data.items():
-            item_issues = self.validate_item(category, item_data, rules)
+            item_issues = known_issues.get(item_id)
+            if item_issues is None:
+                item_issues = self.validate_item(category, item_data, rules)
             if item_issues:
                 issues.append({
                     'item_id': item_id,
@@ -263,14 +294,45 @@ class DataValidator:
             })
         
         # Verificar duplicatas
-        if category == 'vocabulary':
-            words = [item.get('word', '').lower() for item in data.values()]
-            duplicates = [word for word in set(words) if words.count(word) > 1]
-            if duplicates:
-                issues.append({
-                    'item_id': 'category_general',
-                    'issues': [f"Palavras duplicadas encontradas: {', '.join(duplicates[:5])}"]
-                })
+        if self.config.should_check_duplicates():
+            issues.extend(self.find_duplicates(data, rules['duplicate_field']))
+        
+        return issues
+    
+    def find_duplicates(self, data: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        """Duplicatas exatas (mesmo texto normalizado) e quase duplicatas (Jaccard >=
+        validation.duplicate_threshold) do campo principal da categoria
+        
+        Cada problema traz em 'duplicates' os grupos de IDs que colidem; a busca por
+        quase duplicatas usa um representante de cada grupo exato.
+        """
+        issues = []
+        texts = {item_id: item.get(field) or '' for item_id, item in data.items()}
+        
+        exact_groups = exact_duplicates(texts)
+        if exact_groups:
+            issues.append({
+                'item_id': 'category_general',
+                'issues': [f"Duplicatas exatas de {field} ({len(exact_groups)} grupos): "
+                           + ', '.join(f"'{texts[ids[0]][:40]}' ({', '.join(ids)})" for ids in exact_groups[:5])],
+                'duplicates': exact_groups
+            })
+        
+        threshold = self.config.get_duplicate_threshold()
+        if threshold >= 1:
+            return issues
+        repeated = {item_id for ids in exact_groups for item_id in ids[1:]}
+        pairs = similar_pairs({item_id: shingles(text) for item_id, text in texts.items() if item_id not in repeated},
+                              threshold)
+        near_groups = [ids for ids in group_pairs(pairs) if len(ids) > 1]
+        if near_groups:
+            issues.append({
+                'item_id': 'category_general',
+                'issues': [f"Quase duplicatas de {field} ({len(near_groups)} grupos, similaridade >= {threshold:.0%}): "
+                           + ', '.join(f"({', '.join(ids)})" for ids in near_groups[:5])],
+                'duplicates': near_groups,
+                'similarity': [[a, b, round(similarity, 3)] for a, b, similarity in pairs]
+            })
         
         return issues
     
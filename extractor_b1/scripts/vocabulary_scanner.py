@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+🔎 SCANNER DE VOCABULÁRIO - PADRÕES COMPILADOS
+Varre cada parágrafo uma única vez por padrão, coletando pares palavra-definição,
+exemplos, transcrição fonética e classe gramatical
+"""
+
+import re
+from typing import Dict, List, Tuple, Optional, NamedTuple
+
+class ParagraphScan(NamedTuple):
+    """Resultado da varredura de um parágrafo"""
+    pairs: List[Tuple[str, str]]
+    definition_spans: List[Tuple[int, int]]
+    examples: List[str]
+    phonetic: str
+    part_of_speech: str
+    context: str
+
+class VocabularyScanner:
+    """Scanner de vocabulário com os padrões de DataProcessor.vocabulary_patterns compilados
+    
+    Antes, cada palavra encontrada disparava três novas buscas no parágrafo inteiro
+    (exemplos, fonética e classe gramatical) com padrões recompilados a cada chamada.
+    Aqui esses campos dependem só do parágrafo e são calculados uma vez, quando há
+    ao menos um par válido; as posições das definições permitem classificar todas de
+    uma vez (KeywordMatcher.first_in_spans). Os padrões continuam separados: uma
+    alternância única mudaria o resultado, porque os matches de palavra-definição
+    (que vão até o fim da linha) se sobrepõem a exemplos e transcrições.
+    """
+    
+    def __init__(self, patterns: Dict[str, str], min_word_length: int = 3):
+        self.word_definition = re.compile(patterns['word_definition'])
+        self.example_sentence = re.compile(patterns['example_sentence'])
+        self.phonetic = re.compile(patterns['phonetic'])
+        self.part_of_speech = re.compile(patterns['part_of_speech'])
+        self.min_word_length = min_word_length
+    
+    def scan(self, paragraph: str) -> Optional[ParagraphScan]:
+        """Varre um parágrafo; retorna None se não houver pares palavra-definição válidos"""
+        matches = [
+            match for match in self.word_definition.finditer(paragraph)
+            if len(match.group(1)) >= self.min_word_length
+        ]
+        if not matches:
+            return None
+        
+        return ParagraphScan(
+            pairs=[match.group(1, 2) for match in matches],
+            definition_spans=[match.span(2) for match in matches],
+            examples=self.find_examples(paragraph),
+            phonetic=self.find_phonetic(paragraph),
+            part_of_speech=self.find_part_of_speech(paragraph),
+            context=paragraph[:200] + "..." if len(paragraph) > 200 else paragraph
+        )
+    
+    def find_examples(self, text: str) -> List[str]:
+        """Exemplos de uso entre aspas (com mais de 10 caracteres)"""
+        return [ex.strip() for ex in self.example_sentence.findall(text) if len(ex.strip()) > 10]
+    
+    def find_phonetic(self, text: str) -> str:
+        """Primeira transcrição fonética entre barras"""
+        phonetic = self.phonetic.search(text)
+        return phonetic.group(1) if phonetic else ""
+    
+    def find_part_of_speech(self, text: str) -> str:
+        """Primeira classe gramatical mencionada"""
+        pos = self.part_of_speech.search(text)
+        return pos.group(1) if pos else "unknown"
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+👀 MODO WATCH - EXTRAÇÃO CONTÍNUA
+Observa a pasta de materiais de um nível e leva arquivos novos ou alterados
+até os dados processados e o SQLite sem reiniciar o pipeline
+"""
+
+import threading
+import time
+from typing import Dict, List, Any, Optional, Callable, Set
+from loguru import logger
+
+from scripts.extractor import DocumentExtractor
+from scripts.processor import DataProcessor
+from scripts.validator import DataValidator
+from scripts.exporter import DataExporter
+
+def start_observer(path, on_change: Callable[[], None]):
+    """Inicia um observador do sistema de arquivos (watchdog), se instalado
+    
+    Retorna None quando o watchdog não está disponível; o watcher continua por polling.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        logger.info("watchdog não instalado, usando verificação periódica da pasta")
+        return None
+    
+    class _ChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            on_change()
+    
+    try:
+        observer = Observer()
+        observer.schedule(_ChangeHandler(), str(path), recursive=True)
+        observer.start()
+    except Exception as e:
+        logger.warning(f"Não foi possível observar {path}, usando verificação periódica: {str(e)}")
+        return None
+    return observer
+
+class MaterialWatcher:
+    """Mantém extrator, processador, validador e exportador aquecidos e sincroniza as alterações"""
+    
+    def __init__(self, config, level: str, max_workers: Optional[int] = None, use_cache: bool = True,
+                 validate: bool = True, interval: Optional[float] = None):
+        self.config = config
+        self.level = level
+        self.validate = validate
+        self.interval = interval or config.get_watch_interval()
+        self.settle = config.get_watch_settle()
+        
+        self.extractor = DocumentExtractor(config, level, max_workers=max_workers, use_cache=use_cache)
+        self.processor = DataProcessor(config, level)
+        self.validator = DataValidator(config, level)
+        self.exporter = DataExporter(config, level)
+        
+        # Um pool persistente mantém o conversor Docling carregado nos workers entre sincronizações
+        # (sem isolamento, o conversor do próprio extrator já fica aquecido no processo principal)
+        if self.extractor.max_workers > 1 or self.extractor.isolate_documents:
+            self.extractor.pool = self.extractor.create_pool(self.extractor.max_workers)
+        
+        # Dados processados por documento e documentos conhecidos; a chave (caminho relativo)
+        # é também o source_document dos itens e das linhas do SQLite
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.sources: Set[str] = set()
+        
+        # Itens gravados no SQLite por source_document, como na última sincronização
+        self.synced: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        logger.info(f"Watcher inicializado para nível {level} (intervalo: {self.interval}s)")
+    
+    def run(self, on_sync: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """Sincroniza tudo uma vez e depois a cada alteração, até Ctrl+C"""
+        wake = threading.Event()
+        observer = start_observer(self.extractor.materials_path, wake.set)
+        
+        try:
+            result = self.sync(full=True)
+            if on_sync:
+                on_sync(result)
+            
+            while True:
+                wake.wait(self.interval)
+                wake.clear()
+                result = self.sync()
+                if result and on_sync:
+                    on_sync(result)
+        except KeyboardInterrupt:
+            logger.info("Modo watch encerrado")
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+            self.close()
+    
+    def sync(self, full: bool = False) -> Optional[Dict[str, Any]]:
+        """Extrai, processa, valida e exporta o que mudou; retorna None se nada mudou
+        
+        Com full=True todos os documentos são (re)processados e o SQLite é reconstruído.
+        Depois disso, arquivos com falha só são extraídos de novo quando forem alterados.
+        """
+        if not full:
+            diff = self.extractor.diff_materials(retry_failed=False)
+            if not (diff["added"] or diff["changed"] or diff["removed"]):
+                return None
+            
+            # Dá tempo para cópias em andamento terminarem antes de ler os arquivos
+            time.sleep(self.settle)
+        
+        started = time.perf_counter()
+        present = set()
+        updated: List[str] = []
+        
+        def on_extracted(key: str, document_data: Dict[str, Any]):
+            self.update_document(key, document_data)
+            updated.append(key)
+        
+        def on_document(key: str, document_data: Dict[str, Any]):
+            present.add(key)
+            if full:
+                on_extracted(key, document_data)
+        
+        self.extractor.extract_to_ndjson(
+            incremental=True,
+            on_document=on_document,
+            on_extracted=None if full else on_extracted,
+            retry_failed=full
+        )
+        
+        removed = sorted(key for key in self.sources if key not in present)
+        self.sources.difference_update(removed)
+        for key in removed:
+            self.documents.pop(key, None)
+        
+        processed_data = self.merge_documents()
+        self.processor.save_processed_data(processed_data)
+        
+        validation_results = self.validator.validate_all(processed_data) if self.validate else None
+        
+        # O SQLite espelha a visão mesclada e reunida: um documento alterado pode mudar os
+        # itens de outros (o canônico de um grupo de duplicatas, com seus sources), e
+        # documentos sem itens (removidos ou com falha) saem do banco
+        views = self.source_views(processed_data)
+        export_result = self.exporter.sync_documents_to_sql(
+            views if full else {source: view for source, view in views.items() if self.synced.get(source) != view},
+            [] if full else [source for source in self.synced if source not in views],
+            replace_all=full
+        )
+        if export_result.get('success'):
+            self.synced = views
+        
+        elapsed = time.perf_counter() - started
+        logger.info(f"✅ Sincronização concluída em {elapsed:.2f}s: {len(updated)} atualizados, {len(removed)} removidos")
+        
+        return {
+            "updated": updated,
+            "removed": removed,
+            "elapsed_seconds": elapsed,
+            "validation": validation_results,
+            "export": export_result
+        }
+    
+    def update_document(self, key: str, document_data: Dict[str, Any]):
+        """Reprocessa um documento extraído, guardando o resultado por documento"""
+        self.sources.add(key)
+        self.documents.pop(key, None)
+        
+        document_processed = self.processor.process_one(key, document_data)
+        if document_processed is not None:
+            self.documents[key] = document_processed
+    
+    def merge_documents(self) -> Dict[str, Any]:
+        """Mescla os documentos na ordem dos arquivos (mesmo resultado de uma execução completa)"""
+        processed_data = {category: {} for category in DataProcessor.CATEGORIES}
+        for key in sorted(self.documents):
+            self.processor.merge_document(processed_data, self.documents[key])
+        return self.processor.collapse_duplicates(processed_data)
+    
+    def source_views(self, processed_data: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Itens dos dados mesclados agrupados por source_document e categoria"""
+        views: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for category, data in processed_data.items():
+            for item_id, item in data.items():
+                source = item.get('source_document', '')
+                views.setdefault(source, {}).setdefault(category, {})[item_id] = item
+        return views
+    
+    def close(self):
+        """Encerra o pool de extração persistente"""
+        if self.extractor.pool is not None:
+            self.extractor.pool.shutdown()
+            self.extractor.pool = None
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+📚 LÉXICO CEFR - ÍNDICE EM DISCO COM HASH PERFEITO
+Lê a lista oficial de vocabulário (headword, variantes, classe gramatical, nível) e
+grava um índice compacto (.npz) consultado em O(1), sem reler a lista nem montar
+dicionários ao carregar
+"""
+
+import re
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable, Iterator, NamedTuple, Tuple
+import numpy as np
+from loguru import logger
+
+LEXICON_FORMAT = 1
+
+CEFR_LEVELS = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2')
+
+# Abreviações da lista Cambridge -> classe gramatical (bit da máscara = posição na tupla)
+PARTS_OF_SPEECH = ('noun', 'verb', 'adjective', 'adverb', 'preposition', 'conjunction',
+                   'pronoun', 'determiner', 'modal verb', 'phrasal verb', 'exclamation',
+                   'number', 'article', 'abbreviation')
+POS_ABBREVIATIONS = {
+    'n': 'noun', 'v': 'verb', 'adj': 'adjective', 'adv': 'adverb', 'prep': 'preposition',
+    'conj': 'conjunction', 'pron': 'pronoun', 'det': 'determiner', 'mv': 'modal verb',
+    'mod v': 'modal verb', 'phr v': 'phrasal verb', 'exclam': 'exclamation', 'number': 'number',
+    'art': 'article', 'abbrev': 'abbreviation'
+}
+
+# Entrada da lista: "headword[/variante] (pos [& pos]) [(Am Eng: variante)] ..."
+ENTRY_LINE = re.compile(r"^(?P<head>[^\W\d_][\w'’ .\-/]*?)\s*\((?P<pos>[a-z][a-z &,/]*)\)(?P<rest>.*)$")
+AMERICAN_VARIANT = re.compile(r"\(Am(?:erican)? Eng:?\s*([^)]+)\)")
+
+class LexiconEntry(NamedTuple):
+    """Palavra da lista (headword ou variante) com sua classe gramatical e nível"""
+    word: str
+    headword: str
+    part_of_speech: List[str]
+    level: str
+
+def parse_parts_of_speech(text: str) -> List[str]:
+    """'adj & n' -> ['adjective', 'noun'] (abreviações desconhecidas são ignoradas)"""
+    parts = []
+    for abbreviation in re.split(r'\s*[&,/]\s*', text.strip()):
+        part = POS_ABBREVIATIONS.get(abbreviation)
+        if part and part not in parts:
+            parts.append(part)
+    return parts
+
+def parse_vocabulary_list(text: str, level: str) -> Iterator[LexiconEntry]:
+    """Entradas de uma lista de vocabulário no formato Cambridge (texto extraído do PDF)
+    
+    Linhas de exemplo, títulos e rodapés não casam com ENTRY_LINE e são ignorados. Cada
+    forma de "a/an" ou "cafe/café" e cada variante americana vira uma entrada própria
+    apontando para o headword.
+    """
+    for line in text.split('\n'):
+        match = ENTRY_LINE.match(line.strip())
+        if not match:
+            continue
+        parts = parse_parts_of_speech(match.group('pos'))
+        if not parts:
+            continue
+        
+        forms = [form.strip().lower().replace('’', "'") for form in match.group('head').split('/')]
+        forms = [form for form in forms if form]
+        if not forms:
+            continue
+        headword = forms[0]
+        
+        american = AMERICAN_VARIANT.search(match.group('rest'))
+        if american:
+            forms.extend(form.strip().lower() for form in american.group(1).split(',') if form.strip())
+        
+        for form in forms:
+            yield LexiconEntry(form, headword, parts, level)
+
+def _hash(key: bytes, seed: int) -> int:
+    return zlib.crc32(key, seed)
+
+def _build_perfect_hash(keys: List[bytes]) -> Tuple[np.ndarray, List[int]]:
+    """Hash perfeito mínimo (hash-and-displace): chave -> balde -> deslocamento -> posição
+    
+    Os baldes maiores escolhem primeiro o menor deslocamento que leva todas as suas chaves
+    a posições livres. Retorna os deslocamentos por balde e a chave de cada posição.
+    """
+    n = len(keys)
+    buckets: List[List[int]] = [[] for _ in range(n // 4 + 1)]
+    for key_index, key in enumerate(keys):
+        buckets[_hash(key, 0) % len(buckets)].append(key_index)
+    
+    displacements = np.zeros(len(buckets), dtype=np.uint32)
+    slots = [-1] * n
+    for bucket in sorted(range(len(buckets)), key=lambda b: -len(buckets[b])):
+        members = buckets[bucket]
+        if not members:
+            continue
+        displacement = 1
+        while True:
+            positions = [_hash(keys[key_index], displacement) % n for key_index in members]
+            if len(set(positions)) == len(positions) and all(slots[position] < 0 for position in positions):
+                break
+            displacement += 1
+        displacements[bucket] = displacement
+        for key_index, position in zip(members, positions):
+            slots[position] = key_index
+    return displacements, slots
+
+class CEFRLexicon:
+    """Índice do léxico CEFR carregado de disco
+    
+    As palavras ficam concatenadas em um único bloco de bytes, na ordem das posições do
+    hash perfeito; uma consulta calcula dois CRC32, lê uma posição e confere a chave.
+    Carregar é só ler os arrays do .npz.
+    """
+    
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.key_blob = arrays['keys'].tobytes()
+        self.key_offsets = arrays['key_offsets'].tolist()
+        self.displacements = arrays['displacements'].tolist()
+        self.headwords = arrays['headwords']
+        self.pos_masks = arrays['pos_masks']
+        self.levels = arrays['levels']
+        self.size = len(self.key_offsets) - 1
+    
+    @classmethod
+    def load(cls, index_file: Path) -> Optional["CEFRLexicon"]:
+        """Carrega o índice (None se não existir ou for de outro formato)"""
+        index_file = Path(index_file)
+        if not index_file.exists():
+            return None
+        try:
+            with np.load(index_file, allow_pickle=False) as data:
+                if int(data['format']) != LEXICON_FORMAT:
+                    logger.warning(f"Índice do léxico em formato antigo, reconstrua com --build-lexicon: {index_file}")
+                    return None
+                lexicon = cls({name: data[name] for name in data.files})
+            logger.info(f"Léxico CEFR carregado: {lexicon.size} palavras")
+            return lexicon
+        except Exception as e:
+            logger.warning(f"Índice do léxico inválido: {str(e)}")
+            return None
+    
+    def slot(self, word: str) -> int:
+        """Posição da palavra no índice, ou -1 se ela não está no léxico"""
+        if not self.size:
+            return -1
+        key = word.strip().lower().encode('utf-8')
+        displacement = self.displacements[_hash(key, 0) % len(self.displacements)]
+        position = _hash(key, displacement) % self.size
+        if self.key_blob[self.key_offsets[position]:self.key_offsets[position + 1]] == key:
+            return position
+        return -1
+    
+    def key(self, position: int) -> str:
+        return self.key_blob[self.key_offsets[position]:self.key_offsets[position + 1]].decode('utf-8')
+    
+    def find(self, word: str) -> int:
+        """Posição da palavra ou de uma forma base dela (plural, -ed, -ing, -er/-est)"""
+        for candidate in base_forms(word.strip().lower()):
+            position = self.slot(candidate)
+            if position >= 0:
+                return position
+        return -1
+    
+    def lookup(self, word: str) -> Optional[LexiconEntry]:
+        """Entrada do léxico para uma palavra (ou forma flexionada dela)"""
+        position = self.find(word)
+        if position < 0:
+            return None
+        mask = int(self.pos_masks[position])
+        return LexiconEntry(
+            self.key(position),
+            self.key(int(self.headwords[position])),
+            [part for bit, part in enumerate(PARTS_OF_SPEECH) if mask & (1 << bit)],
+            CEFR_LEVELS[self.levels[position]]
+        )
+    
+    def level_of(self, word: str) -> Optional[str]:
+        """Nível CEFR da palavra, ou None se ela não está no léxico"""
+        position = self.find(word)
+        return CEFR_LEVELS[self.levels[position]] if position >= 0 else None
+    
+    def tag(self, tokens: Iterable[str]) -> List[Optional[str]]:
+        """Nível de cada token; tokens repetidos são consultados uma vez"""
+        levels: Dict[str, Optional[str]] = {}
+        result = []
+        for token in tokens:
+            if token not in levels:
+                levels[token] = self.level_of(token)
+            result.append(levels[token])
+        return result
+    
+    def words(self, max_level: Optional[str] = None) -> List[str]:
+        """Palavras do léxico (opcionalmente só as até um nível)"""
+        if max_level is None:
+            return [self.key(position) for position in range(self.size)]
+        limit = CEFR_LEVELS.index(max_level)
+        return [self.key(position) for position in np.flatnonzero(self.levels <= limit).tolist()]
+    
+    def iter_entries(self) -> Iterator[LexiconEntry]:
+        for position in range(self.size):
+            yield self.lookup(self.key(position))
+
+def base_forms(word: str) -> List[str]:
+    """A própria palavra e candidatas a forma base, da mais para a menos provável"""
+    forms = [word]
+    if len(word) <= 3 or ' ' in word:
+        return forms
+    if word.endswith('ies'):
+        forms.append(word[:-3] + 'y')
+    if word.endswith('es'):
+        forms.append(word[:-2])
+    if word.endswith('s') and not word.endswith('ss'):
+        forms.append(word[:-1])
+    for suffix in ('ied', 'ier', 'iest'):
+        if word.endswith(suffix):
+            forms.append(word[:-len(suffix)] + 'y')
+    for suffix in ('ed', 'ing', 'er', 'est'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            stem = word[:-len(suffix)]
+            forms.extend((stem, stem + 'e'))
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                forms.append(stem[:-1])  # stopped, running, bigger
+    return forms
+
+def build_lexicon_index(entries: Iterable[LexiconEntry], index_file: Path, source: str = "") -> int:
+    """Grava o índice do léxico; com um índice já existente as listas se somam
+    
+    Uma palavra presente em mais de uma lista fica com o nível mais baixo, e as classes
+    gramaticais se juntam. Retorna o número de palavras do índice.
+    """
+    index_file = Path(index_file)
+    words: Dict[str, List] = {}
+    previous = CEFRLexicon.load(index_file)
+    if previous is not None:
+        entries = [*previous.iter_entries(), *entries]
+    
+    for entry in entries:
+        mask = sum(1 << PARTS_OF_SPEECH.index(part) for part in entry.part_of_speech)
+        level = CEFR_LEVELS.index(entry.level)
+        current = words.get(entry.word)
+        if current is None:
+            words[entry.word] = [entry.headword, mask, level]
+        else:
+            current[1] |= mask
+            if level < current[2]:
+                current[0], current[2] = entry.headword, level
+    
+    # Headwords também são consultáveis, mesmo quando só aparecem como variante de outra entrada
+    for headword, mask, level in list(words.values()):
+        words.setdefault(headword, [headword, mask, level])
+    
+    unordered = list(words)
+    displacements, slots = _build_perfect_hash([word.encode('utf-8') for word in unordered])
+    ordered = [unordered[key_index] for key_index in slots]
+    position_of = {word: position for position, word in enumerate(ordered)}
+    
+    encoded = [word.encode('utf-8') for word in ordered]
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = index_file.with_name(index_file.stem + ".tmp.npz")
+    np.savez(
+        tmp_file,
+        format=np.array(LEXICON_FORMAT),
+        source=np.array(source),
+        built_at=np.array(datetime.now().isoformat()),
+        keys=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        key_offsets=np.concatenate(([0], np.cumsum([len(key) for key in encoded]))).astype(np.int64),
+        displacements=displacements,
+        headwords=np.array([position_of[words[word][0]] for word in ordered], dtype=np.int32),
+        pos_masks=np.array([words[word][1] for word in ordered], dtype=np.uint16),
+        levels=np.array([words[word][2] for word in ordered], dtype=np.uint8)
+    )
+    tmp_file.replace(index_file)
+    logger.info(f"✅ Léxico CEFR salvo em: {index_file} ({len(ordered)} palavras)")
+    return len(ordered)
@@ -24,7 +24,18 @@ class Config:
                 "max_file_size_mb": 100,
                 "extract_images": True,
                 "extract_tables": True,
-                "extract_structure": True
+                "extract_structure": True,
+                "max_workers": 4,
+                "isolate_documents": True,
+                "document_timeout_seconds": 900,
+                "worker_memory_limit_mb": 4096,
+                "shard_threshold_mb": 20,
+                "shard_pages": 20,
+                "native_formats": [".txt", ".html", ".docx"],
+                "cache_enabled": True,
+                "cache_dir": "output/cache/extraction",
+                "watch_interval_seconds": 2,
+                "watch_settle_seconds": 1
             },
             "processing": {
                 "min_word_length": 2,
@@ -32,13 +43,32 @@ class Config:
                 "min_rule_name_length": 5,
                 "min_description_length": 20,
                 "auto_categorize": True,
-                "generate_examples": True
+                "generate_examples": True,
+                "pipeline_queue_size": 8,
+                "max_workers": 1,
+                "lexicon": {
+                    "index_file": "output/lexicon/cefr_lexicon.npz",
+                    "drop_off_level": False
+                },
+                "duplicates": {
+                    "collapse": True,
+                    "num_perm": 128
+                }
+            },
+            "performance": {
+                "enable_cache": True,
+                "cache_size": 1000,
+                "cache_ttl": 3600,
+                "cache_file": "output/cache/processing/memo.sqlite",
+                "memo_store_ttl": None
             },
             "validation": {
                 "strict_mode": False,
                 "min_quality_score": 70.0,
                 "max_issues_per_item": 5,
-                "require_examples": False
+                "require_examples": False,
+                "check_duplicates": True,
+                "duplicate_threshold": 0.8
             },
             "export": {
                 "formats": ["json", "sql", "csv", "postgresql"],
@@ -68,7 +98,8 @@ class Config:
         
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                # Parser em C (libyaml), quando disponível: o YAML puro pesa na inicialização
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
             logger.info("Configuração YAML carregada com sucesso")
             return config or {}
         except Exception as e:
@@ -144,6 +175,81 @@ class Config:
         """Verifica se deve extrair estrutura"""
         return self.get('extraction.extract_structure', True)
     
+    def get_max_workers(self) -> int:
+        """Obtém número de processos de extração paralela"""
+        return max(int(self.get('extraction.max_workers', 1) or 1), 1)
+    
+    def should_isolate_documents(self) -> bool:
+        """Verifica se conversões Docling rodam em workers supervisionados mesmo sem paralelismo"""
+        return self.get('extraction.isolate_documents', True)
+    
+    def get_document_timeout(self) -> Optional[float]:
+        """Obtém tempo limite (segundos) de conversão por documento; 0 desativa"""
+        return float(self.get('extraction.document_timeout_seconds', 0) or 0) or None
+    
+    def get_worker_memory_limit_mb(self) -> Optional[float]:
+        """Obtém limite de memória residente (MB) por worker de extração; 0 desativa"""
+        return float(self.get('extraction.worker_memory_limit_mb', 0) or 0) or None
+    
+    def get_max_retries(self) -> int:
+        """Obtém número de novas tentativas após uma falha"""
+        return max(int(self.get('performance.max_retries', 0)), 0)
+    
+    def get_retry_delay(self) -> float:
+        """Obtém espera inicial (segundos) antes de uma nova tentativa"""
+        return float(self.get('performance.retry_delay', 1))
+    
+    def is_memo_cache_enabled(self) -> bool:
+        """Verifica se a memoização do processamento está habilitada"""
+        return bool(self.get('performance.enable_cache', True))
+    
+    def get_cache_size(self) -> int:
+        """Obtém número máximo de entradas de cada cache de memoização em memória"""
+        return max(int(self.get('performance.cache_size', 1000) or 0), 0)
+    
+    def get_cache_ttl(self) -> Optional[float]:
+        """Obtém validade (segundos) das entradas memoizadas (None = sem expiração)"""
+        ttl = self.get('performance.cache_ttl', 3600)
+        return float(ttl) if ttl else None
+    
+    def get_memo_store_ttl(self) -> Optional[float]:
+        """Obtém validade (segundos) das entradas memoizadas em disco (None = sem expiração)"""
+        ttl = self.get('performance.memo_store_ttl', None)
+        return float(ttl) if ttl else None
+    
+    def get_memo_cache_file(self) -> Optional[Path]:
+        """Obtém arquivo SQLite da memoização entre execuções (None = só em memória)"""
+        cache_file = self.get('performance.cache_file', "output/cache/processing/memo.sqlite")
+        return Path(cache_file) if cache_file else None
+    
+    def get_max_parallel_levels(self) -> int:
+        """Obtém quantos níveis são processados ao mesmo tempo com --level ALL"""
+        return max(int(self.get('performance.max_parallel_levels', 1) or 1), 1)
+    
+    def get_shard_threshold_mb(self) -> float:
+        """Obtém tamanho a partir do qual PDFs são divididos em intervalos de páginas"""
+        return float(self.get('extraction.shard_threshold_mb', 20))
+    
+    def get_shard_pages(self) -> int:
+        """Obtém quantidade de páginas por parte de um PDF dividido"""
+        return max(int(self.get('extraction.shard_pages', 20)), 1)
+    
+    def get_native_formats(self) -> list:
+        """Obtém formatos extraídos por parsers nativos (sem Docling)"""
+        return [ext.lower() for ext in self.get('extraction.native_formats', [])]
+    
+    def is_extraction_cache_enabled(self) -> bool:
+        """Verifica se o cache de extração está habilitado"""
+        return self.get('extraction.cache_enabled', True)
+    
+    def get_watch_interval(self) -> float:
+        """Obtém intervalo (segundos) entre verificações da pasta de materiais no modo watch"""
+        return max(float(self.get('extraction.watch_interval_seconds', 2)), 0.1)
+    
+    def get_watch_settle(self) -> float:
+        """Obtém espera (segundos) após uma alteração antes de extrair, para cópias terminarem"""
+        return max(float(self.get('extraction.watch_settle_seconds', 1)), 0)
+    
     def get_min_word_length(self) -> int:
         """Obtém comprimento mínimo de palavra"""
         return self.get('processing.min_word_length', 2)
@@ -156,10 +262,46 @@ class Config:
         """Verifica se deve categorizar automaticamente"""
         return self.get('processing.auto_categorize', True)
     
+    def get_vocabulary_categories(self) -> list:
+        """Obtém categorias de vocabulário reconhecidas"""
+        return self.get('processing.vocabulary_categories', []) or []
+    
+    def get_grammar_categories(self) -> list:
+        """Obtém categorias de gramática reconhecidas"""
+        return self.get('processing.grammar_categories', []) or []
+    
     def should_generate_examples(self) -> bool:
         """Verifica se deve gerar exemplos"""
         return self.get('processing.generate_examples', True)
     
+    def get_pipeline_queue_size(self) -> int:
+        """Obtém capacidade das filas entre as etapas do pipeline em streaming"""
+        return max(int(self.get('processing.pipeline_queue_size', 8)), 1)
+    
+    def get_difficulty_settings(self) -> Dict[str, Any]:
+        """Obtém configurações do motor de dificuldade (lista de palavras, limiares, peso da cobertura)"""
+        return self.get('processing.difficulty', {}) or {}
+    
+    def get_lexicon_index_file(self) -> Path:
+        """Obtém caminho do índice do léxico CEFR (gerado com --build-lexicon)"""
+        return Path(self.get('processing.lexicon.index_file', "output/lexicon/cefr_lexicon.npz"))
+    
+    def should_drop_off_level_words(self) -> bool:
+        """Verifica se palavras fora do léxico CEFR do nível são descartadas (senão só marcadas)"""
+        return bool(self.get('processing.lexicon.drop_off_level', False))
+    
+    def should_collapse_duplicates(self) -> bool:
+        """Verifica se quase duplicatas de leitura e listening são reunidas em um único item"""
+        return bool(self.get('processing.duplicates.collapse', True))
+    
+    def get_minhash_permutations(self) -> int:
+        """Obtém número de permutações do MinHash (detecção de quase duplicatas)"""
+        return max(int(self.get('processing.duplicates.num_perm', 128)), 1)
+    
+    def get_processing_workers(self) -> int:
+        """Obtém número de processos de processamento paralelo (1 = serial)"""
+        return max(int(self.get('processing.max_workers', 1) or 1), 1)
+    
     def is_strict_validation(self) -> bool:
         """Verifica se validação é estrita"""
         return self.get('validation.strict_mode', False)
@@ -176,6 +318,14 @@ class Config:
         """Verifica se exemplos são obrigatórios"""
         return self.get('validation.require_examples', False)
     
+    def should_check_duplicates(self) -> bool:
+        """Verifica se duplicatas devem ser procuradas na validação"""
+        return self.get('validation.check_duplicates', True)
+    
+    def get_duplicate_threshold(self) -> float:
+        """Obtém similaridade mínima (Jaccard, 0-1) para quase duplicatas"""
+        return float(self.get('validation.duplicate_threshold', 0.8))
+    
     def get_export_formats(self) -> list:
         """Obtém formatos de exportação"""
         return self.get('export.formats', ['json', 'sql', 'csv', 'postgresql'])
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+📇 ÍNDICE DE DOCUMENTOS PROCESSADOS
+Registra, para cada documento da extração bruta, o hash do registro e os itens
+que ele produziu em cada categoria, permitindo reprocessar só o que mudou
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+from loguru import logger
+
+DOCUMENT_INDEX_FILE = "document_index.json"
+
+def document_items(document_processed: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Chaves dos itens produzidos por um documento, por categoria (na ordem de produção)"""
+    return {category: list(data) for category, data in (document_processed or {}).items() if data}
+
+class DocumentIndex:
+    """Índice persistente dos documentos processados de um nível (na ordem da extração)"""
+    
+    def __init__(self, index_file: Path):
+        self.index_file = Path(index_file)
+        self.documents: Dict[str, Dict[str, Any]] = self.load()
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Carrega o índice salvo (vazio se não existir ou estiver corrompido)"""
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("documents", {})
+        except Exception as e:
+            logger.warning(f"Índice de documentos inválido, será recriado: {str(e)}")
+            return {}
+    
+    def producers(self) -> Dict[str, Dict[str, List[str]]]:
+        """Categoria -> chave do item -> documentos que o produzem, na ordem dos documentos"""
+        producers: Dict[str, Dict[str, List[str]]] = {}
+        for key, entry in self.documents.items():
+            for category, item_keys in entry.get("items", {}).items():
+                category_producers = producers.setdefault(category, {})
+                for item_key in item_keys:
+                    category_producers.setdefault(item_key, []).append(key)
+        return producers
+    
+    def save(self):
+        """Salva o índice (escrita atômica)"""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "updated_at": datetime.now().isoformat(),
+                    "documents": self.documents
+                }, f, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+            logger.info(f"✅ Índice de documentos salvo em: {self.index_file}")
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar índice de documentos: {str(e)}")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+♻️ CACHE DE EXTRAÇÃO
+Guarda o resultado da extração por hash de conteúdo para pular arquivos inalterados
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+from loguru import logger
+
+from utils.hashing import file_sha256, json_sha256
+from utils.ndjson import json_default
+
+def get_docling_version() -> str:
+    """Obtém a versão instalada do Docling (faz parte da chave do cache)"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return "unknown"
+
+class ExtractionCache:
+    """Cache persistente de extrações indexado por hash do arquivo, versão do Docling e opções"""
+    
+    def __init__(self, config, cache_dir: Optional[str] = None):
+        self.config = config
+        self.cache_dir = Path(cache_dir or config.get('extraction.cache_dir', 'output/cache/extraction'))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.docling_version = get_docling_version()
+        self.options = {
+            "extract_tables": config.should_extract_tables(),
+            "extract_images": config.should_extract_images(),
+            "extract_structure": config.should_extract_structure()
+        }
+        
+        self.hits = 0
+        self.misses = 0
+        
+        # Chaves já calculadas nesta execução, por (caminho, tamanho, mtime)
+        self._keys = {}
+    
+    def make_key(self, file_path: Path) -> str:
+        """Gera a chave do cache para um arquivo"""
+        stat = file_path.stat()
+        file_id = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        if file_id not in self._keys:
+            self._keys[file_id] = json_sha256({
+                "file_hash": file_sha256(file_path),
+                "docling_version": self.docling_version,
+                "options": self.options
+            })
+        return self._keys[file_id]
+    
+    def contains(self, key: str) -> bool:
+        """Verifica se há entrada para a chave, sem carregá-la"""
+        return self.entry_path(key).exists()
+    
+    def entry_path(self, key: str) -> Path:
+        """Caminho da entrada do cache para uma chave"""
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Obtém o documento em cache, ou None se não existir"""
+        entry_file = self.entry_path(key)
+        if not entry_file.exists():
+            self.misses += 1
+            return None
+        
+        try:
+            with open(entry_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            self.hits += 1
+            return entry["document"]
+        except Exception as e:
+            logger.warning(f"Entrada de cache inválida {entry_file.name}: {str(e)}")
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, document: Dict[str, Any]):
+        """Grava um documento no cache (escrita atômica)"""
+        entry = {
+            "key": key,
+            "source": document.get('file_path'),
+            "created_at": datetime.now().isoformat(),
+            "docling_version": self.docling_version,
+            "options": self.options,
+            "document": document
+        }
+        
+        entry_file = self.entry_path(key)
+        tmp_file = entry_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(',', ':'), default=json_default)
+            os.replace(tmp_file, entry_file)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar cache de {document.get('filename')}: {str(e)}")
+            tmp_file.unlink(missing_ok=True)
+    
+    def prune(self, keep_keys: Iterable[str]) -> int:
+        """Remove entradas que não pertencem ao conjunto informado"""
+        keep = set(keep_keys)
+        removed = 0
+        for entry_file in self.cache_dir.glob("*.json"):
+            if entry_file.stem not in keep:
+                entry_file.unlink(missing_ok=True)
+                removed += 1
+        
+        logger.info(f"♻️ Cache de extração podado: {removed} entradas removidas")
+        return removed
+    
+    def clear(self) -> int:
+        """Remove todas as entradas do cache"""
+        return self.prune([])
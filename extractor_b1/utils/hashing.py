@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+🔑 HASHING DE CONTEÚDO
+Funções auxiliares para identificar arquivos e conteúdos pelo hash
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+def file_sha256(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """Calcula o SHA-256 do conteúdo de um arquivo"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def json_sha256(value: Any) -> str:
+    """Calcula o SHA-256 de um valor serializável em JSON (chaves ordenadas; outros
+    Mappings, como os registros processados, contam como dicionários)"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _json_default(value: Any) -> Any:
+    return dict(value) if isinstance(value, Mapping) else str(value)
+
+def content_id(prefix: str, source: str, content: str, length: int = 16) -> str:
+    """ID estável de um item: prefixo + hash do documento de origem e do conteúdo"""
+    digest = hashlib.sha256(f"{source}\0{content}".encode('utf-8')).hexdigest()
+    return f"{prefix}_{digest[:length]}"
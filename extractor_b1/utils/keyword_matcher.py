@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+🔤 MATCHER DE PALAVRAS-CHAVE - VÁRIOS PADRÕES EM UMA PASSADA
+Encontra de uma vez todas as palavras-chave de várias tabelas (categorias de
+vocabulário, gramática, tipos de conteúdo...) presentes em um texto
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Set, Tuple, Optional, Iterable, Sequence
+from loguru import logger
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Tabelas: namespace -> rótulo -> palavras-chave (a ordem dos rótulos é a prioridade)
+KeywordTables = Dict[str, Dict[str, List[str]]]
+
+class KeywordMatcher:
+    """Matcher multi-padrão compartilhado pelos classificadores do processador
+    
+    Com o pyahocorasick instalado, um único autômato Aho-Corasick com as palavras-chave
+    de todas as tabelas encontra todos os acertos em uma passada linear pelo texto.
+    Sem ele, cada palavra-chave distinta é testada uma vez com ``in`` (busca em C; um
+    autômato ou regex em Python puro mediu mais lento para esses textos) e ``first``
+    para no primeiro rótulo encontrado. Nos dois casos a semântica é a de
+    ``keyword in text.lower()``: substring, sem fronteira de palavra. Os acertos de
+    ``scan`` servem a todos os namespaces sem varrer o texto de novo (``select``).
+    """
+    
+    def __init__(self, tables: KeywordTables):
+        self.tables = tables
+        
+        # Palavra-chave -> (namespace, rótulo) que ela aciona; palavras repetidas entre
+        # tabelas ('describe', 'tense'...) são testadas uma só vez
+        self.targets: Dict[str, Set[Tuple[str, str]]] = {}
+        for namespace, labels in tables.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self.targets.setdefault(keyword.lower(), set()).add((namespace, label))
+        
+        self.namespace_keywords: Dict[str, List[str]] = {
+            namespace: [keyword for keyword, targets in self.targets.items() if any(ns == namespace for ns, _ in targets)]
+            for namespace in tables
+        }
+        self.lowered: Dict[str, List[Tuple[str, List[str]]]] = {
+            namespace: [(label, [keyword.lower() for keyword in keywords]) for label, keywords in labels.items()]
+            for namespace, labels in tables.items()
+        }
+        
+        self._automaton = None
+        if ahocorasick is not None and self.targets:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.targets:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        
+        engine = "Aho-Corasick" if self._automaton is not None else "substring"
+        logger.debug(f"Matcher de palavras-chave ({engine}): {len(self.targets)} palavras em {len(tables)} tabelas")
+    
+    def find_keywords(self, text: str, namespace: Optional[str] = None) -> Set[str]:
+        """Palavras-chave presentes no texto (opcionalmente só as de um namespace)"""
+        text = text.lower()
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        keywords = self.namespace_keywords.get(namespace, []) if namespace else self.targets
+        return {keyword for keyword in keywords if keyword in text}
+    
+    def scan(self, text: str, namespace: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """Todos os pares (namespace, rótulo) acionados pelo texto"""
+        hits = set()
+        for keyword in self.find_keywords(text, namespace):
+            hits |= self.targets[keyword]
+        return hits
+    
+    def select(self, hits: Set[Tuple[str, str]], namespace: str) -> List[str]:
+        """Rótulos de um namespace entre os acertos, na ordem de prioridade da tabela"""
+        return [label for label in self.tables.get(namespace, {}) if (namespace, label) in hits]
+    
+    def labels(self, text: str, namespace: str) -> List[str]:
+        """Rótulos de um namespace presentes no texto, em ordem de prioridade"""
+        return self.select(self.scan(text, namespace), namespace)
+    
+    def first(self, text: str, namespace: str, default: Optional[str] = None) -> Optional[str]:
+        """Rótulo de maior prioridade de um namespace presente no texto"""
+        if self._automaton is not None:
+            labels = self.labels(text, namespace)
+            return labels[0] if labels else default
+        
+        # Sem autômato, testar em ordem de prioridade permite parar no primeiro acerto
+        text = text.lower()
+        for label, keywords in self.lowered.get(namespace, []):
+            if any(keyword in text for keyword in keywords):
+                return label
+        return default
+    
+    def first_in_spans(self, text: str, spans: Sequence[Tuple[int, int]], namespace: str,
+                       default: Optional[str] = None) -> List[Optional[str]]:
+        """``first`` de cada trecho text[start:end] (trechos em ordem, sem sobreposição) em uma passada
+        
+        Cada palavra-chave do namespace é buscada uma vez no texto inteiro (todas as
+        ocorrências, com ``str.find``; com o autômato, uma única varredura) e cada
+        ocorrência contida em um trecho conta para o rótulo dele. O custo deixa de ser
+        uma classificação por trecho, e o resultado é o mesmo de ``first`` em cada um.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Minúsculas que mudam o tamanho do texto deslocariam as posições dos trechos
+            return [self.first(text[start:end], namespace, default) for start, end in spans]
+        
+        starts = [start for start, _ in spans]
+        best: List[Optional[int]] = [None] * len(spans)
+        
+        def assign(position: int, length: int, rank: int):
+            index = bisect_right(starts, position) - 1
+            if index >= 0 and position + length <= spans[index][1] and (best[index] is None or rank < best[index]):
+                best[index] = rank
+        
+        if self._automaton is not None:
+            priority = {label: rank for rank, label in enumerate(self.tables.get(namespace, {}))}
+            for end, keyword in self._automaton.iter(lowered):
+                ranks = [priority[label] for ns, label in self.targets[keyword] if ns == namespace]
+                if ranks:
+                    assign(end - len(keyword) + 1, len(keyword), min(ranks))
+        else:
+            for rank, (_, keywords) in enumerate(self.lowered.get(namespace, [])):
+                for keyword in keywords:
+                    position = lowered.find(keyword)
+                    while position != -1:
+                        assign(position, len(keyword), rank)
+                        position = lowered.find(keyword, position + 1)
+        
+        labels = list(self.tables.get(namespace, {}))
+        return [labels[rank] if rank is not None else default for rank in best]
+    
+    def matches(self, text: str, namespace: str) -> bool:
+        """Verifica se o texto aciona algum rótulo do namespace"""
+        return self.first(text, namespace) is not None
+
+def merge_category_names(table: Dict[str, List[str]], names: Iterable[str], fallback: str = 'general') -> Dict[str, List[str]]:
+    """Acrescenta a uma tabela as categorias listadas na configuração que ela não tem
+    
+    Categorias novas são reconhecidas pelo próprio nome no singular ('animals' -> 'animal')
+    e ficam depois das existentes na prioridade. A categoria padrão não recebe palavras-chave.
+    """
+    merged = {label: list(keywords) for label, keywords in table.items()}
+    for name in names:
+        if name in merged or name == fallback:
+            continue
+        merged[name] = [name[:-1] if name.endswith('s') else name]
+    return merged
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+🗂️ MANIFESTO DE MATERIAIS
+Registra os arquivos vistos em cada execução (tamanho, mtime, hash e status da extração)
+e calcula o que mudou desde a última vez
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+from loguru import logger
+
+from utils.hashing import file_sha256
+
+MANIFEST_FILE = "manifest.json"
+
+class MaterialManifest:
+    """Manifesto persistente dos materiais de um nível"""
+    
+    def __init__(self, manifest_file: Path):
+        self.manifest_file = Path(manifest_file)
+        self.entries: Dict[str, Dict[str, Any]] = self.load()
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Carrega o manifesto salvo (vazio se não existir ou estiver corrompido)"""
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("files", {})
+        except Exception as e:
+            logger.warning(f"Manifesto inválido, será recriado: {str(e)}")
+            return {}
+    
+    def scan(self, files: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Estado atual dos arquivos; o hash só é recalculado se tamanho ou mtime mudaram"""
+        current = {}
+        for key, file_path in files.items():
+            stat = file_path.stat()
+            previous = self.entries.get(key)
+            if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+                sha256 = previous["sha256"]
+            else:
+                sha256 = file_sha256(file_path)
+            
+            current[key] = {
+                "path": str(file_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256
+            }
+        return current
+    
+    def diff(self, current: Dict[str, Dict[str, Any]], retry_failed: bool = True) -> Dict[str, List[str]]:
+        """Compara o estado atual com o manifesto: adicionados, alterados, removidos e inalterados
+        
+        Com retry_failed=True, arquivos cuja última extração falhou são considerados alterados.
+        """
+        diff = {"added": [], "changed": [], "removed": [], "unchanged": []}
+        for key, entry in current.items():
+            previous = self.entries.get(key)
+            if previous is None:
+                diff["added"].append(key)
+            elif previous.get("sha256") != entry["sha256"] or (retry_failed and previous.get("status") != "success"):
+                diff["changed"].append(key)
+            else:
+                diff["unchanged"].append(key)
+        
+        diff["removed"] = sorted(key for key in self.entries if key not in current)
+        return diff
+    
+    def update(self, current: Dict[str, Dict[str, Any]], statuses: Dict[str, str]):
+        """Substitui as entradas pelo estado atual, com o status da última extração"""
+        extracted_at = datetime.now().isoformat()
+        entries = {}
+        for key, entry in current.items():
+            previous = self.entries.get(key, {})
+            if key in statuses:
+                entry = dict(entry, status=statuses[key], extracted_at=extracted_at)
+            else:
+                entry = dict(entry, status=previous.get("status"), extracted_at=previous.get("extracted_at"))
+            entries[key] = entry
+        self.entries = entries
+    
+    def save(self):
+        """Salva o manifesto (escrita atômica)"""
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "updated_at": datetime.now().isoformat(),
+                    "files": self.entries
+                }, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.manifest_file)
+            logger.info(f"✅ Manifesto salvo em: {self.manifest_file}")
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar manifesto: {str(e)}")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+🧠 CACHE DE MEMOIZAÇÃO - LRU EM MEMÓRIA + SQLITE OPCIONAL
+Guarda resultados de funções puras por chave de conteúdo, com validade (TTL),
+limite de entradas em memória e uma camada opcional em disco entre execuções
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional
+from loguru import logger
+
+_MISSING = object()
+
+class MemoStore:
+    """Camada em disco: uma tabela SQLite (namespace, chave) -> valor serializado com pickle
+    
+    Entradas mais antigas que ``ttl`` segundos são ignoradas e removidas ao abrir o banco.
+    Um erro do SQLite (arquivo corrompido, disco cheio...) desativa a camada até o fim
+    da execução: as consultas viram faltas e as gravações são descartadas.
+    """
+    
+    def __init__(self, store_file: Path, ttl: Optional[float] = None):
+        self.store_file = Path(store_file)
+        self.ttl = ttl
+        # Conexão aberta no primeiro uso (processos worker nunca a abrem) e compartilhada
+        # entre as threads do nível (pipeline em streaming)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.disabled = False
+    
+    def _disable(self, error: Exception):
+        """Desativa a camada em disco após um erro ao acessar o banco (um único aviso)"""
+        if not self.disabled:
+            logger.warning(f"Cache em disco desativado nesta execução ({self.store_file}): {str(error)}")
+        self.disabled = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+    
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Conexão com o banco (criado na primeira vez; entradas expiradas são removidas),
+        ou None com a camada desativada"""
+        if self.disabled:
+            return None
+        if self._conn is None:
+            conn = None
+            try:
+                self.store_file.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.store_file), timeout=30, check_same_thread=False)
+                with conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS memo (
+                            namespace TEXT NOT NULL,
+                            key TEXT NOT NULL,
+                            created_at REAL NOT NULL,
+                            value BLOB NOT NULL,
+                            PRIMARY KEY (namespace, key)
+                        )
+                    """)
+                    if self.ttl is not None:
+                        conn.execute("DELETE FROM memo WHERE created_at < ?", (time.time() - self.ttl,))
+            except (sqlite3.Error, OSError) as e:
+                if conn is not None:
+                    conn.close()
+                self._disable(e)
+                return None
+            self._conn = conn
+        return self._conn
+    
+    def get(self, namespace: str, key: str) -> Any:
+        """Valor salvo, ou _MISSING se ausente, expirado ou ilegível"""
+        with self._lock:
+            conn = self.connection()
+            if conn is None:
+                return _MISSING
+            try:
+                row = conn.execute(
+                    "SELECT created_at, value FROM memo WHERE namespace = ? AND key = ?", (namespace, key)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return _MISSING
+        if row is None:
+            return _MISSING
+        created_at, value = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return _MISSING
+        try:
+            return pickle.loads(value)
+        except Exception as e:
+            logger.warning(f"Entrada de cache ilegível ({namespace}): {str(e)}")
+            return _MISSING
+    
+    def put(self, namespace: str, key: str, value: Any):
+        """Grava (ou substitui) um valor"""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar no cache ({namespace}): {str(e)}")
+            return
+        with self._lock:
+            conn = self.connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO memo (namespace, key, created_at, value) VALUES (?, ?, ?, ?)",
+                        (namespace, key, time.time(), payload)
+                    )
+            except sqlite3.Error as e:
+                self._disable(e)
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class MemoCache:
+    """Memoização com LRU em memória (max_size entradas) e camada opcional em disco
+    
+    Entradas mais antigas que ``ttl`` segundos são recalculadas (em disco vale o ttl do
+    MemoStore; as chaves do disco são textos). Com ``enabled=False``
+    tudo é recalculado e nada é guardado. ``hits``/``disk_hits``/``misses`` alimentam
+    as estatísticas de acerto (``stats``).
+    """
+    
+    def __init__(self, namespace: str, max_size: int = 1000, ttl: Optional[float] = None,
+                 store: Optional[MemoStore] = None, enabled: bool = True):
+        self.namespace = namespace
+        self.max_size = max(int(max_size), 0)
+        self.ttl = ttl
+        self.store = store
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def from_config(cls, config, namespace: str, store: Optional[MemoStore] = None,
+                    max_size: Optional[int] = None) -> "MemoCache":
+        """Cache com performance.enable_cache, cache_size e cache_ttl"""
+        return cls(namespace, config.get_cache_size() if max_size is None else max_size, config.get_cache_ttl(),
+                   store=store, enabled=config.is_memo_cache_enabled())
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Valor memoizado (memória, depois disco), ou default"""
+        if not self.enabled:
+            return default
+        
+        entry = self._entries.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if self.ttl is None or time.monotonic() - created_at <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        
+        if self.store is not None:
+            value = self.store.get(self.namespace, key)
+            if value is not _MISSING:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        
+        self.misses += 1
+        return default
+    
+    def put(self, key: Hashable, value: Any):
+        """Guarda um valor nas duas camadas"""
+        if not self.enabled:
+            return
+        self._remember(key, value)
+        if self.store is not None:
+            self.store.put(self.namespace, key, value)
+    
+    def _remember(self, key: Hashable, value: Any):
+        if not self.max_size:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Valor memoizado ou calculado agora (e guardado)"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def stats(self) -> Dict[str, Any]:
+        """Acertos em memória e em disco, faltas e taxa de acerto"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._entries)
+        }
+    
+    def log_stats(self):
+        """Registra a taxa de acerto (se houve consultas)"""
+        stats = self.stats()
+        if self.enabled and stats["hits"] + stats["disk_hits"] + stats["misses"]:
+            logger.info(f"♻️ Cache {self.namespace}: {stats['hit_rate']:.0%} de acertos "
+                        f"({stats['hits']} em memória, {stats['disk_hits']} em disco, {stats['misses']} faltas)")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+🧾 NDJSON EM STREAMING
+Escrita e leitura de um registro JSON compacto por linha
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterator, Tuple
+
+RAW_EXTRACTION_FILE = "raw_extraction.ndjson"
+
+def json_default(value: Any) -> Any:
+    """Serializa objetos com to_dict() (ex.: CompactContent); demais viram string"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return str(value)
+
+class NDJSONWriter:
+    """Escreve registros JSON compactos, um por linha, à medida que são produzidos"""
+    
+    def __init__(self, output_file: Path, append: bool = False):
+        self.output_file = Path(output_file)
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.mode = 'a' if append else 'w'
+        self.file = None
+        self.count = 0
+    
+    def __enter__(self):
+        self.file = open(self.output_file, self.mode, encoding='utf-8')
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def write(self, record: Dict[str, Any]):
+        """Escreve um registro e descarrega o buffer"""
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=json_default))
+        self.file.write("\n")
+        self.file.flush()
+        self.count += 1
+    
+    def write_document(self, key: str, document: Dict[str, Any]):
+        """Escreve um documento da extração bruta"""
+        self.write({"key": key, "document": document})
+    
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+def iter_ndjson(input_file: Path) -> Iterator[Dict[str, Any]]:
+    """Lê registros de um arquivo NDJSON, um por vez"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def iter_raw_extraction(input_file: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lê a extração bruta em streaming, produzindo pares (arquivo, documento)"""
+    for record in iter_ndjson(input_file):
+        yield record["key"], record["document"]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+🧬 SIMILARIDADE DE TEXTOS - DUPLICATAS EXATAS E QUASE DUPLICATAS
+Agrupa itens pelo texto normalizado (hash) e encontra pares com similaridade de
+Jaccard acima de um limiar sem comparar todos contra todos (filtro de prefixo para
+textos curtos, MinHash + LSH para parágrafos)
+"""
+
+import math
+import re
+import zlib
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Tuple
+
+# O NumPy só é importado pelo MinHash: o validador (duplicatas exatas e filtro de prefixo)
+# não o carrega na inicialização
+
+# Primo de Mersenne das permutações do MinHash: a * hash + b cabe em 64 bits
+MERSENNE_PRIME = (1 << 31) - 1
+
+NON_WORD = re.compile(r"[\W_]+")
+
+def normalize_text(text: str) -> str:
+    """Minúsculas, sem pontuação e com espaços simples"""
+    return NON_WORD.sub(' ', str(text).lower()).strip()
+
+def shingles(text: str, size: int = 2) -> FrozenSet[str]:
+    """Conjunto de características de um texto para a similaridade de Jaccard
+    
+    Textos com mais de ``size`` palavras viram sequências de ``size`` palavras;
+    textos curtos (uma palavra, um nome de regra) viram trigramas de caracteres.
+    """
+    normalized = normalize_text(text)
+    tokens = normalized.split()
+    if len(tokens) > size:
+        return frozenset(' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+    padded = f" {normalized} "
+    if len(padded) < 3:
+        return frozenset()
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    overlap = len(a & b)
+    return overlap / (len(a) + len(b) - overlap)
+
+def exact_duplicates(texts: Dict[Hashable, str]) -> List[List[Hashable]]:
+    """Grupos de IDs com o mesmo texto normalizado (textos vazios são ignorados)"""
+    groups: Dict[str, List[Hashable]] = defaultdict(list)
+    for item_id, text in texts.items():
+        key = normalize_text(text)
+        if key:
+            groups[key].append(item_id)
+    return [ids for ids in groups.values() if len(ids) > 1]
+
+def similar_pairs(sets: Dict[Hashable, FrozenSet[str]], threshold: float) -> List[Tuple[Hashable, Hashable, float]]:
+    """Pares com Jaccard >= threshold (algoritmo All-Pairs com filtro de prefixo)
+    
+    As características são ordenadas da mais rara para a mais comum; dois conjuntos
+    similares precisam compartilhar uma característica dos seus prefixos, então só
+    esses candidatos (e só os de tamanho compatível) são comparados de fato.
+    """
+    if threshold <= 0:
+        raise ValueError("O limiar de similaridade deve ser positivo")
+    frequency: Dict[str, int] = defaultdict(int)
+    for features in sets.values():
+        for feature in features:
+            frequency[feature] += 1
+    rank = {feature: position for position, feature in
+            enumerate(sorted(frequency, key=lambda feature: (frequency[feature], feature)))}
+    
+    items = sorted(((item_id, features) for item_id, features in sets.items() if features),
+                   key=lambda item: len(item[1]))
+    sizes = [len(features) for _, features in items]
+    index: List[List[int]] = [[] for _ in rank]
+    pairs = []
+    for position, (item_id, features) in enumerate(items):
+        size = sizes[position]
+        prefix = sorted(rank[feature] for feature in features)[:size - math.ceil(threshold * size - 1e-9) + 1]
+        min_size = threshold * size - 1e-9
+        
+        candidates = set()
+        for feature in prefix:
+            # Itens entram em ordem de tamanho: os grandes o bastante estão no fim da lista
+            postings = index[feature]
+            candidates.update(postings[bisect_left(postings, min_size, key=sizes.__getitem__):])
+            postings.append(position)
+        
+        for other in sorted(candidates):
+            other_id, other_features = items[other]
+            similarity = jaccard(features, other_features)
+            if similarity >= threshold:
+                pairs.append((other_id, item_id, similarity))
+    return pairs
+
+def group_pairs(pairs: Iterable[Tuple[Hashable, Hashable, float]]) -> List[List[Hashable]]:
+    """Agrupa pares ligados (componentes conexos, union-find) na ordem de aparição"""
+    parent: Dict[Hashable, Hashable] = {}
+    
+    def find(item_id: Hashable) -> Hashable:
+        parent.setdefault(item_id, item_id)
+        root = item_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item_id] != root:
+            parent[item_id], item_id = root, parent[item_id]
+        return root
+    
+    for a, b, _ in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+    
+    groups: Dict[Hashable, List[Hashable]] = defaultdict(list)
+    for item_id in parent:
+        groups[find(item_id)].append(item_id)
+    return list(groups.values())
+
+def lsh_bands(threshold: float, num_perm: int, false_negative_weight: float = 0.9) -> Tuple[int, int]:
+    """Bandas e linhas por banda do LSH cuja curva 1 - (1 - s^r)^b melhor separa o limiar
+    
+    Minimiza a soma ponderada das áreas de falsos positivos (s < threshold) e falsos
+    negativos (s >= threshold) sob a curva de probabilidade de colisão. Candidatos têm o
+    Jaccard conferido, então um falso positivo custa só uma comparação e pesa menos.
+    """
+    import numpy as np
+    
+    best, best_error = (1, num_perm), float('inf')
+    below = np.linspace(0.0, threshold, 64)
+    above = np.linspace(threshold, 1.0, 64)
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        false_positive = np.mean(1 - (1 - below ** rows) ** bands) * threshold
+        false_negative = np.mean((1 - above ** rows) ** bands) * (1 - threshold)
+        error = (1 - false_negative_weight) * false_positive + false_negative_weight * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+def minhash_signatures(feature_sets: List[FrozenSet[str]], num_perm: int = 128, seed: int = 1,
+                       chunk_size: int = 1 << 15) -> "np.ndarray":
+    """Assinatura MinHash (num_perm mínimos de permutações h -> (a * h + b) mod p) de cada conjunto
+    
+    Cada característica distinta é resumida a um CRC32 e permutada uma única vez. Os
+    conjuntos, ordenados por tamanho, viram blocos retangulares de códigos (completados
+    com uma característica de valor máximo) e cada bloco sai de um único min do NumPy.
+    Conjuntos vazios ficam com a assinatura máxima.
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+    b = rng.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+    
+    vocabulary: Dict[str, int] = {}
+    codes = [[vocabulary.setdefault(feature, len(vocabulary)) for feature in features] for features in feature_sets]
+    hashes = np.fromiter((zlib.crc32(feature.encode('utf-8')) for feature in vocabulary),
+                         dtype=np.uint64, count=len(vocabulary))
+    padding = len(vocabulary)
+    permuted = np.full((padding + 1, num_perm), MERSENNE_PRIME, dtype=np.uint32)
+    permuted[:padding] = (hashes[:, None] * a + b) % MERSENNE_PRIME
+    
+    signatures = np.full((len(feature_sets), num_perm), MERSENNE_PRIME, dtype=np.uint32)
+    order = sorted((row for row in range(len(codes)) if codes[row]), key=lambda row: len(codes[row]))
+    start = 0
+    while start < len(order):
+        end = start + 1
+        while end < len(order) and (end - start + 1) * len(codes[order[end]]) <= chunk_size:
+            end += 1
+        rows = order[start:end]
+        block = np.full((len(rows), len(codes[rows[-1]])), padding, dtype=np.int64)
+        for line, row in enumerate(rows):
+            block[line, :len(codes[row])] = codes[row]
+        signatures[rows] = permuted[block].min(axis=1)
+        start = end
+    return signatures
+
+def near_duplicate_clusters(sets: Dict[Hashable, FrozenSet[str]], threshold: float,
+                            num_perm: int = 128, seed: int = 1) -> List[List[Hashable]]:
+    """Grupos de quase duplicatas via MinHash + LSH, cada um ao redor do seu primeiro item
+    
+    Os itens são percorridos na ordem de entrada e os baldes do LSH guardam só os
+    primeiros itens (canônicos) de cada grupo. Um item entra no grupo do primeiro
+    canônico de seus baldes com Jaccard exato >= threshold; se nenhum, abre um grupo
+    novo. Canônicos são dissimilares entre si, então cada item confere poucos
+    candidatos e o custo é quase linear, mesmo com centenas de cópias do mesmo texto.
+    Pares que o LSH não aproximou podem escapar (falso negativo raro). Retorna só
+    grupos com cópias, na ordem de entrada.
+    """
+    import numpy as np
+    
+    if threshold <= 0:
+        raise ValueError("O limiar de similaridade deve ser positivo")
+    ids = [item_id for item_id, features in sets.items() if features]
+    if len(ids) < 2:
+        return []
+    feature_sets = [sets[item_id] for item_id in ids]
+    bands, rows = lsh_bands(threshold, num_perm)
+    
+    # Cada banda (rows mínimos) vira um inteiro; colisões só somam candidatos conferidos
+    signatures = minhash_signatures(feature_sets, num_perm, seed)[:, :bands * rows]
+    weights = np.random.default_rng(seed).integers(1, 1 << 63, rows, dtype=np.uint64) | np.uint64(1)
+    band_keys = (signatures.reshape(len(ids), bands, rows).astype(np.uint64) * weights).sum(axis=2).tolist()
+    
+    buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(bands)]
+    groups: Dict[int, List[int]] = {}
+    for position, keys in enumerate(band_keys):
+        features = feature_sets[position]
+        canonical = None
+        checked = set()
+        for band, key in enumerate(keys):
+            for candidate in buckets[band].get(key, ()):
+                if candidate not in checked:
+                    checked.add(candidate)
+                    if jaccard(features, feature_sets[candidate]) >= threshold:
+                        canonical = candidate
+                        break
+            if canonical is not None:
+                break
+        
+        if canonical is None:
+            groups[position] = [position]
+            for band, key in enumerate(keys):
+                buckets[band][key].append(position)
+        else:
+            groups[canonical].append(position)
+    
+    return [[ids[position] for position in group] for group in groups.values() if len(group) > 1]